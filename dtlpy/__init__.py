@@ -32,6 +32,8 @@ from .entities import (
     # annotations
     Box, Cube, Cube3d, Point, Note, Message, Segmentation, Ellipse, Classification, Subtitle, Polyline, Pose, Description,
     Polygon, Text,
+    # compact read-only entities
+    CompactItem, CompactAnnotation,
     # filters
     Filters, FiltersKnownFields, FiltersResource, FiltersOperations, FiltersMethod, FiltersOrderByDirection,
     FiltersKnownFields as KnownFields,
@@ -151,6 +153,8 @@ drivers = repositories.Drivers(client_api=client_api)
 settings = repositories.Settings(client_api=client_api)
 apps = repositories.Apps(client_api=client_api)
 dpks = repositories.Dpks(client_api=client_api)
+# asyncio repositories (await dl.aio.items.get(...))
+aio = repositories.aio.AsyncApiClient(client_api=client_api)
 
 try:
     check_sdk.check(version=__version__, client_api=client_api)
@@ -8,7 +8,9 @@ import mmap
 from filelock import FileLock
 import logging
 import base64
+import re
 
+from ..miscellaneous.json_codec import JsonCodec
 from .dl_cache import DiskCache
 from .redis_cache import RedisCache
 from .filesystem_cache import FileSystemCache
@@ -129,14 +131,26 @@ class CacheKey:
         return os.path.join(self.entity_type, self.entity_id, self.object_type)
 
 
+# entity GET (/items/<id>) and binary GET (/items/<id>/stream) paths
+_VALIDATORS_PATH = re.compile(r'^.*/([A-Za-z]+)/([0-9a-fA-F]{24})(/stream)?$')
+
+
 class CacheManger:
-    def __init__(self, cache_configs: list, bin_cache_size=1000):
+    def __init__(self, cache_configs: list, bin_cache_size=1000, revalidate=False):
         """
         Cache manger for config and mange the cache
 
         :param cache_configs: CacheConfig object
         :param bin_cache_size: size on MB for binary cache
-        """
+        :param bool revalidate: opt-in - revalidate cached entities and binaries that have an ETag/Last-Modified
+                                with a conditional request instead of trusting the ttl. Every cache hit becomes a
+                                (small) round trip: about twice the time of the cache only for repeated gets, with
+                                the same bytes received (tests/benchmarks/bench_revalidation). Worth it when
+                                stale entities or binaries within the ttl are not acceptable - a 304 still
+                                saves downloading the binary again.
+                                Set with client_api.sdk_cache.revalidate or build_cache(revalidate=True)
+        """
+        self.revalidate = revalidate
         self.cache_levels = dict()
         self._max_level = 1
         self.bin_cache_size = bin_cache_size
@@ -161,6 +175,7 @@ class CacheManger:
             "models": 'packages',
             "packages": 'projects',
             "services": 'packages',
+            "ontologies": 'recipes',
         }
 
     def _load_cache_handler(self, config: CacheConfig):
@@ -221,7 +236,7 @@ class CacheManger:
         :param value: value to set
         """
         if isinstance(value, dict):
-            value = json.dumps(value)
+            value = JsonCodec.dumps(value)
         self.cache_levels[1].set(key, value)
 
     def _delete_parent(self, key: CacheKey, level):
@@ -362,9 +377,10 @@ class CacheManger:
                        object_type=ObjectType.BINARY.value)
         hit, response = self.get(key=key)
         if hit:
-            source_path = os.path.normpath(response[0])
+            # same response as write_stream: the cached file path
+            source_path = os.path.normpath(response if isinstance(response, str) else response[0])
             self._update_config_file(filepath=source_path, update=True)
-            return hit, [source_path]
+            return hit, source_path
         else:
             return False, None
 
@@ -374,7 +390,8 @@ class CacheManger:
                      buffer=None,
                      file_name=None,
                      entity_id=None,
-                     dataset_id=None
+                     dataset_id=None,
+                     overwrite=False
                      ):
         """
         Cache binary set
@@ -385,6 +402,7 @@ class CacheManger:
         :param  file_name: the file name
         :param  entity_id: entity id
         :param  dataset_id: dataset id of the binary object
+        :param  overwrite: replace an existing cached file (the binary has changed)
         :return: the file path of the binary
         """
         if entity_id is None:
@@ -402,8 +420,10 @@ class CacheManger:
             'items',
             file_name
         )
+        # read_stream looks up the short key, the full key is for the parent invalidation
+        self.set(key=key.get_key(), value=filepath)
         self.set(key=key.get(), value=filepath)
-        if not os.path.isfile(filepath):
+        if not os.path.isfile(filepath) or overwrite:
             os.makedirs(os.path.dirname(filepath), exist_ok=True)
             if buffer is None:
                 try:
@@ -455,6 +475,51 @@ class CacheManger:
             self.set(key=redis_key, value=entity_json)
             self.set(key=key.get(), value=redis_key)
 
+    @staticmethod
+    def _validators_key(request_path, binary=False):
+        # only single entities (/<resource>/<id>) and their binaries (/<resource>/<id>/stream) are revalidated
+        match = _VALIDATORS_PATH.match(request_path.split('?')[0].rstrip('/'))
+        if match is None or (match.group(3) is not None) != binary:
+            return None
+        entity_type, entity_id = match.group(1), match.group(2)
+        object_type = ObjectType.BINARY.value if binary else ObjectType.OBJECT.value
+        return os.path.join('validators', entity_type, entity_id, object_type)
+
+    def read_validators(self, request_path, binary=False):
+        """
+        Conditional request headers (If-None-Match / If-Modified-Since) of a cached entity or binary
+
+        :param str request_path: the request
+        :param bool binary: validators of the binary (stream request)
+        :return: dict of headers, empty if the response had no ETag or Last-Modified
+        """
+        key = self._validators_key(request_path=request_path, binary=binary)
+        if key is None:
+            return dict()
+        validators = self.cache_levels[1].get(key=key)
+        if not isinstance(validators, dict):
+            return dict()
+        return validators
+
+    def write_validators(self, request_path, headers, binary=False):
+        """
+        Save the ETag and Last-Modified of a response for the next conditional request
+
+        :param str request_path: the request
+        :param headers: response headers
+        :param bool binary: validators of the binary (stream request)
+        """
+        key = self._validators_key(request_path=request_path, binary=binary)
+        if key is None:
+            return
+        validators = dict()
+        if headers.get('ETag', None) is not None:
+            validators['If-None-Match'] = headers['ETag']
+        if headers.get('Last-Modified', None) is not None:
+            validators['If-Modified-Since'] = headers['Last-Modified']
+        if validators:
+            self.set(key=key, value=validators)
+
     def invalidate(self, path):
         """
         Delete from the caches
@@ -1,8 +1,8 @@
-import json
 import sqlite3
 import re
 
 from diskcache import Cache
+from ..miscellaneous.json_codec import JsonCodec
 import os
 from .base_cache import BaseCache
 
@@ -87,7 +87,7 @@ class DiskCache(BaseCache):
         res = self.cache.get(key=key)
         if res is not None:
             try:
-                return json.loads(res)
+                return JsonCodec.loads(res)
             except:
                 return res
 
@@ -28,6 +28,7 @@ from .annotation import Annotation, FrameAnnotation, ViewAnnotationOptions, Anno
     ExportVersion
 from .annotation_collection import AnnotationCollection
 from .paged_entities import PagedEntities
+from .compact import CompactItem, CompactAnnotation
 from .filters import Filters, FiltersKnownFields, FiltersResource, FiltersOperations, FiltersMethod, \
     FiltersOrderByDirection
 from .recipe import Recipe
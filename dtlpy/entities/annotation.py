@@ -11,7 +11,7 @@ import os
 from PIL import Image
 from enum import Enum
 
-from .. import entities, PlatformException, repositories, ApiClient, exceptions
+from .. import entities, PlatformException, repositories, ApiClient, exceptions, miscellaneous
 
 logger = logging.getLogger(name='dtlpy')
 
@@ -95,8 +95,8 @@ class Annotation(entities.BaseEntity):
     source = attr.ib(repr=False)
     dataset_url = attr.ib(repr=False)
 
-    # api
-    _platform_dict = attr.ib(repr=False)
+    # api - platform json for the update diff (miscellaneous.JsonSnapshot)
+    _platform_snapshot = attr.ib(repr=False)
     # meta
     metadata = attr.ib(repr=False)
     fps = attr.ib(repr=False)
@@ -136,6 +136,15 @@ class Annotation(entities.BaseEntity):
     # Platform #
     ############
 
+    @property
+    def _platform_dict(self):
+        # the platform json, decoded from the snapshot on first use
+        return self._platform_snapshot.get()
+
+    @_platform_dict.setter
+    def _platform_dict(self, platform_dict):
+        self._platform_snapshot.set(platform_dict)
+
     @property
     def annotation_definition(self):
         return self._annotation_definition
@@ -234,7 +243,8 @@ class Annotation(entities.BaseEntity):
     @property
     def coordinates(self):
         color = None
-        if self.type in ['binary']:
+        # an untouched binary mask is sent back as encoded, without decoding it for the color
+        if self.type in ['binary'] and not self.annotation_definition.encoded:
             color = self.annotation_definition._color
             if color is None:
                 color = self.color
@@ -1070,7 +1080,7 @@ class Annotation(entities.BaseEntity):
             start_time=start_time,
 
             # temp
-            platform_dict=dict(),
+            platform_snapshot=miscellaneous.JsonSnapshot(),
             source='sdk'
         )
 
@@ -1413,7 +1423,7 @@ class Annotation(entities.BaseEntity):
         # init annotation
         annotation = cls(
             # temp
-            platform_dict=copy.deepcopy(_json),
+            platform_snapshot=miscellaneous.JsonSnapshot(_json),
             # platform
             id=annotation_id,
             url=_json.get('url', None),
@@ -1,5 +1,6 @@
 import numpy as np
 import base64
+import zlib
 import io
 from PIL import Image
 
@@ -14,13 +15,58 @@ class Segmentation(BaseAnnotationDefinition):
     Segmentation annotation object
     """
     type = "binary"
+    # zlib level of the encoded png (0-9), 1 is tuned for speed
+    png_compress_level = 1
 
     def __init__(self, geo, label, attributes=None, description=None, color=None):
         super().__init__(description=description, attributes=attributes)
+        # platform encoded mask (png data url) - decoded on first access, see from_json()
+        self._coordinates = None
+        # last encoding, see to_coordinates(): (color, mask fingerprint, coordinates)
+        self._encoding = None
+        self._geo = None
         self.geo = geo
         self.label = label
         self._color = color
 
+    @property
+    def encoded(self):
+        """
+        True while the mask is held as the platform encoded png (never decoded)
+        """
+        return self._coordinates is not None
+
+    def _decode(self):
+        coordinates = self._coordinates
+        if coordinates is not None:
+            self._geo, self._mask_color = self._decode_mask(coordinates)
+            self._coordinates = None
+            if self._mask_color is not None:
+                # the platform encoding is valid until the mask or the color change
+                self._encoding = (self._color_key(self._mask_color), self._fingerprint(self._geo), coordinates)
+
+    @property
+    def geo(self):
+        self._decode()
+        return self._geo
+
+    @geo.setter
+    def geo(self, geo):
+        self._coordinates = None
+        self._encoding = None
+        self._geo = geo
+
+    @property
+    def _color(self):
+        self._decode()
+        return self._mask_color
+
+    @_color.setter
+    def _color(self, color):
+        self._decode()
+        self._encoding = None
+        self._mask_color = color
+
     @property
     def x(self):
         return
@@ -105,27 +151,57 @@ class Segmentation(BaseAnnotationDefinition):
             image = self.add_text_to_image(image=image, annotation=self)
         return image
 
+    @staticmethod
+    def _color_key(color):
+        return tuple(int(c) for c in color[:3])
+
+    @staticmethod
+    def _fingerprint(geo):
+        # checksum of the mask buffer - catches in place changes to geo
+        geo = np.ascontiguousarray(geo)
+        return geo.shape, geo.dtype.str, zlib.crc32(memoryview(geo).cast('B'))
+
     def to_coordinates(self, color=None):
+        if color is None and self._coordinates is not None:
+            # untouched mask - return the platform encoding as is
+            return self._coordinates
         if color is None:
             if self._color:
                 color = self._color
             else:
                 color = (255, 255, 255)
-        max_val = np.max(self.geo)
-        if max_val > 1:
-            self.geo = self.geo / max_val
-        png_ann = np.stack((color[0] * self.geo,
-                            color[1] * self.geo,
-                            color[2] * self.geo,
-                            255 * self.geo),
-                           axis=2).astype(np.uint8)
-        pil_img = Image.fromarray(png_ann)
-        buff = io.BytesIO()
-        pil_img.save(buff, format="PNG")
-        new_image_string = base64.b64encode(buff.getvalue()).decode("utf-8")
-        coordinates = "data:image/png;base64,%s" % new_image_string
+        color = self._color_key(color)
+        fingerprint = self._fingerprint(self.geo)
+        if self._encoding is not None and self._encoding[:2] == (color, fingerprint):
+            return self._encoding[2]
+        png = self._encode_png(color=color)
+        coordinates = "data:image/png;base64,%s" % base64.b64encode(png).decode("utf-8")
+        # geo is normalized by _encode_png() for non binary masks
+        self._encoding = (color, self._fingerprint(self.geo), coordinates)
         return coordinates
 
+    def _encode_png(self, color):
+        geo = self.geo
+        max_val = np.max(geo)
+        buff = io.BytesIO()
+        if geo.dtype == bool or ((max_val >= 1 or max_val == 0) and np.all((geo == 0) | (geo == max_val))):
+            # binary mask - single channel with a transparent background and the color palette
+            mask = np.ascontiguousarray(geo > 0).view(np.uint8)
+            pil_img = Image.frombuffer('P', (mask.shape[1], mask.shape[0]), mask, 'raw', 'P', 0, 1)
+            pil_img.putpalette([0, 0, 0] + list(color))
+            pil_img.save(buff, format="PNG", transparency=0, compress_level=self.png_compress_level)
+        else:
+            if max_val > 1:
+                self.geo = geo = geo / max_val
+            png_ann = np.stack((color[0] * geo,
+                                color[1] * geo,
+                                color[2] * geo,
+                                255 * geo),
+                               axis=2).astype(np.uint8)
+            pil_img = Image.fromarray(png_ann)
+            pil_img.save(buff, format="PNG", compress_level=self.png_compress_level)
+        return buff.getvalue()
+
     def to_box(self):
         """
 
@@ -186,23 +262,46 @@ class Segmentation(BaseAnnotationDefinition):
         else:
             raise TypeError('unknown binary data type')
         decode = base64.b64decode(data)
-        return np.array(Image.open(io.BytesIO(decode)))
+        image = Image.open(io.BytesIO(decode))
+        if image.mode != 'RGBA':
+            # e.g. palette encoded masks
+            image = image.convert('RGBA')
+        return np.array(image)
+
+    @classmethod
+    def _decode_mask(cls, coordinates):
+        """
+        :return: tuple of the binary mask (float) and its color (first filled pixel)
+        """
+        mask = cls.from_coordinates(coordinates)
+        fill_coordinates = mask.nonzero()
+        color = None
+        if len(fill_coordinates) > 0 and len(fill_coordinates[0]) > 0 and len(fill_coordinates[1]) > 0:
+            color = mask[fill_coordinates[0][0]][fill_coordinates[1][0]]
+        return (mask[:, :, 3] > 127).astype(float), color
 
     @classmethod
     def from_json(cls, _json):
+        """
+        The mask is kept encoded and decoded once on first access of geo (or the bounds, to_box(), show())
+
+        :param dict _json: platform json
+        :return: Segmentation
+        """
         if "coordinates" in _json:
-            mask = cls.from_coordinates(_json["coordinates"])
+            coordinates = _json["coordinates"]
         elif "data" in _json:
-            mask = cls.from_coordinates(_json["data"])
+            coordinates = _json["data"]
         else:
             raise ValueError('can not find "coordinates" or "data" in annotation. id: {}'.format(_json["id"]))
-        fill_coordinates = mask.nonzero()
-        color = None
-        if len(fill_coordinates) > 0 and len(fill_coordinates[0]) > 0 and len(fill_coordinates[1]) > 0:
-            color = mask[fill_coordinates[0][0]][fill_coordinates[1][0]]
-        return cls(
-            geo=(mask[:, :, 3] > 127).astype(float),
+        if isinstance(coordinates, dict):
+            coordinates = coordinates["data"]
+        if not isinstance(coordinates, str):
+            raise TypeError('unknown binary data type')
+        segmentation = cls(
+            geo=None,
             label=_json["label"],
-            attributes=_json.get("attributes", None),
-            color=color
+            attributes=_json.get("attributes", None)
         )
+        segmentation._coordinates = coordinates
+        return segmentation
@@ -0,0 +1,148 @@
+import logging
+import attr
+import numpy as np
+
+from .. import repositories
+
+logger = logging.getLogger(name='dtlpy')
+
+
+def _points(coordinates):
+    # box/point/polyline/segment coordinates to a float32 (N, 2) array of x, y
+    if isinstance(coordinates, dict):
+        coordinates = [coordinates]
+    if isinstance(coordinates, list) and len(coordinates) > 0 and isinstance(coordinates[0], list):
+        coordinates = coordinates[0]
+    points = [(pt['x'], pt['y']) for pt in coordinates if isinstance(pt, dict)]
+    return np.asarray(points, dtype=np.float32).reshape(-1, 2)
+
+
+@attr.s(slots=True, frozen=True)
+class CompactAnnotation:
+    """
+    Read-only, memory compact annotation for bulk workloads (e.g. holding millions of annotations
+    for an evaluation). Slotted, the points are a float32 array and there are no repositories -
+    the full Annotation entity is fetched on demand with `fetch()`
+    """
+    GEO_TYPES = ['box', 'point', 'polyline', 'segment']
+
+    id = attr.ib()
+    item_id = attr.ib()
+    dataset_id = attr.ib(repr=False)
+    type = attr.ib()
+    label = attr.ib()
+    # float32 (N, 2) x, y for GEO_TYPES, None for the other types
+    geo = attr.ib(repr=False)
+    # platform coordinates of the other types (None for GEO_TYPES)
+    coordinates = attr.ib(repr=False)
+    attributes = attr.ib(repr=False)
+    object_id = attr.ib(repr=False)
+    frame = attr.ib(repr=False)
+    _client_api = attr.ib(repr=False, eq=False)
+
+    @classmethod
+    def from_json(cls, _json, client_api=None):
+        """
+        Build a compact annotation from the platform json
+
+        :param dict _json: platform json
+        :param dl.ApiClient client_api: ApiClient entity, for fetch()
+        :return: CompactAnnotation
+        """
+        system = _json.get('metadata', dict()).get('system', dict())
+        annotation_type = _json.get('type', None)
+        geo, coordinates = None, _json.get('coordinates', None)
+        if annotation_type in cls.GEO_TYPES and coordinates is not None:
+            geo, coordinates = _points(coordinates), None
+        return cls(id=_json.get('id', None),
+                   item_id=_json.get('itemId', None),
+                   dataset_id=_json.get('datasetId', None),
+                   type=annotation_type,
+                   label=_json.get('label', None),
+                   geo=geo,
+                   coordinates=coordinates,
+                   attributes=_json.get('attributes', None),
+                   object_id=system.get('objectId', None),
+                   frame=system.get('frame', None),
+                   client_api=client_api)
+
+    @property
+    def left(self):
+        return None if self.geo is None or len(self.geo) == 0 else float(self.geo[:, 0].min())
+
+    @property
+    def top(self):
+        return None if self.geo is None or len(self.geo) == 0 else float(self.geo[:, 1].min())
+
+    @property
+    def right(self):
+        return None if self.geo is None or len(self.geo) == 0 else float(self.geo[:, 0].max())
+
+    @property
+    def bottom(self):
+        return None if self.geo is None or len(self.geo) == 0 else float(self.geo[:, 1].max())
+
+    def fetch(self):
+        """
+        Get the full annotation entity from the platform
+
+        :return: Annotation object
+        """
+        if self._client_api is None:
+            raise ValueError('CompactAnnotation was created without a client_api')
+        return repositories.Annotations(client_api=self._client_api).get(annotation_id=self.id)
+
+
+@attr.s(slots=True, frozen=True)
+class CompactItem:
+    """
+    Read-only, memory compact item for bulk workloads. Slotted, no repositories -
+    the full Item entity is fetched on demand with `fetch()`
+    """
+    id = attr.ib()
+    name = attr.ib()
+    filename = attr.ib()
+    dir = attr.ib(repr=False)
+    dataset_id = attr.ib(repr=False)
+    annotated = attr.ib(repr=False)
+    mimetype = attr.ib(repr=False)
+    size = attr.ib(repr=False)
+    width = attr.ib(repr=False)
+    height = attr.ib(repr=False)
+    # the user metadata (not copied)
+    metadata = attr.ib(repr=False)
+    _client_api = attr.ib(repr=False, eq=False)
+
+    @classmethod
+    def from_json(cls, _json, client_api=None):
+        """
+        Build a compact item from the platform json
+
+        :param dict _json: platform json
+        :param dl.ApiClient client_api: ApiClient entity, for fetch()
+        :return: CompactItem
+        """
+        metadata = _json.get('metadata', dict())
+        system = metadata.get('system', dict())
+        return cls(id=_json.get('id', None),
+                   name=_json.get('name', None),
+                   filename=_json.get('filename', None),
+                   dir=_json.get('dir', None),
+                   dataset_id=_json.get('datasetId', None),
+                   annotated=_json.get('annotated', None),
+                   mimetype=system.get('mimetype', None),
+                   size=system.get('size', None),
+                   width=system.get('width', None),
+                   height=system.get('height', None),
+                   metadata=metadata.get('user', None),
+                   client_api=client_api)
+
+    def fetch(self):
+        """
+        Get the full item entity from the platform
+
+        :return: Item object
+        """
+        if self._client_api is None:
+            raise ValueError('CompactItem was created without a client_api')
+        return repositories.Items(client_api=self._client_api).get(item_id=self.id)
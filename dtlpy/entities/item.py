@@ -4,10 +4,9 @@ from enum import Enum
 import traceback
 import logging
 import attr
-import copy
 import os
 
-from .. import repositories, entities, services, exceptions
+from .. import repositories, entities, services, exceptions, miscellaneous
 from .annotation import ViewAnnotationOptions, ExportVersion
 
 logger = logging.getLogger(name='dtlpy')
@@ -54,7 +53,8 @@ class Item(entities.BaseEntity):
 
     # api
     _client_api = attr.ib(type=services.ApiClient, repr=False)
-    _platform_dict = attr.ib(repr=False)
+    # platform json for the update diff (miscellaneous.JsonSnapshot)
+    _platform_snapshot = attr.ib(repr=False)
 
     # entities
     _dataset = attr.ib(repr=False)
@@ -65,6 +65,15 @@ class Item(entities.BaseEntity):
     # repositories
     _repositories = attr.ib(repr=False)
 
+    @property
+    def _platform_dict(self):
+        # the platform json, decoded from the snapshot on first use
+        return self._platform_snapshot.get()
+
+    @_platform_dict.setter
+    def _platform_dict(self, platform_dict):
+        self._platform_snapshot.set(platform_dict)
+
     @property
     def createdAt(self):
         return self.created_at
@@ -121,7 +130,7 @@ class Item(entities.BaseEntity):
             project_id = project.id if project else None
         inst = cls(
             # sdk
-            platform_dict=copy.deepcopy(_json),
+            platform_snapshot=miscellaneous.JsonSnapshot(_json),
             client_api=client_api,
             dataset=dataset,
             project=project,
@@ -378,7 +387,7 @@ class Item(entities.BaseEntity):
                                                         attr.fields(Item)._model,
                                                         attr.fields(Item)._project,
                                                         attr.fields(Item)._client_api,
-                                                        attr.fields(Item)._platform_dict,
+                                                        attr.fields(Item)._platform_snapshot,
                                                         attr.fields(Item).annotations_count,
                                                         attr.fields(Item).dataset_url,
                                                         attr.fields(Item).annotations_link,
@@ -1,10 +1,18 @@
+import concurrent.futures
+import collections
+import threading
+import hashlib
 import logging
+import queue
+import json
 import math
 import copy
 import sys
 
 import attr
 from .. import services, miscellaneous
+from .filters import SingleFilter, FiltersOperations, FiltersOrderByDirection
+from .compact import CompactItem, CompactAnnotation
 import tqdm
 
 logger = logging.getLogger(name='dtlpy')
@@ -41,10 +49,24 @@ class PagedEntities:
     # items list
     items = attr.ib(default=miscellaneous.List(), repr=False)
 
+    # number of pages to fetch in the background while iterating (0 to disable)
+    read_ahead = attr.ib(default=2, repr=False)
+
     def process_result(self, result):
         """
         :param result: json object
         """
+        self._process_page_info(result=result)
+        return self._page_items(result=result)
+
+    def _page_items(self, result):
+        if 'items' in result:
+            items = self.items_repository._build_entities_from_response(response_items=result['items'])
+        else:
+            items = miscellaneous.List(list())
+        return items
+
+    def _process_page_info(self, result):
         if 'page_offset' in result:
             self.page_offset = result['page_offset']
         if 'page_size' in result:
@@ -55,11 +77,6 @@ class PagedEntities:
             self.items_count = result['totalItemsCount']
         if 'totalPagesCount' in result:
             self.total_pages_count = result['totalPagesCount']
-        if 'items' in result:
-            items = self.items_repository._build_entities_from_response(response_items=result['items'])
-        else:
-            items = miscellaneous.List(list())
-        return items
 
     def __getitem__(self, y):
         self.go_to_page(y)
@@ -75,16 +92,36 @@ class PagedEntities:
             # reset the count for page 0
             self.page_offset = 0
             self.get_page()
-        while True:
-            yield self.items
-            pbar.update()
+        # next pages are fetched in the background while the current one is consumed.
+        # at most read_ahead pages are held and they are applied in order
+        pool = self._client_api.thread_pools('item.page')
+        prefetched = collections.deque()
+        try:
+            while True:
+                next_offset = self.page_offset + len(prefetched) + 1
+                while len(prefetched) < self.read_ahead and next_offset < self.total_pages_count:
+                    prefetched.append(pool.submit(self._fetch_page,
+                                                  page_offset=next_offset,
+                                                  page_size=self.page_size))
+                    next_offset += 1
 
-            if self.has_next_page:
+                yield self.items
+                pbar.update()
+
+                if not self.has_next_page:
+                    break
                 self.page_offset += 1
-                self.get_page()
-            else:
-                pbar.close()
-                break
+                if len(prefetched) > 0:
+                    result, items = prefetched.popleft().result()
+                    self._process_page_info(result=result)
+                    self.items = items
+                else:
+                    self.get_page()
+        finally:
+            # iterator exhausted, failed or abandoned - drop the pages not started yet
+            for future in prefetched:
+                future.cancel()
+            pbar.close()
 
     def __reversed__(self):
         self.page_offset = self.total_pages_count - 1
@@ -95,6 +132,28 @@ class PagedEntities:
                 break
             self.page_offset -= 1
 
+    def _fetch_page(self, page_offset, page_size):
+        """
+        Request and build a page without changing the paging state (safe to run in a thread)
+
+        :return: tuple of the response json and the page entities
+        """
+        if self.filters is None:
+            raise ValueError('Cant return page. Filters is empty')
+        filters = copy.copy(self.filters)
+        filters.page = page_offset
+        filters.page_size = page_size
+        return self._list_page(filters=filters)
+
+    def _list_page(self, filters):
+        result = self._list_json(filters=filters)
+        return result, self._page_items(result=result)
+
+    def _list_json(self, filters):
+        if self._list_function is None:
+            return self.items_repository._list(filters=filters)
+        return self._list_function(filters=filters)
+
     def return_page(self, page_offset=None, page_size=None):
         """
         Return page
@@ -106,19 +165,9 @@ class PagedEntities:
             page_size = self.page_size
         if page_offset is None:
             page_offset = self.page_offset
-
-        if self.filters is not None:
-            filters = copy.copy(self.filters)
-            filters.page = page_offset
-            filters.page_size = page_size
-            if self._list_function is None:
-                result = self.items_repository._list(filters=filters)
-            else:
-                result = self._list_function(filters=filters)
-            items = self.process_result(result)
-            return items
-        else:
-            raise ValueError('Cant return page. Filters is empty')
+        result, items = self._fetch_page(page_offset=page_offset, page_size=page_size)
+        self._process_page_info(result=result)
+        return items
 
     def get_page(self, page_offset=None, page_size=None):
         """
@@ -159,29 +208,387 @@ class PagedEntities:
         self.page_offset = page
         self.get_page()
 
-    def all(self):
+    def _ordered_pages(self, fetch, page_size):
+        """
+        Fetch all the pages in parallel on the item.page pool with a bounded number in flight
+
+        :param fetch: callable(page_offset, page_size) of a page
+        :param int page_size: page size
+        :return: generator of the fetch results in page order
+        """
+        total_pages = math.ceil(self.items_count / page_size)
+        pool = self._client_api.thread_pools('item.page')
+        max_in_flight = self._client_api._thread_pools_names['item.page']
+        jobs = collections.deque()
         page_offset = 0
-        page_size = 100
+        try:
+            while True:
+                while len(jobs) < max_in_flight and page_offset <= total_pages:
+                    jobs.append(pool.submit(fetch, page_offset=page_offset, page_size=page_size))
+                    page_offset += 1
+                if len(jobs) == 0:
+                    break
+                # wait for the oldest page - raises the page error
+                yield jobs.popleft().result()
+        finally:
+            for job in jobs:
+                job.cancel()
+
+    def all(self):
+        """
+        Iterate over all the entities. Pages are fetched in parallel on the item.page pool with
+        a bounded number in flight and the entities are yielded in order
+        """
         pbar = tqdm.tqdm(total=self.items_count, disable=self._client_api.verbose.disable_progress_bar,
                          file=sys.stdout, desc='Iterate Entity')
-        total_pages = math.ceil(self.items_count / page_size)
-        jobs = list()
-        pool = self._client_api.thread_pools('item.page')
+        try:
+            for _, items in self._ordered_pages(fetch=self._fetch_page, page_size=100):
+                for item in items:
+                    pbar.update()
+                    yield item
+        finally:
+            pbar.close()
+
+    #######
+    # raw #
+    #######
+    @staticmethod
+    def _project(entity_json, fields):
+        values = list()
+        for field in fields:
+            value = entity_json
+            for key in field.split('.'):
+                if not isinstance(value, dict):
+                    value = None
+                    break
+                value = value.get(key, None)
+            values.append(value)
+        return values
+
+    def _fetch_raw_page(self, page_offset, page_size, fields=None, record=None):
+        filters = copy.copy(self.filters)
+        filters.page = page_offset
+        filters.page_size = page_size
+        entities_json = self._list_json(filters=filters).get('items', list())
+        if fields is None:
+            return entities_json
+        if record is None:
+            return [dict(zip(fields, self._project(entity_json=entity_json, fields=fields)))
+                    for entity_json in entities_json]
+        return [record._make(self._project(entity_json=entity_json, fields=fields))
+                for entity_json in entities_json]
+
+    def raw(self, fields=None, as_tuples=False):
+        """
+        Iterate over all the entities json without building the entities (no entity objects, validation
+        or repositories) - for fast enumeration of large collections. Pages are fetched like `all()`
+
+        :param list fields: fields to return, nested fields with dots (e.g. 'metadata.system.mimetype').
+                            None for the full json. Missing fields are None
+        :param bool as_tuples: return namedtuples (dots in the field names are replaced with '_')
+        :return: generator of dict or namedtuple
+
+        **Example**:
+
+        .. code-block:: python
+
+            for item in dataset.items.list().raw(fields=['id', 'filename'], as_tuples=True):
+                print(item.id, item.filename)
+        """
+        if self.filters is None:
+            raise ValueError('Cant return page. Filters is empty')
+        record = None
+        if as_tuples:
+            if fields is None:
+                raise ValueError('as_tuples requires the fields')
+            record = collections.namedtuple('Record', [field.replace('.', '_') for field in fields], rename=True)
+        page_size = self.filters.page_size if self.page_size is None else self.page_size
+
+        def fetch(page_offset, page_size):
+            return self._fetch_raw_page(page_offset=page_offset, page_size=page_size, fields=fields, record=record)
+
+        for records in self._ordered_pages(fetch=fetch, page_size=page_size):
+            yield from records
+
+    def compact(self):
+        """
+        Iterate over all the items or annotations as read-only CompactItem / CompactAnnotation
+        (slotted, no repositories) - for holding very large collections in memory.
+        Pages are fetched like `all()`
+
+        :return: generator of CompactItem or CompactAnnotation
+        """
+        if self.filters is None:
+            raise ValueError('Cant return page. Filters is empty')
+        if self.filters.resource == 'items':
+            compact_cls = CompactItem
+        elif self.filters.resource == 'annotations':
+            compact_cls = CompactAnnotation
+        else:
+            raise ValueError('Compact entities are available for items and annotations, got: {}'.format(
+                self.filters.resource))
+        page_size = self.filters.page_size if self.page_size is None else self.page_size
+
+        def fetch(page_offset, page_size):
+            return [compact_cls.from_json(_json=entity_json, client_api=self._client_api)
+                    for entity_json in self._fetch_raw_page(page_offset=page_offset, page_size=page_size)]
+
+        for compact_entities in self._ordered_pages(fetch=fetch, page_size=page_size):
+            yield from compact_entities
+
+    ############
+    # columnar #
+    ############
+    def _columnar_pages(self, fields=None):
+        if self.filters is None:
+            raise ValueError('Cant return page. Filters is empty')
+        export = miscellaneous.ColumnarExport.for_resource(resource=self.filters.resource, fields=fields)
+        page_size = self.filters.page_size if self.page_size is None else self.page_size
+
+        def fetch(page_offset, page_size):
+            records = self._fetch_raw_page(page_offset=page_offset, page_size=page_size, fields=export.fields)
+            return export.page_columns(records=records)
+
+        return export, self._ordered_pages(fetch=fetch, page_size=page_size)
+
+    def to_pandas(self, fields=None):
+        """
+        All the entities as a typed pandas DataFrame, built page by page from the json (no entity objects)
+
+        :param fields: list of fields (dotted for nested fields) or dict of field to type
+                       (see miscellaneous.ColumnarExport). None for the default items/annotations columns
+        :return: pandas.DataFrame
+        """
+        import pandas
+        export, pages = self._columnar_pages(fields=fields)
+        frames = [export.to_df(columns=columns) for columns in pages]
+        if len(frames) == 0:
+            return export.to_df(columns={field: list() for field in export.fields})
+        return pandas.concat(frames, ignore_index=True)
+
+    def to_arrow(self, fields=None):
+        """
+        All the entities as a typed pyarrow Table, built page by page from the json (no entity objects)
+
+        :param fields: list of fields (dotted for nested fields) or dict of field to type. None for defaults
+        :return: pyarrow.Table
+        """
+        export, pages = self._columnar_pages(fields=fields)
+        schema = export.arrow_schema()
+        batches = [export.to_record_batch(columns=columns, schema=schema) for columns in pages]
+        return export._import_pyarrow().Table.from_batches(batches, schema=schema)
+
+    def to_parquet(self, filepath, fields=None):
+        """
+        Stream all the entities to a parquet file, one row group per page - only the pages
+        in flight are held in memory
+
+        :param str filepath: output parquet file path
+        :param fields: list of fields (dotted for nested fields) or dict of field to type. None for defaults
+        :return: number of rows written
+        """
+        export, pages = self._columnar_pages(fields=fields)
+        schema = export.arrow_schema()
+        import pyarrow.parquet
+        num_rows = 0
+        with pyarrow.parquet.ParquetWriter(filepath, schema=schema) as writer:
+            for columns in pages:
+                batch = export.to_record_batch(columns=columns, schema=schema)
+                if batch.num_rows > 0:
+                    writer.write_batch(batch)
+                    num_rows += batch.num_rows
+        return num_rows
+
+    #############
+    # resumable #
+    #############
+    def _filters_fingerprint(self):
+        query = self.filters.prepare(query_only=True)
+        return hashlib.sha1(json.dumps(query, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def _keyset_filters(self, after_id):
+        filters = copy.copy(self.filters)
+        # copy the mutable parts - the keyset condition must not leak into the user filters
+        filters.and_filter_list = list(filters.and_filter_list)
+        filters.sort = {'id': FiltersOrderByDirection.ASCENDING}
+        filters.page = 0
+        filters.page_size = self.page_size
+        if after_id is not None:
+            self._add_id_conditions(filters=filters,
+                                    conditions=[(FiltersOperations.GREATER_THAN.value, after_id)])
+        return filters
+
+    @staticmethod
+    def _add_id_conditions(filters, conditions):
+        """
+        AND id conditions to a copy of the filters (with its own and_filter_list).
+        Filters.prepare() ignores the and_filter_list of a custom filter - the conditions are added to the custom filter
+
+        :param filters: Filters to modify
+        :param list conditions: list of (operator, id)
+        """
+        if filters.custom_filter is None:
+            for operator, value in conditions:
+                filters.and_filter_list.append(SingleFilter(field='id', values=value, operator=operator))
+            return
+        id_conditions = [{'id': {'${}'.format(operator): value}} for operator, value in conditions]
+        custom_filter = dict(filters.custom_filter)
+        if 'filter' in custom_filter or 'join' in custom_filter:
+            custom_filter['filter'] = {'$and': [custom_filter.get('filter', dict())] + id_conditions}
+        else:
+            custom_filter = {'$and': [custom_filter] + id_conditions}
+        filters.custom_filter = custom_filter
+
+    def resumable_pages(self, checkpoint=None):
+        """
+        Iterate the pages ordered by id using a keyset filter (id > last seen id) instead of page offsets.
+        Every page is returned with a json serializable checkpoint - save it and pass it back to continue
+        from the next page after a restart. Entities added during the iteration are not skipped or repeated
+
+        :param dict checkpoint: checkpoint returned with a page, None to start from the beginning
+        :return: generator of (page entities, checkpoint)
+
+        **Example**:
+
+        .. code-block:: python
+
+            pages = dataset.items.list()
+            for page, checkpoint in pages.resumable_pages(checkpoint=load_checkpoint()):
+                process(page)
+                save_checkpoint(checkpoint)
+        """
+        if self.filters is None:
+            raise ValueError('Cant return page. Filters is empty')
+        sort_fields = [field for field in self.filters.sort if field != 'id']
+        if len(sort_fields) > 0:
+            raise ValueError('Resumable pages are ordered by id. Remove the filters sort: {}'.format(sort_fields))
+        fingerprint = self._filters_fingerprint()
+        if checkpoint is None:
+            checkpoint = {'after_id': None, 'count': 0, 'filters': fingerprint}
+        elif checkpoint.get('filters', None) != fingerprint:
+            raise ValueError('Checkpoint was created for different filters')
         while True:
-            if page_offset <= total_pages:
-                jobs.append(pool.submit(self.return_page, **{'page_offset': page_offset,
-                                                             'page_size': page_size}))
-                page_offset += 1
-            for i_job, job in enumerate(jobs):
-                if job.done():
-                    for item in job.result():
-                        pbar.update()
-                        yield item
-                    jobs.remove(job)
-            if len(jobs) == 0:
-                pbar.close()
+            result, items = self._list_page(filters=self._keyset_filters(after_id=checkpoint['after_id']))
+            # the raw page - entities that failed to build still advance the keyset and count
+            page_size = len(result.get('items', list()))
+            if page_size == 0:
+                break
+            if result['items'][-1]['id'] == checkpoint['after_id']:
+                raise ValueError('Keyset filter was not applied, the page did not advance')
+            checkpoint = {'after_id': result['items'][-1]['id'],
+                          'count': checkpoint['count'] + page_size,
+                          'filters': fingerprint}
+            yield items, checkpoint
+            if not result.get('hasNextPage', False):
                 break
 
+    ###############
+    # partitioned #
+    ###############
+    def _id_bound(self, direction):
+        filters = self._keyset_filters(after_id=None)
+        filters.sort = {'id': direction}
+        filters.page_size = 1
+        entities_json = self._list_json(filters=filters).get('items', list())
+        if len(entities_json) == 0:
+            return None
+        return entities_json[0]['id']
+
+    def _id_range_filters(self, num_partitions):
+        # ids are ObjectIds (creation time in the high bytes) - split the id range evenly
+        first_id = self._id_bound(direction=FiltersOrderByDirection.ASCENDING)
+        last_id = self._id_bound(direction=FiltersOrderByDirection.DESCENDING)
+        if first_id is None:
+            return list()
+        first, last = int(first_id, 16), int(last_id, 16)
+        step = (last - first + 1) / num_partitions
+        boundaries = sorted(set(first + int(step * i_partition) for i_partition in range(1, num_partitions)))
+        partitions = list()
+        for i_boundary in range(len(boundaries) + 1):
+            filters = copy.copy(self.filters)
+            filters.and_filter_list = list(filters.and_filter_list)
+            conditions = list()
+            if i_boundary > 0:
+                # 'id > boundary - 1' is 'id >= boundary' - the ranges are disjoint and cover all the ids
+                conditions.append((FiltersOperations.GREATER_THAN.value,
+                                   '{:024x}'.format(boundaries[i_boundary - 1] - 1)))
+            if i_boundary < len(boundaries):
+                conditions.append((FiltersOperations.LESS_THAN.value, '{:024x}'.format(boundaries[i_boundary])))
+            self._add_id_conditions(filters=filters, conditions=conditions)
+            partitions.append(filters)
+        return partitions
+
+    def partitioned(self, partitions=4, max_pending_pages=None):
+        """
+        List the entities of disjoint partitions of the query concurrently - an unordered stream where
+        every entity is returned exactly once. Each partition is listed by id keyset (see `resumable_pages`)
+        so entities added during the listing are not repeated
+
+        :param partitions: number of id ranges (ids start with the creation time) to split the query into, or a list of
+                           disjoint Filters (e.g. one per directory) - their coverage is the caller's responsibility
+        :param int max_pending_pages: pages held until consumed, default twice the number of partitions
+        :return: generator of entities
+
+        **Example**:
+
+        .. code-block:: python
+
+            for item in dataset.items.list().partitioned(partitions=8):
+                process(item)
+        """
+        if self.filters is None:
+            raise ValueError('Cant return page. Filters is empty')
+        if isinstance(partitions, int):
+            partitions_filters = self._id_range_filters(num_partitions=partitions)
+        else:
+            partitions_filters = list(partitions)
+        if len(partitions_filters) == 0:
+            return
+        if max_pending_pages is None:
+            max_pending_pages = 2 * len(partitions_filters)
+
+        pages = queue.Queue(maxsize=max_pending_pages)
+        stop = threading.Event()
+        done = object()
+
+        def put(value):
+            # gives up when the consumer is gone
+            while not stop.is_set():
+                try:
+                    pages.put(value, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def list_partition(filters):
+            partition = attr.evolve(self, filters=filters, items=miscellaneous.List())
+            try:
+                for page, _ in partition.resumable_pages():
+                    if not put(page):
+                        return
+            except Exception as e:
+                put(e)
+            finally:
+                put(done)
+
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=len(partitions_filters))
+        try:
+            for filters in partitions_filters:
+                pool.submit(list_partition, filters)
+            num_running = len(partitions_filters)
+            while num_running > 0:
+                page = pages.get()
+                if page is done:
+                    num_running -= 1
+                elif isinstance(page, Exception):
+                    raise page
+                else:
+                    yield from page
+        finally:
+            stop.set()
+            pool.shutdown(wait=False)
+
     ########
     # misc #
     ########
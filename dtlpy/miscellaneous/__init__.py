@@ -18,3 +18,5 @@ from .git_utils import GitUtils
 from .zipping import Zipping
 from .list_print import List
 from .json_utils import JsonUtils
+from .json_codec import JsonCodec, JsonSnapshot
+from .columnar import ColumnarExport
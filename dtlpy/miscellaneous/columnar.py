@@ -0,0 +1,127 @@
+import logging
+
+from .json_codec import JsonCodec
+
+logger = logging.getLogger(name='dtlpy')
+
+
+class ColumnarExport:
+    """
+    Typed columns of entities json for pandas and pyarrow.
+    Nested fields are dotted paths (e.g. 'metadata.system.width'), missing values are nulls
+    """
+    STRING = 'string'
+    INT = 'int64'
+    FLOAT = 'float64'
+    BOOL = 'bool'
+    # nested values (e.g. annotation coordinates) encoded as a json string
+    JSON = 'json'
+
+    ITEM_COLUMNS = {'id': STRING,
+                    'name': STRING,
+                    'filename': STRING,
+                    'dir': STRING,
+                    'type': STRING,
+                    'datasetId': STRING,
+                    'createdAt': STRING,
+                    'annotated': BOOL,
+                    'metadata.system.size': INT,
+                    'metadata.system.mimetype': STRING,
+                    'metadata.system.width': INT,
+                    'metadata.system.height': INT}
+    ANNOTATION_COLUMNS = {'id': STRING,
+                          'itemId': STRING,
+                          'datasetId': STRING,
+                          'type': STRING,
+                          'label': STRING,
+                          'createdAt': STRING,
+                          'coordinates': JSON}
+    # known types of fields requested by name
+    FIELD_TYPES = {**ITEM_COLUMNS, **ANNOTATION_COLUMNS, 'metadata.system.frame': INT}
+
+    def __init__(self, fields):
+        """
+        :param fields: list of fields (typed by FIELD_TYPES, string otherwise) or dict of field to type
+        """
+        if isinstance(fields, dict):
+            self.columns = dict(fields)
+        else:
+            self.columns = {field: self.FIELD_TYPES.get(field, self.STRING) for field in fields}
+        self.fields = list(self.columns.keys())
+
+    @classmethod
+    def for_resource(cls, resource, fields=None):
+        """
+        :param str resource: filters resource
+        :param fields: fields to export, None for the default columns of items and annotations
+        """
+        if fields is not None:
+            return cls(fields=fields)
+        if resource == 'items':
+            return cls(fields=cls.ITEM_COLUMNS)
+        if resource == 'annotations':
+            return cls(fields=cls.ANNOTATION_COLUMNS)
+        raise ValueError('No default columns for {}, please provide the fields'.format(resource))
+
+    @staticmethod
+    def _convert(value, dtype):
+        if value is None:
+            return None
+        if dtype == ColumnarExport.STRING:
+            return value if isinstance(value, str) else JsonCodec.dumps(value)
+        if dtype == ColumnarExport.JSON:
+            return JsonCodec.dumps(value)
+        if dtype == ColumnarExport.BOOL:
+            return value if isinstance(value, bool) else None
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+        return int(value) if dtype == ColumnarExport.INT else float(value)
+
+    def page_columns(self, records):
+        """
+        :param list records: dicts of field to value
+        :return: dict of field to list of typed values
+        """
+        return {field: [self._convert(record[field], dtype) for record in records]
+                for field, dtype in self.columns.items()}
+
+    ##########
+    # pandas #
+    ##########
+    def to_df(self, columns):
+        import pandas
+        dtypes = {self.STRING: 'string',
+                  self.JSON: 'string',
+                  self.INT: 'Int64',
+                  self.FLOAT: 'float64',
+                  self.BOOL: 'boolean'}
+        return pandas.DataFrame({field: pandas.array(values, dtype=dtypes[self.columns[field]])
+                                 for field, values in columns.items()})
+
+    ###########
+    # pyarrow #
+    ###########
+    @staticmethod
+    def _import_pyarrow():
+        try:
+            import pyarrow
+        except ImportError:
+            logger.error('Import Error! Cant import pyarrow. '
+                         'Install pyarrow>=7.0 (pip install dtlpy[arrow]) for arrow and parquet export')
+            raise
+        return pyarrow
+
+    def arrow_schema(self):
+        pyarrow = self._import_pyarrow()
+        types = {self.STRING: pyarrow.string(),
+                 self.JSON: pyarrow.string(),
+                 self.INT: pyarrow.int64(),
+                 self.FLOAT: pyarrow.float64(),
+                 self.BOOL: pyarrow.bool_()}
+        return pyarrow.schema([(field, types[dtype]) for field, dtype in self.columns.items()])
+
+    def to_record_batch(self, columns, schema=None):
+        pyarrow = self._import_pyarrow()
+        if schema is None:
+            schema = self.arrow_schema()
+        return pyarrow.RecordBatch.from_pydict(columns, schema=schema)
@@ -0,0 +1,112 @@
+import logging
+import math
+import json
+import copy
+
+logger = logging.getLogger(name='dtlpy')
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _has_non_finite(obj):
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(value) for value in obj)
+    dtype = getattr(obj, 'dtype', None)
+    if dtype is not None and dtype.kind in 'fc':
+        # numpy arrays and scalars
+        import numpy as np
+        return not bool(np.isfinite(obj).all())
+    return False
+
+
+class JsonCodec:
+    """
+    JSON encode/decode for request and response bodies and the cache.
+    Uses orjson when installed, with fallback to the stdlib json (also for objects orjson can't serialize)
+    """
+    BACKEND = 'json' if orjson is None else 'orjson'
+    _ORJSON_OPTIONS = 0 if orjson is None else orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    @staticmethod
+    def dumps_bytes(obj, allow_nan=True) -> bytes:
+        """
+        Encode to utf-8 JSON bytes
+
+        :param obj: object to encode
+        :param bool allow_nan: False - raise ValueError on NaN and Infinity (instead of encoding them)
+        """
+        if orjson is not None:
+            try:
+                encoded = orjson.dumps(obj, option=JsonCodec._ORJSON_OPTIONS)
+            except TypeError:
+                # e.g. float subclasses or ints larger than 64 bit
+                encoded = None
+            if encoded is not None:
+                # orjson writes NaN and Infinity as null
+                if not allow_nan and b'null' in encoded and _has_non_finite(obj):
+                    raise ValueError('Out of range float values are not JSON compliant')
+                return encoded
+        return json.dumps(obj, separators=(',', ':'), allow_nan=allow_nan).encode('utf-8')
+
+    @staticmethod
+    def dumps(obj) -> str:
+        """
+        Encode to a JSON string
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(obj, option=JsonCodec._ORJSON_OPTIONS).decode('utf-8')
+            except TypeError:
+                pass
+        return json.dumps(obj)
+
+    @staticmethod
+    def loads(value):
+        """
+        Decode JSON str or bytes. Raises ValueError on invalid JSON
+        """
+        if orjson is not None:
+            return orjson.loads(value)
+        return json.loads(value)
+
+
+class JsonSnapshot:
+    """
+    Snapshot of a json (e.g. the entity as returned from the platform, for the update diff).
+    Kept encoded - copying on write to bytes is much cheaper than copy.deepcopy and most snapshots
+    are never read. Decoded once on first access
+    """
+    __slots__ = ['_encoded', '_decoded']
+
+    def __init__(self, _json=None):
+        self._encoded = None
+        self._decoded = None
+        if _json is not None:
+            try:
+                self._encoded = JsonCodec.dumps_bytes(_json)
+            except (TypeError, ValueError):
+                # not json serializable
+                self._decoded = copy.deepcopy(_json)
+
+    def get(self) -> dict:
+        """
+        The snapshot dict (decoded on the first call, the same dict after)
+        """
+        if self._decoded is None:
+            self._decoded = dict() if self._encoded is None else JsonCodec.loads(self._encoded)
+            self._encoded = None
+        return self._decoded
+
+    def set(self, _json):
+        """
+        Replace the snapshot with an existing dict (no copy)
+        """
+        self._encoded = None
+        self._decoded = _json
@@ -0,0 +1,20 @@
+#! /usr/bin/env python3
+# This file is part of DTLPY.
+#
+# DTLPY is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# DTLPY is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with DTLPY.  If not, see <http://www.gnu.org/licenses/>.
+from .paged_entities import AsyncPagedEntities
+from .datasets import AsyncDatasets
+from .items import AsyncItems
+from .annotations import AsyncAnnotations
+from .client import AsyncApiClient
@@ -0,0 +1,130 @@
+import logging
+import copy
+
+from ... import entities, exceptions, miscellaneous
+from .paged_entities import AsyncPagedEntities
+
+logger = logging.getLogger(name='dtlpy')
+
+
+class AsyncAnnotations:
+    """
+    Async Annotations Repository
+    """
+
+    def __init__(self, client, dataset: entities.Dataset = None, dataset_id=None, item: entities.Item = None):
+        """
+        :param dtlpy.repositories.aio.AsyncApiClient client: async client
+        :param dtlpy.entities.dataset.Dataset dataset: dataset entity
+        :param str dataset_id: dataset id
+        :param dtlpy.entities.item.Item item: item entity (to list only its annotations)
+        """
+        self._client = client
+        self._dataset = dataset
+        self._dataset_id = dataset_id
+        self._item = item
+        if self._dataset_id is None:
+            if self._dataset is not None:
+                self._dataset_id = self._dataset.id
+            elif self._item is not None:
+                self._dataset_id = self._item.dataset_id
+
+    @property
+    def _client_api(self):
+        return self._client.client_api
+
+    def _for_dataset(self, dataset=None, dataset_id=None):
+        if dataset is not None:
+            dataset_id = dataset.id
+        if dataset_id is None or dataset_id == self._dataset_id:
+            return self
+        return AsyncAnnotations(client=self._client, dataset=dataset, dataset_id=dataset_id)
+
+    def _build_entities_from_response(self, response_items) -> miscellaneous.List[entities.Annotation]:
+        results = [entities.Annotation._protected_from_json(client_api=self._client_api,
+                                                            _json=_json,
+                                                            item=self._item,
+                                                            dataset=self._dataset)
+                   for _json in response_items]
+        _ = [logger.warning(r[1]) for r in results if r[0] is False]
+        return miscellaneous.List([r[1] for r in results if r[0] is True])
+
+    async def _list(self, filters: entities.Filters):
+        """
+        :param dtlpy.entities.filters.Filters filters: Filters entity
+        :return: json response
+        """
+        return await self._client.gen_request(req_type='POST',
+                                              path='/datasets/{}/query'.format(self._dataset_id),
+                                              json_req=filters.prepare())
+
+    async def get(self, annotation_id: str, item: entities.Item = None) -> entities.Annotation:
+        """
+        Get a single annotation
+
+        :param str annotation_id: annotation id
+        :param dtlpy.entities.item.Item item: the annotation's item (optional)
+        :return: Annotation object
+        :rtype: dtlpy.entities.annotation.Annotation
+
+        **Example**:
+
+        .. code-block:: python
+
+            annotation = await dl.aio.annotations.get(annotation_id='annotation_id')
+        """
+        _json = await self._client.gen_request(req_type='get',
+                                               path='/annotations/{}'.format(annotation_id))
+        return entities.Annotation.from_json(_json=_json,
+                                             dataset=self._dataset,
+                                             client_api=self._client_api,
+                                             item=item)
+
+    def list(self,
+             filters: entities.Filters = None,
+             page_offset: int = None,
+             page_size: int = None,
+             item: entities.Item = None,
+             dataset: entities.Dataset = None,
+             dataset_id: str = None) -> AsyncPagedEntities:
+        """
+        List annotations of a dataset or an item. Iterate with `async for annotation in ...`
+
+        :param dtlpy.entities.filters.Filters filters: Filters entity (resource FiltersResource.ANNOTATION)
+        :param int page_offset: start page
+        :param int page_size: page size
+        :param dtlpy.entities.item.Item item: list only the annotations of this item
+        :param dtlpy.entities.dataset.Dataset dataset: dataset entity. default - the item's or the repository dataset
+        :param str dataset_id: dataset id. default - the item's or the repository dataset
+        :return: async pages object
+        :rtype: dtlpy.repositories.aio.AsyncPagedEntities
+
+        **Example**:
+
+        .. code-block:: python
+
+            async for annotation in dl.aio.annotations.list(item=item):
+                print(annotation.label)
+        """
+        if filters is None:
+            filters = entities.Filters(resource=entities.FiltersResource.ANNOTATION)
+        elif not isinstance(filters, entities.Filters):
+            raise exceptions.PlatformException('400', 'Unknown filters type')
+        if filters.resource != entities.FiltersResource.ANNOTATION:
+            raise exceptions.PlatformException(error='400',
+                                               message='Filters resource must to be FiltersResource.ANNOTATION')
+        if item is not None:
+            if not filters.has_field('itemId'):
+                filters = copy.deepcopy(filters)
+                filters.add(field='itemId', values=item.id, method=entities.FiltersMethod.AND)
+            repository = AsyncAnnotations(client=self._client, dataset=dataset, dataset_id=dataset_id, item=item)
+        else:
+            repository = self._for_dataset(dataset=dataset, dataset_id=dataset_id)
+        if repository._dataset_id is None:
+            raise exceptions.PlatformException('400', 'Must provide an item, dataset or dataset_id to list annotations')
+        if page_offset is None:
+            page_offset = filters.page
+        return AsyncPagedEntities(repository=repository,
+                                  filters=filters,
+                                  page_offset=page_offset,
+                                  page_size=page_size)
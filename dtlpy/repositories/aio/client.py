@@ -0,0 +1,73 @@
+import logging
+
+from ... import services, exceptions
+from .datasets import AsyncDatasets
+from .items import AsyncItems
+from .annotations import AsyncAnnotations
+
+logger = logging.getLogger(name='dtlpy')
+
+
+class AsyncApiClient:
+    """
+    Awaitable repositories for asyncio applications.
+
+    Requests run on the caller's event loop over one shared aiohttp session per loop, so many concurrent
+    lookups run on a single thread with no thread pool limits. Entities are built with the same `from_json`
+    constructors as the blocking repositories (and their own repositories are the blocking ones).
+
+    **Example**:
+
+    .. code-block:: python
+
+        item = await dl.aio.items.get(item_id='item_id')
+        async for item in dl.aio.items.list(dataset_id='dataset_id'):
+            print(item.name)
+        await dl.aio.close()
+    """
+
+    def __init__(self, client_api: services.ApiClient, limit_per_host=100):
+        """
+        :param client_api: ApiClient entity
+        :param int limit_per_host: max open connections to the gate per event loop
+        """
+        self._client_api = client_api
+        self.sessions = services.LoopSessions(limit_per_host=limit_per_host)
+        self.datasets = AsyncDatasets(client=self)
+        self.items = AsyncItems(client=self)
+        self.annotations = AsyncAnnotations(client=self)
+
+    @property
+    def client_api(self) -> services.ApiClient:
+        return self._client_api
+
+    async def gen_request(self, req_type, path, json_req=None, log_error=True):
+        """
+        Send a request on the running loop's shared session
+
+        :param str req_type: request type
+        :param str path: request path
+        :param json_req: json body
+        :param bool log_error: log bad responses
+        :return: json response
+        """
+        success, response = await self._client_api.gen_async_request(req_type=req_type,
+                                                                     path=path,
+                                                                     json_req=json_req,
+                                                                     log_error=log_error,
+                                                                     session=self.sessions.get())
+        if not success:
+            raise exceptions.PlatformException(response)
+        return response.json()
+
+    async def close(self):
+        """
+        Close the session of the running event loop
+        """
+        await self.sessions.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
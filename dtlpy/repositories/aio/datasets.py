@@ -0,0 +1,78 @@
+import logging
+from urllib.parse import urlencode
+
+from ... import entities, exceptions, miscellaneous
+
+logger = logging.getLogger(name='dtlpy')
+
+
+class AsyncDatasets:
+    """
+    Async Datasets Repository
+    """
+
+    def __init__(self, client, project: entities.Project = None):
+        """
+        :param dtlpy.repositories.aio.AsyncApiClient client: async client
+        :param dtlpy.entities.project.Project project: project entity
+        """
+        self._client = client
+        self._project = project
+
+    @property
+    def _client_api(self):
+        return self._client.client_api
+
+    def _from_json(self, _json):
+        return entities.Dataset.from_json(client_api=self._client_api,
+                                          _json=_json,
+                                          project=self._project)
+
+    async def get(self, dataset_id: str = None, dataset_name: str = None) -> entities.Dataset:
+        """
+        Get dataset by id or name
+
+        :param str dataset_id: dataset id
+        :param str dataset_name: dataset name
+        :return: Dataset object
+        :rtype: dtlpy.entities.dataset.Dataset
+        """
+        if dataset_id is not None:
+            _json = await self._client.gen_request(req_type='get',
+                                                   path='/datasets/{}'.format(dataset_id))
+            return self._from_json(_json=_json)
+        if dataset_name is not None:
+            datasets = await self.list(name=dataset_name)
+            if len(datasets) == 0:
+                raise exceptions.PlatformException('404', 'Dataset not found. Name: {!r}'.format(dataset_name))
+            elif len(datasets) > 1:
+                raise exceptions.PlatformException('400', 'More than one dataset with same name.')
+            return datasets[0]
+        raise exceptions.PlatformException(error='400',
+                                           message='Must provide at least one of: dataset_id, dataset_name')
+
+    async def list(self, name=None, creator=None, project_id=None) -> miscellaneous.List[entities.Dataset]:
+        """
+        List datasets
+
+        :param str name: list by name
+        :param str creator: list by creator
+        :param str project_id: list by project. default - the repository project
+        :return: List of datasets
+        :rtype: list
+        """
+        if project_id is None and self._project is not None:
+            project_id = self._project.id
+        query_params = {'name': name,
+                        'creator': creator,
+                        'projects': project_id}
+        url = '/datasets?{}'.format(urlencode({key: val for key, val in query_params.items() if val is not None},
+                                              doseq=True))
+        datasets_json = await self._client.gen_request(req_type='get', path=url)
+        results = [entities.Dataset._protected_from_json(client_api=self._client_api,
+                                                         _json=_json,
+                                                         datasets=None,
+                                                         project=self._project)
+                   for _json in datasets_json]
+        _ = [logger.warning(r[1]) for r in results if r[0] is False]
+        return miscellaneous.List([r[1] for r in results if r[0] is True])
@@ -0,0 +1,155 @@
+import logging
+
+from ... import entities, exceptions, miscellaneous
+from .paged_entities import AsyncPagedEntities
+
+logger = logging.getLogger(name='dtlpy')
+
+
+class AsyncItems:
+    """
+    Async Items Repository
+    """
+
+    def __init__(self, client, dataset: entities.Dataset = None, dataset_id=None):
+        """
+        :param dtlpy.repositories.aio.AsyncApiClient client: async client
+        :param dtlpy.entities.dataset.Dataset dataset: dataset entity
+        :param str dataset_id: dataset id (the dataset entity is fetched on first use)
+        """
+        self._client = client
+        self._dataset = dataset
+        self._dataset_id = dataset_id
+        if self._dataset_id is None and self._dataset is not None:
+            self._dataset_id = self._dataset.id
+
+    @property
+    def _client_api(self):
+        return self._client.client_api
+
+    async def _get_dataset(self):
+        if self._dataset is None:
+            if self._dataset_id is None:
+                raise exceptions.PlatformException(
+                    error='400',
+                    message='Cannot perform action WITHOUT Dataset entity in Items repository. Please set a dataset')
+            self._dataset = await self._client.datasets.get(dataset_id=self._dataset_id)
+        return self._dataset
+
+    def _for_dataset(self, dataset=None, dataset_id=None):
+        if dataset is not None:
+            dataset_id = dataset.id
+        if dataset_id is None or dataset_id == self._dataset_id:
+            return self
+        return AsyncItems(client=self._client, dataset=dataset, dataset_id=dataset_id)
+
+    def _build_entities_from_response(self, response_items) -> miscellaneous.List[entities.Item]:
+        results = [entities.Item._protected_from_json(client_api=self._client_api,
+                                                      _json=_json,
+                                                      dataset=self._dataset)
+                   for _json in response_items]
+        _ = [logger.warning(r[1]) for r in results if r[0] is False]
+        return miscellaneous.List([r[1] for r in results if r[0] is True])
+
+    async def _list(self, filters: entities.Filters):
+        """
+        :param dtlpy.entities.filters.Filters filters: Filters entity
+        :return: json response
+        """
+        dataset = await self._get_dataset()
+        return await self._client.gen_request(req_type='POST',
+                                              path='/datasets/{}/query'.format(dataset.id),
+                                              json_req=filters.prepare())
+
+    def list(self,
+             filters: entities.Filters = None,
+             page_offset: int = None,
+             page_size: int = None,
+             dataset: entities.Dataset = None,
+             dataset_id: str = None) -> AsyncPagedEntities:
+        """
+        List items in a dataset. Iterate with `async for item in ...`
+
+        :param dtlpy.entities.filters.Filters filters: Filters entity
+        :param int page_offset: start page
+        :param int page_size: page size
+        :param dtlpy.entities.dataset.Dataset dataset: dataset entity. default - the repository dataset
+        :param str dataset_id: dataset id. default - the repository dataset
+        :return: async pages object
+        :rtype: dtlpy.repositories.aio.AsyncPagedEntities
+
+        **Example**:
+
+        .. code-block:: python
+
+            async for item in dl.aio.items.list(dataset_id='dataset_id'):
+                print(item.filename)
+        """
+        if filters is None:
+            filters = entities.Filters()
+        elif not isinstance(filters, entities.Filters):
+            raise exceptions.PlatformException(error='400',
+                                               message='Unknown filters type: {!r}'.format(type(filters)))
+        repository = self._for_dataset(dataset=dataset, dataset_id=dataset_id)
+        if filters.resource == entities.FiltersResource.ANNOTATION:
+            repository = self._client.annotations._for_dataset(dataset=repository._dataset,
+                                                                dataset_id=repository._dataset_id)
+            if repository._dataset_id is None:
+                raise exceptions.PlatformException(
+                    error='400',
+                    message='Cannot perform action WITHOUT Dataset entity in Items repository. Please set a dataset')
+        elif filters.resource != entities.FiltersResource.ITEM:
+            raise exceptions.PlatformException(
+                error='400',
+                message='Filters resource must to be FiltersResource.ITEM. Got: {!r}'.format(filters.resource))
+        if page_offset is None:
+            page_offset = filters.page
+        return AsyncPagedEntities(repository=repository,
+                                  filters=filters,
+                                  page_offset=page_offset,
+                                  page_size=page_size)
+
+    async def get(self,
+                  item_id: str = None,
+                  filepath: str = None,
+                  dataset: entities.Dataset = None,
+                  dataset_id: str = None) -> entities.Item:
+        """
+        Get an item by id, or by remote filepath in a dataset
+
+        :param str item_id: item id
+        :param str filepath: remote path (requires a dataset)
+        :param dtlpy.entities.dataset.Dataset dataset: dataset entity. default - the repository dataset
+        :param str dataset_id: dataset id. default - the repository dataset
+        :return: Item object
+        :rtype: dtlpy.entities.item.Item
+
+        **Example**:
+
+        .. code-block:: python
+
+            item = await dl.aio.items.get(item_id='item_id')
+        """
+        repository = self._for_dataset(dataset=dataset, dataset_id=dataset_id)
+        if item_id is not None:
+            _json = await self._client.gen_request(req_type='get',
+                                                   path='/items/{}'.format(item_id))
+            return entities.Item.from_json(client_api=self._client_api,
+                                           _json=_json,
+                                           dataset=repository._dataset)
+        if filepath is not None:
+            filters = entities.Filters()
+            filters.pop(field='hidden')
+            filters.add(field='filename', values=filepath)
+            paged = repository.list(filters=filters)
+            items = await paged.get_page()
+            if len(items) == 0:
+                raise exceptions.PlatformException(error='404',
+                                                   message='Item not found. filepath= "{}"'.format(filepath))
+            elif len(items) > 1:
+                raise exceptions.PlatformException(
+                    error='404',
+                    message='More than one item found. Please "get" by id. filepath: "{}"'.format(filepath))
+            return items[0]
+        raise exceptions.PlatformException(error='400',
+                                           message='Must choose by at least one. "filename" or "item_id"')
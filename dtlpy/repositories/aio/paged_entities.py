@@ -0,0 +1,108 @@
+import logging
+import copy
+
+from ... import miscellaneous
+
+logger = logging.getLogger(name='dtlpy')
+
+
+class AsyncPagedEntities:
+    """
+    Async pages of a query.
+    `async for entity in paged` yields the entities of all pages, `async for page in paged.pages()` yields whole pages
+    """
+
+    def __init__(self, repository, filters, page_offset=0, page_size=None):
+        """
+        :param repository: async repository with `_list(filters)` and `_build_entities_from_response(response_items)`
+        :param dtlpy.entities.filters.Filters filters: query filters
+        :param int page_offset: first page
+        :param int page_size: page size
+        """
+        if page_size is None:
+            page_size = filters.page_size
+        self.repository = repository
+        self.filters = filters
+        self.page_offset = page_offset
+        self.page_size = page_size
+        self.has_next_page = False
+        self.total_pages_count = 0
+        self.items_count = 0
+        self.items = miscellaneous.List()
+
+    def __repr__(self):
+        return 'AsyncPagedEntities(page_offset={}, page_size={}, items_count={})'.format(self.page_offset,
+                                                                                        self.page_size,
+                                                                                        self.items_count)
+
+    def __len__(self):
+        return self.items_count
+
+    async def return_page(self, page_offset=None, page_size=None):
+        """
+        Request a page without changing the current page
+
+        :param int page_offset: page offset
+        :param int page_size: page size
+        :return: (response json, entities list)
+        """
+        if page_offset is None:
+            page_offset = self.page_offset
+        if page_size is None:
+            page_size = self.page_size
+        filters = copy.copy(self.filters)
+        filters.page = page_offset
+        filters.page_size = page_size
+        result = await self.repository._list(filters=filters)
+        items = self.repository._build_entities_from_response(response_items=result.get('items', list()))
+        return result, items
+
+    def process_result(self, result, items):
+        if 'page_offset' in result:
+            self.page_offset = result['page_offset']
+        if 'hasNextPage' in result:
+            self.has_next_page = result['hasNextPage']
+        if 'totalItemsCount' in result:
+            self.items_count = result['totalItemsCount']
+        if 'totalPagesCount' in result:
+            self.total_pages_count = result['totalPagesCount']
+        self.items = items
+
+    async def get_page(self, page_offset=None, page_size=None):
+        """
+        Get a page and set it as the current page
+
+        :param int page_offset: page offset
+        :param int page_size: page size
+        :return: list of entities
+        """
+        if page_offset is not None:
+            self.page_offset = page_offset
+        if page_size is not None:
+            self.page_size = page_size
+        result, items = await self.return_page()
+        self.process_result(result=result, items=items)
+        return self.items
+
+    async def pages(self):
+        """
+        Async generator of the pages, from the current page offset to the last one
+        """
+        while True:
+            result, items = await self.return_page()
+            self.process_result(result=result, items=items)
+            yield items
+            if not self.has_next_page:
+                break
+            self.page_offset += 1
+
+    async def __aiter__(self):
+        async for page in self.pages():
+            for item in page:
+                yield item
+
+    async def all(self):
+        """
+        :return: list of all entities
+        """
+        return miscellaneous.List([item async for item in self])
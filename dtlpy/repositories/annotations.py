@@ -101,19 +101,12 @@ class Annotations:
         return annotation
 
     def _build_entities_from_response(self, response_items):
-        pool = self._client_api.thread_pools(pool_name='entity.create')
-        jobs = [None for _ in range(len(response_items))]
-        # return triggers list
-        for i_json, _json in enumerate(response_items):
-            jobs[i_json] = pool.submit(entities.Annotation._protected_from_json,
-                                       **{'client_api': self._client_api,
-                                          '_json': _json,
-                                          'item': self._item,
-                                          'dataset': self._dataset,
-                                          'annotations': self})
-
-        # get all results
-        results = [j.result() for j in jobs]
+        results = self._client_api.build_entities(from_json=entities.Annotation._protected_from_json,
+                                                  jsons=response_items,
+                                                  client_api=self._client_api,
+                                                  item=self._item,
+                                                  dataset=self._dataset,
+                                                  annotations=self)
         # log errors
         _ = [logger.warning(r[1]) for r in results if r[0] is False]
         # return good jobs
@@ -120,16 +120,10 @@ class Items:
         return items
 
     def _build_entities_from_response(self, response_items) -> miscellaneous.List[entities.Item]:
-        pool = self._client_api.thread_pools(pool_name='entity.create')
-        jobs = [None for _ in range(len(response_items))]
-        # return triggers list
-        for i_item, item in enumerate(response_items):
-            jobs[i_item] = pool.submit(self.items_entity._protected_from_json,
-                                       **{'client_api': self._client_api,
-                                          '_json': item,
-                                          'dataset': self.dataset})
-        # get all results
-        results = [j.result() for j in jobs]
+        results = self._client_api.build_entities(from_json=self.items_entity._protected_from_json,
+                                                  jsons=response_items,
+                                                  client_api=self._client_api,
+                                                  dataset=self.dataset)
         # log errors
         _ = [logger.warning(r[1]) for r in results if r[0] is False]
         # return good jobs
@@ -14,7 +14,7 @@
 # You should have received a copy of the GNU General Public License
 # along with DTLPY.  If not, see <http://www.gnu.org/licenses/>.
 from .api_client import ApiClient, VerboseLoggingLevel
-from .async_utils import AsyncResponse, AsyncThreadEventLoop
+from .async_utils import AsyncResponse, AsyncThreadEventLoop, LoopSessions
 from .events import Events
 from .cookie import CookieIO
 from .create_logger import DataloopLogger, DtlpyFilter
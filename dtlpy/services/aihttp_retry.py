@@ -1,6 +1,7 @@
 # from https://pypi.org/project/aiohttp-retry/ with modification to python 3.5.4
 import asyncio
 import logging
+import time
 from aiohttp import ClientSession, ClientResponse
 from typing import Any, Callable, Optional, Set, Type
 
@@ -20,6 +21,8 @@ class _RequestContext:
                  retry_factor: float = _RETRY_FACTOR,  # How much we increase timeout each time
                  retry_for_statuses: Optional[Set[int]] = None,  # On which statuses we should retry
                  retry_exceptions: Optional[Set[Type]] = None,  # On which exceptions we should retry
+                 rate_limiter: Any = None,  # Shared RateLimiter - wait before each try, pause on Retry-After
+                 rate_limit_path: Optional[str] = None,  # Path for the per route rate limits
                  **kwargs: Any
                  ) -> None:
         self._request = request
@@ -38,10 +41,19 @@ class _RequestContext:
             retry_exceptions = set()
         self._retry_exceptions = retry_exceptions
 
+        self._rate_limiter = rate_limiter
+        self._rate_limit_path = rate_limit_path
+
         self._kwargs = kwargs
 
         self._current_attempt = 0
         self._response = None
+        # seconds of the last attempt only (without the backoff and rate limit waits)
+        self.attempt_latency = None
+
+    @property
+    def attempts(self) -> int:
+        return self._current_attempt
 
     def _exponential_timeout(self) -> float:
         timeout = self._retry_start_timeout * (self._retry_factor ** (self._current_attempt - 1))
@@ -53,10 +65,21 @@ class _RequestContext:
     async def _do_request(self) -> ClientResponse:
         try:
             self._current_attempt += 1
+            if self._rate_limiter is not None:
+                await self._rate_limiter.async_wait(path=self._rate_limit_path)
+            tic = time.monotonic()
             response = await self._request(url=self._url, **self._kwargs)
+            self.attempt_latency = time.monotonic() - tic
             code = response.status
+            if self._rate_limiter is not None and self._rate_limiter.on_response(code, response.headers):
+                if self._current_attempt < self._retry_attempts:
+                    # the limiter pauses until Retry-After
+                    response.release()
+                    return await self._do_request()
             if self._current_attempt < self._retry_attempts and self._check_code(code):
                 retry_wait = self._exponential_timeout()
+                # return the connection to the pool before waiting
+                response.release()
                 await asyncio.sleep(retry_wait)
                 return await self._do_request()
             self._response = response
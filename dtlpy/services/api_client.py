@@ -8,7 +8,6 @@ import requests_toolbelt
 import multiprocessing
 import threading
 import traceback
-import datetime
 import requests
 import aiohttp
 import logging
@@ -32,16 +31,25 @@ import inspect
 from requests.models import Response
 from dtlpy.caches.cache import CacheManger, CacheConfig
 from .calls_counter import CallsCounter
+from .metrics import MetricsRegistry
+from .concurrency import AdaptiveConcurrency, AsyncNullSemaphore
+from .rate_limiter import RateLimiter
+from .single_flight import SingleFlight
+from .compression import BodyCompression, ACCEPT_ENCODING
 from .cookie import CookieIO
 from .logins import login, logout, login_secret, login_m2m, gate_url_from_host
-from .async_utils import AsyncResponse, AsyncUploadStream, AsyncResponseError, AsyncThreadEventLoop
-from .events import Events
+from .async_utils import AsyncResponse, AsyncUploadStream, AsyncResponseError, AsyncThreadEventLoop, \
+    AsyncSessionContext
+from .events import Events, CallSite
 from .service_defaults import DEFAULT_ENVIRONMENTS, DEFAULT_ENVIRONMENT
 from .aihttp_retry import RetryClient
 from .. import miscellaneous, exceptions, __version__
+from ..miscellaneous.json_codec import JsonCodec
 
 logger = logging.getLogger(name='dtlpy')
 threadLock = threading.Lock()
+# tries for requests throttled by the gate (429 / Retry-After)
+RATE_LIMIT_NUM_TRIES = 5
 
 
 class VerboseLoggingLevel:
@@ -68,6 +76,32 @@ class PlatformError(Exception):
         super().__init__(msg)
 
 
+class JsonResponse(Response):
+    """
+    requests Response decoding the body with the fast JSON codec
+    """
+
+    @classmethod
+    def from_response(cls, response):
+        """
+        JsonResponse with the state of a received response (the same connection and unread body)
+
+        :param requests.Response response: the session response
+        """
+        json_response = cls()
+        json_response.__dict__.update(response.__dict__)
+        return json_response
+
+    def json(self, **kwargs):
+        if len(kwargs) == 0:
+            try:
+                return JsonCodec.loads(self.content)
+            except ValueError:
+                # e.g. not utf-8 - let requests guess the encoding
+                pass
+        return super(JsonResponse, self).json(**kwargs)
+
+
 class Verbose:
     __DEFAULT_LOGGING_LEVEL = 'warning'
     __DEFAULT_DISABLE_PROGRESS_BAR = False
@@ -192,6 +226,7 @@ class SDKCache:
     __DEFAULT_CACHE_PATH_BIN = os.path.join(os.path.expanduser('~'), '.dataloop')
     __DEFAULT_CONFIGS_CACHE = CacheConfig().to_string()
     __DEFAULT_BINARY_CACHE_SIZE = 1000
+    __DEFAULT_REVALIDATE = False
 
     def __init__(self, cookie):
         self.cookie = cookie
@@ -204,6 +239,7 @@ class SDKCache:
             self._configs = self.__DEFAULT_CONFIGS_CACHE
             self._bin_size = self.__DEFAULT_BINARY_CACHE_SIZE
             self._use_cache = self.__DEFAULT_USE_CACHE
+            self._revalidate = self.__DEFAULT_REVALIDATE
             self.to_cookie()
 
     def to_cookie(self):
@@ -211,7 +247,8 @@ class SDKCache:
                       'cache_path_bin': self._cache_path_bin,
                       'configs': self._configs,
                       'bin_size': self._bin_size,
-                      'use_cache': self._use_cache}
+                      'use_cache': self._use_cache,
+                      'revalidate': self._revalidate}
         self.cookie.put(key='cache_configs', value=dictionary)
 
     def from_cookie(self, dictionary):
@@ -220,6 +257,7 @@ class SDKCache:
         self._configs = dictionary.get('configs', self.__DEFAULT_CONFIGS_CACHE)
         self._bin_size = dictionary.get('bin_size', self.__DEFAULT_BINARY_CACHE_SIZE)
         self._use_cache = dictionary.get('use_cache', self.__DEFAULT_USE_CACHE)
+        self._revalidate = dictionary.get('revalidate', self.__DEFAULT_REVALIDATE)
 
     @property
     def cache_path(self):
@@ -276,6 +314,18 @@ class SDKCache:
         self._bin_size = val
         self.to_cookie()
 
+    @property
+    def revalidate(self):
+        return self._revalidate
+
+    @revalidate.setter
+    def revalidate(self, val: bool):
+        if not isinstance(val, bool):
+            raise exceptions.PlatformException(error=400,
+                                               message="input must be of type bool")
+        self._revalidate = val
+        self.to_cookie()
+
 
 class Attributes2:
     __DEFAULT_USE_ATTRIBUTE = False
@@ -355,17 +405,33 @@ class PlatformSettings:
 
 
 class Decorators:
+    @staticmethod
+    def call_site(depth=2):
+        """
+        Lightweight caller info for the events tracker (filename and function of a single frame).
+        Avoid inspect.stack() which walks all frames and reads the sources from disk
+
+        :param depth: frames to go up from the caller of this function
+        """
+        try:
+            frame = sys._getframe(depth)
+        except (AttributeError, ValueError):
+            # no _getframe (not CPython) or stack is not deep enough
+            frm = inspect.stack()[depth]
+            return CallSite(filename=frm.filename, function=frm.function)
+        return CallSite(filename=frame.f_code.co_filename, function=frame.f_code.co_name)
+
     @staticmethod
     def token_expired_decorator(method):
         @wraps(method)
         def decorated_method(inst, *args, **kwargs):
             # save event
-            frm = inspect.stack()[1]
+            frm = Decorators.call_site()
 
             # before the method call
             kwargs.update({'stack': frm})
             if inst.token_expired():
-                if inst.renew_token_method() is False:
+                if inst._renew_token_single_flight() is False:
                     raise exceptions.PlatformException('600', 'Token expired, Please login.'
                                                               '\nSDK login options: dl.login(), dl.login_token(), '
                                                               'dl.login_m2m()'
@@ -391,6 +457,9 @@ class ApiClient:
         # define local params - read only once from cookie file
         self.lock = threading.Lock()
         self.renew_token_method = self.renew_token
+        self._renew_token_lock = threading.RLock()
+        # (token, exp) - jwt expiration decoded once per token
+        self._token_exp_cache = (None, None)
         self.is_cli = False
         self.session = None
         self.default_headers = dict()
@@ -416,6 +485,10 @@ class ApiClient:
         self._thread_pools = dict()
         self._event_loop = None
         self._login_domain = None
+        # async connection pool - max open connections per host (None: unbounded, limited by the semaphores)
+        self.async_limit_per_host = None
+        # entities of a listed page: 'inline' - one pass in the calling thread, 'threads' - the entity.create pool
+        self.entity_build_mode = 'inline'
 
         # TODO- remove before release - only for debugging
         self._stopped_pools = list()
@@ -458,9 +531,23 @@ class ApiClient:
                                     'annotation.update': num_processes,
                                     'entity.create': num_processes,
                                     'dataset.download': num_processes}
-        # set logging level
-        logging.getLogger(name='dtlpy').handlers[0].setLevel(logging._nameToLevel[self.verbose.logging_level.upper()])
-        os.environ["USE_ATTRIBUTE_2"] = json.dumps(self.attributes_mode.use_attributes_2)
+        # adaptive limit of concurrent requests - shared by the thread pools and the async uploads
+        self.concurrency = AdaptiveConcurrency(initial_limit=num_processes,
+                                               max_limit=4 * num_processes)
+        # requests per second limits (unlimited by default) and global pause on Retry-After
+        self.rate_limiter = RateLimiter()
+        # opt-in sharing of identical concurrent GETs (and short memo): client_api.single_flight.enable(ttl=2)
+        self.single_flight = SingleFlight()
+        # opt-in compression of large json bodies: client_api.compression.enable(threshold=16 * 1024)
+        self.compression = BodyCompression()
+        # per route latency, status, retries and payload size
+        self.metrics = MetricsRegistry()
+        # first run writes the defaults to the cookie - coalesce to a single write
+        with self.cookie_io.batch():
+            # set logging level
+            logging.getLogger(name='dtlpy').handlers[0].setLevel(
+                logging._nameToLevel[self.verbose.logging_level.upper()])
+            os.environ["USE_ATTRIBUTE_2"] = json.dumps(self.attributes_mode.use_attributes_2)
 
         self.cache = None
         #######################
@@ -481,7 +568,16 @@ class ApiClient:
         self.lock.release()
         return self._event_loop
 
-    def build_cache(self, cache_config=None):
+    def build_cache(self, cache_config=None, revalidate=None):
+        """
+        Build the sdk cache
+
+        :param cache_config: CacheConfig or its base64 string. None - the CACHE_CONFIG env or the sdk_cache settings
+        :param bool revalidate: revalidate cached entities and binaries with conditional requests (see CacheManger).
+                                None - the sdk_cache.revalidate setting
+        """
+        if revalidate is not None:
+            self.sdk_cache.revalidate = revalidate
         if cache_config is None:
             cache_config_json = os.environ.get('CACHE_CONFIG', None)
             if cache_config_json is None:
@@ -510,7 +606,9 @@ class ApiClient:
             else:
                 raise Exception("config should be of type str or CacheConfig")
             try:
-                self.cache = CacheManger(cache_configs=[cache_config], bin_cache_size=self.sdk_cache.bin_size)
+                self.cache = CacheManger(cache_configs=[cache_config],
+                                         bin_cache_size=self.sdk_cache.bin_size,
+                                         revalidate=self.sdk_cache.revalidate)
                 self.cache.ping()
                 self.sdk_cache.use_cache = True
             except Exception as e:
@@ -520,7 +618,9 @@ class ApiClient:
     def __del__(self):
         for name, pool in self._thread_pools.items():
             pool.shutdown()
-        self.event_loop.stop()
+        if self._event_loop is not None:
+            # closes the shared aiohttp session and stops the loop
+            self._event_loop.stop()
 
     def _build_request_headers(self, headers=None):
         if headers is None:
@@ -531,7 +631,8 @@ class ApiClient:
                 message="Input 'headers' must be a dictionary, got: {}".format(type(headers)))
         headers.update(self.default_headers)
         headers.update(self.auth)
-        headers.update({'User-Agent': requests_toolbelt.user_agent('dtlpy', __version__.version)})
+        headers.update({'User-Agent': requests_toolbelt.user_agent('dtlpy', __version__.version),
+                        'Accept-Encoding': ACCEPT_ENCODING})
         return headers
 
     @property
@@ -546,15 +647,27 @@ class ApiClient:
         self._num_processes = num_processes
         for pool_name in self._thread_pools_names:
             self._thread_pools_names[pool_name] = num_processes
+        self.concurrency.reset(initial_limit=num_processes,
+                               max_limit=4 * num_processes)
 
         for pool in self._thread_pools:
             self._thread_pools[pool].shutdown()
         self._thread_pools = dict()
 
+    def _async_concurrency(self):
+        """
+        Async context bounding the concurrent requests on the client event loop
+        """
+        event_loop = self._event_loop
+        if event_loop is not None and event_loop.loop is asyncio.get_event_loop():
+            return event_loop.adaptive_semaphore(controller=self.concurrency)
+        return AsyncNullSemaphore()
+
     def create_event_loop_thread(self):
         loop = asyncio.new_event_loop()
         event_loop = AsyncThreadEventLoop(loop=loop,
-                                          n=self._num_processes)
+                                          n=self._num_processes,
+                                          limit_per_host=self.async_limit_per_host)
         event_loop.daemon = True
         event_loop.start()
         time.sleep(1)
@@ -572,6 +685,25 @@ class ApiClient:
         assert isinstance(pool, concurrent.futures.ThreadPoolExecutor)
         return pool
 
+    def build_entities(self, from_json, jsons, **kwargs):
+        """
+        Build the entities of a page. Construction is pure python (bound by the GIL) so building inline
+        in one pass is faster than the entity.create thread pool, see entity_build_mode
+
+        :param from_json: entity protected from_json, returns (success, entity or traceback)
+        :param list jsons: platform jsons
+        :param kwargs: from_json arguments (other than _json)
+        :return: list of (success, entity or traceback) in the jsons order
+        """
+        if self.entity_build_mode == 'inline':
+            return [from_json(_json=_json, **kwargs) for _json in jsons]
+        if self.entity_build_mode == 'threads':
+            pool = self.thread_pools(pool_name='entity.create')
+            jobs = [pool.submit(from_json, _json=_json, **kwargs) for _json in jsons]
+            return [job.result() for job in jobs]
+        raise ValueError('unknown entity_build_mode: {}. known modes: {}'.format(self.entity_build_mode,
+                                                                                 ['inline', 'threads']))
+
     @property
     def verify(self):
         environments = self.environments
@@ -606,6 +738,9 @@ class ApiClient:
 
     @environment.setter
     def environment(self, env):
+        if env != self._environment:
+            # token in memory belongs to the previous environment
+            self._token = None
         self._environment = env
         self.cookie_io.put('url', env)
 
@@ -692,6 +827,8 @@ class ApiClient:
             if self.environment in environments:
                 if 'token' in environments[self.environment]:
                     _token = environments[self.environment]['token']
+                    # keep in memory - no need to go through the environments on every request
+                    self._token = _token
         return _token
 
     @token.setter
@@ -791,12 +928,14 @@ class ApiClient:
         assert req_type in valid_request_type, '[ERROR] type: %s NOT in valid requests' % req_type
 
         # prepare request
+        headers = self._build_request_headers(headers=headers)
+        data, json_req, headers = self._encode_json_body(data=data, json_req=json_req, files=files, headers=headers)
         req = requests.Request(method=req_type,
                                url=self.environment + path,
                                json=json_req,
                                files=files,
                                data=data,
-                               headers=self._build_request_headers(headers=headers))
+                               headers=headers)
         # prepare to send
         prepared = req.prepare()
         # save curl for debug
@@ -809,15 +948,36 @@ class ApiClient:
         curl = command.format(method=method, headers=headers, data=data, uri=uri)
         return curl, prepared
 
+    def _encode_json_body(self, data, json_req, files, headers):
+        """
+        Encode the json body with the fast codec (instead of requests/aiohttp default json)
+        and compress it when compression is enabled
+
+        :return: data, json_req and headers to send (a copy when headers were added)
+        """
+        if json_req is not None and data is None and files is None:
+            try:
+                # NaN and Infinity are not JSON - same as requests json=
+                data = JsonCodec.dumps_bytes(json_req, allow_nan=False)
+            except ValueError as e:
+                raise requests.exceptions.InvalidJSONError(e)
+            json_req = None
+            # dont change the caller headers
+            headers = dict(headers)
+            if not any(key.lower() == 'content-type' for key in headers):
+                headers['Content-Type'] = 'application/json'
+            data = self.compression.compress(data=data, headers=headers)
+        return data, json_req, headers
+
     def _convert_json_to_response(self, response_json):
-        the_response = Response()
-        the_response._content = json.dumps(response_json).encode('utf-8')
+        the_response = JsonResponse()
+        the_response._content = JsonCodec.dumps_bytes(response_json)
         return the_response
 
     def _cache_on(self, request):
         if self.cache is not None and self.sdk_cache.use_cache:
             pure_request = request.split('?')[0]
-            valid_req = ['annotation', 'item', 'dataset', 'project', 'task', 'assignment']
+            valid_req = ['annotation', 'item', 'dataset', 'project', 'task', 'assignment', 'ontologies']
             for req_type in valid_req:
                 if req_type in pure_request:
                     return True
@@ -825,7 +985,7 @@ class ApiClient:
 
     @Decorators.token_expired_decorator
     def gen_request(self, req_type, path, data=None, json_req=None, files=None, stream=False, headers=None,
-                    log_error=True, dataset_id=None, **kwargs):
+                    log_error=True, dataset_id=None, coalesce=True, **kwargs):
         """
         Generic request from platform
         :param req_type: type of the request: GET, POST etc
@@ -837,10 +997,25 @@ class ApiClient:
         :param headers: headers to pass to request. auth will be added to it
         :param log_error: if true - print the error log of the request
         :param dataset_id: dataset id needed in stream True
+        :param coalesce: share the response with identical concurrent GETs (when single_flight is enabled)
         :param kwargs: kwargs
         :return:
         """
+        if self.single_flight.enabled:
+            if req_type.lower() == 'get':
+                if coalesce and not stream and data is None and json_req is None and files is None:
+                    key = (path, tuple(sorted(headers.items())) if headers else None, log_error)
+                    return self.single_flight.do(key=key,
+                                                 func=lambda: self.gen_request(req_type=req_type,
+                                                                               path=path,
+                                                                               headers=headers,
+                                                                               log_error=log_error,
+                                                                               coalesce=False))
+            else:
+                self.single_flight.invalidate(path=path)
         success, resp, cache_values = False, None, []
+        # cached response to serve if the conditional request answers 304 Not Modified
+        cached_resp, validators = None, None
         if self.cache is None and 'sdk' not in path:
             self.build_cache()
         if req_type.lower() not in ['patch', 'put', 'post', 'delete'] and self._cache_on(request=path):
@@ -854,26 +1029,42 @@ class ApiClient:
                     success, cache_values = self.cache.read(request_path=path)
                 if success:
                     resp = self._convert_json_to_response(cache_values)
+                    if self.cache.revalidate:
+                        validators = self.cache.read_validators(request_path=path, binary=stream)
+                    if validators:
+                        cached_resp = resp
+                        success, resp = False, None
             except Exception as e:
                 logger.warning("Cache error {}".format(e))
-                success, resp = False, None
+                success, resp, cached_resp, validators = False, None, None, None
 
         if not success and not resp:
+            request_headers = headers
+            if validators:
+                request_headers = dict() if headers is None else dict(headers)
+                request_headers.update(validators)
             success, resp = self._gen_request(req_type=req_type,
                                               path=path,
                                               data=data,
                                               json_req=json_req,
                                               files=files,
                                               stream=stream,
-                                              headers=headers,
+                                              headers=request_headers,
                                               log_error=log_error)
 
-            if success and self._cache_on(request=path):
+            if cached_resp is not None and resp.status_code == 304:
+                # not modified - serve the cached copy
+                resp.close()
+                success, resp = True, cached_resp
+            elif success and self._cache_on(request=path):
                 try:
+                    if self.cache.revalidate and req_type.lower() == 'get':
+                        self.cache.write_validators(request_path=path, headers=resp.headers, binary=stream)
                     if stream:
                         res = self.cache.write_stream(request_path=path,
                                                       response=resp,
-                                                      dataset_id=dataset_id)
+                                                      dataset_id=dataset_id,
+                                                      overwrite=cached_resp is not None)
                         if res != '':
                             resp = self._convert_json_to_response(res)
                     else:
@@ -931,7 +1122,7 @@ class ApiClient:
         self.last_request = prepared
         # send request
         try:
-            resp = self.send_session(prepared=prepared, stream=stream)
+            resp = self.send_session(prepared=prepared, stream=stream, path=path)
         except Exception:
             logger.error(self.print_request(req=prepared, to_return=True))
             raise
@@ -965,10 +1156,14 @@ class ApiClient:
                                 chunk_size=8192,
                                 pbar=None,
                                 is_dataloop=True,
+                                session=None,
                                 **kwargs):
         req_type = req_type.upper()
         valid_request_type = ['GET', 'DELETE', 'POST', 'PUT', 'PATCH']
         assert req_type in valid_request_type, '[ERROR] type: %s NOT in valid requests' % req_type
+        if is_dataloop and req_type != 'GET':
+            # memoized GETs of the mutated entity
+            self.single_flight.invalidate(path=path)
 
         # prepare request
         if is_dataloop:
@@ -984,6 +1179,10 @@ class ApiClient:
                 raise exceptions.PlatformException(error='400', message="Input 'headers' must be a dictionary")
             for k, v in headers.items():
                 headers_req[k] = v
+        data, json_req, headers_req = self._encode_json_body(data=data,
+                                                             json_req=json_req,
+                                                             files=files,
+                                                             headers=headers_req)
         req = requests.Request(method=req_type,
                                url=full_url,
                                json=json_req,
@@ -1003,23 +1202,35 @@ class ApiClient:
         self.last_curl = curl
         self.last_request = prepared
         # send request
+        tic = time.time()
+        retry_context = None
+        retry_exceptions = {aiohttp.client_exceptions.ClientOSError,
+                            aiohttp.client_exceptions.ServerDisconnectedError,
+                            aiohttp.client_exceptions.ClientPayloadError}
+        bytes_received = 0
         try:
             timeout = aiohttp.ClientTimeout(total=0)
-            async with RetryClient(headers=headers_req,
-                                   timeout=timeout) as session:
+            async with AsyncSessionContext(event_loop=self._event_loop,
+                                           session=session,
+                                           timeout=timeout) as client_session, self._async_concurrency():
                 try:
-                    async with session._request(request=session._client.request,
-                                                url=self.environment + path,
-                                                method=req_type,
-                                                json=json_req,
-                                                data=data,
-                                                headers=headers_req,
-                                                chunked=stream,
-                                                retry_attempts=5,
-                                                retry_exceptions={aiohttp.client_exceptions.ClientOSError,
-                                                                  aiohttp.client_exceptions.ServerDisconnectedError,
-                                                                  aiohttp.client_exceptions.ClientPayloadError},
-                                                raise_for_status=False) as request:
+                    tic = time.time()
+                    retry_context = RetryClient._request(request=client_session.request,
+                                                         url=self.environment + path,
+                                                         method=req_type,
+                                                         json=json_req,
+                                                         data=data,
+                                                         headers=headers_req,
+                                                         chunked=stream,
+                                                         retry_attempts=5,
+                                                         retry_exceptions=retry_exceptions,
+                                                         rate_limiter=self.rate_limiter,
+                                                         rate_limit_path=path,
+                                                         raise_for_status=False)
+                    async with retry_context as request:
+                        self.concurrency.observe(status=request.status,
+                                                 latency=retry_context.attempt_latency,
+                                                 route=path)
                         if stream:
                             pbar = self.__get_pbar(pbar=pbar,
                                                    total_length=request.headers.get("content-length"))
@@ -1047,8 +1258,15 @@ class ApiClient:
                             if pbar is not None:
                                 pbar.close()
                         text = await request.text()
+                        bytes_received = MetricsRegistry.content_length(headers=request.headers)
+                        if not stream:
+                            content_size = len(await request.read())
+                            bytes_received = MetricsRegistry.content_length(headers=request.headers,
+                                                                            default=content_size)
+                            self.compression.record_response(headers=request.headers,
+                                                             size=content_size)
                         try:
-                            _json = await request.json()
+                            _json = JsonCodec.loads(text)
                         except Exception:
                             _json = dict()
                         response = AsyncResponse(text=text,
@@ -1056,12 +1274,17 @@ class ApiClient:
                                                  async_resp=request)
                 except Exception as err:
                     response = AsyncResponseError(error=err, trace=traceback.format_exc())
-                finally:
-                    with threadLock:
-                        self.calls_counter.add()
         except Exception:
             logger.error(self.print_request(req=prepared, to_return=True))
             raise
+        self.calls_counter.add(path=path, status=response.status_code)
+        self.metrics.observe(method=req_type,
+                             path=path,
+                             status=response.status_code,
+                             latency=time.time() - tic,
+                             bytes_sent=MetricsRegistry.body_size(data),
+                             bytes_received=bytes_received,
+                             retries=max(0, retry_context.attempts - 1) if retry_context is not None else 0)
         self.last_response = response
         # handle output
         if not response.ok:
@@ -1093,6 +1316,8 @@ class ApiClient:
                                 item_description=None,
                                 **kwargs):
         headers = self._build_request_headers(headers=headers)
+        # memoized GETs of the dataset items
+        self.single_flight.invalidate(path=remote_url)
         pbar = None
         if callback is None:
             if item_size > 10e6:
@@ -1112,8 +1337,10 @@ class ApiClient:
                 def callback(bytes_read):
                     pass
 
+        tic = None
         timeout = aiohttp.ClientTimeout(total=0)
-        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+        async with AsyncSessionContext(event_loop=self._event_loop, timeout=timeout) as session, \
+                self._async_concurrency():
             try:
                 form = aiohttp.FormData({})
                 form.add_field('type', item_type)
@@ -1131,8 +1358,11 @@ class ApiClient:
                 ssl_context = None
                 if self.use_ssl_context:
                     ssl_context = ssl.create_default_context(cafile=certifi.where())
+                await self.rate_limiter.async_wait(path=remote_url)
+                tic = time.time()
                 async with session.post(url,
                                         data=form,
+                                        headers=headers,
                                         verify_ssl=self.verify,
                                         ssl=ssl_context) as resp:
                     self.last_request = resp.request_info
@@ -1142,9 +1372,12 @@ class ApiClient:
                     self.last_curl = command.format(method=resp.request_info.method,
                                                     headers=headers,
                                                     uri=resp.request_info.url)
+                    # latency depends on the file size - use only the status
+                    self.concurrency.observe(status=resp.status)
+                    self.rate_limiter.on_response(status=resp.status, headers=resp.headers)
                     text = await resp.text()
                     try:
-                        _json = await resp.json()
+                        _json = JsonCodec.loads(text)
                     except:
                         _json = dict()
                     response = AsyncResponse(text=text,
@@ -1155,8 +1388,14 @@ class ApiClient:
             finally:
                 if pbar is not None:
                     pbar.close()
-                with threadLock:
-                    self.calls_counter.add()
+        self.calls_counter.add(path=remote_url, status=response.status_code)
+        if tic is not None:
+            self.metrics.observe(method='POST',
+                                 path=remote_url,
+                                 status=response.status_code,
+                                 latency=time.time() - tic,
+                                 bytes_sent=item_size,
+                                 bytes_received=MetricsRegistry.content_length(headers=response.headers))
         if response.ok and self.cache is not None:
             try:
                 self.cache.write(list_entities_json=[response.json()])
@@ -1189,7 +1428,7 @@ class ApiClient:
                 logger.debug('Cant decide downloaded file length, bar will not be presented: {}'.format(err))
         return pbar
 
-    def send_session(self, prepared, stream=None):
+    def send_session(self, prepared, stream=None, path=None):
         if self.session is None:
             self.session = requests.Session()
             retry = Retry(
@@ -1201,18 +1440,52 @@ class ApiClient:
                 allowed_methods=False,
                 # force retry on those status responses
                 status_forcelist=(501, 502, 503, 504, 505, 506, 507, 508, 510, 511),
-                raise_on_status=False
+                raise_on_status=False,
+                # Retry-After is handled by the client rate limiter - pause all threads, not only this one
+                respect_retry_after_header=False
             )
             adapter = HTTPAdapter(max_retries=retry,
                                   pool_maxsize=np.sum(list(self._thread_pools_names.values())),
                                   pool_connections=np.sum(list(self._thread_pools_names.values())))
             self.session.mount('http://', adapter)
             self.session.mount('https://', adapter)
-        resp = self.session.send(request=prepared, stream=stream, verify=self.verify, timeout=None)
-
-        with threadLock:
-            self.calls_counter.add()
-
+        if path is None:
+            path = prepared.path_url
+        # resend only bodies that were not consumed
+        can_resend = prepared.body is None or isinstance(prepared.body, (bytes, str))
+        tic_request = time.time()
+        retries = 0
+        for i_try in range(RATE_LIMIT_NUM_TRIES):
+            self.rate_limiter.wait(path=path)
+            with self.concurrency.slot():
+                tic = time.time()
+                resp = self.session.send(request=prepared, stream=stream, verify=self.verify, timeout=None)
+                # decode with the fast json codec
+                resp = JsonResponse.from_response(resp)
+                self.concurrency.observe(status=resp.status_code, latency=time.time() - tic, route=path)
+            # resends by urllib3 (connection errors and 5xx) and by the rate limiter
+            urllib3_retries = getattr(resp.raw, 'retries', None)
+            if urllib3_retries is not None:
+                retries += len(urllib3_retries.history)
+            throttled = self.rate_limiter.on_response(status=resp.status_code, headers=resp.headers)
+            # 5xx are retried by urllib3
+            if not throttled or resp.status_code != 429 or not can_resend or i_try == RATE_LIMIT_NUM_TRIES - 1:
+                break
+            resp.close()
+            retries += 1
+        self.calls_counter.add(path=prepared.path_url, status=resp.status_code)
+        if stream:
+            bytes_received = MetricsRegistry.content_length(headers=resp.headers)
+        else:
+            bytes_received = MetricsRegistry.content_length(headers=resp.headers, default=len(resp.content))
+            self.compression.record_response(headers=resp.headers, size=len(resp.content))
+        self.metrics.observe(method=prepared.method,
+                             path=path,
+                             status=resp.status_code,
+                             latency=time.time() - tic_request,
+                             bytes_sent=MetricsRegistry.body_size(prepared.body),
+                             bytes_received=bytes_received,
+                             retries=retries)
         return resp
 
     @staticmethod
@@ -1243,25 +1516,32 @@ class ApiClient:
             else:
                 logger.warning('Proxy is used, make sure dataloop urls are in "no_proxy" environment variable')
 
+    def _token_expiration(self, token):
+        """
+        Expiration (epoch seconds) of the token. The JWT is decoded only once per token
+
+        :param token: jwt
+        """
+        cached_token, exp = self._token_exp_cache
+        if token != cached_token:
+            payload = jwt.decode(token, algorithms=['HS256'],
+                                 options={'verify_signature': False}, verify=False)
+            exp = float(payload['exp'])
+            self._token_exp_cache = (token, exp)
+        return exp
+
     def token_expired(self, t=60):
         """
         Check token validation
         :param t: time ahead interval in seconds
         """
+        token = None
         try:
-            if self.token is None or self.token == '':
+            token = self.token
+            if token is None or token == '':
                 expired = True
             else:
-                payload = jwt.decode(self.token, algorithms=['HS256'],
-                                     options={'verify_signature': False}, verify=False)
-                d = datetime.datetime.utcnow()
-                epoch = datetime.datetime(1970, 1, 1)
-                now = (d - epoch).total_seconds()
-                exp = payload['exp']
-                if now < (exp - t):
-                    expired = False
-                else:
-                    expired = True
+                expired = time.time() >= self._token_expiration(token) - t
         except jwt.exceptions.DecodeError:
             logger.exception('Invalid token.')
             expired = True
@@ -1269,10 +1549,31 @@ class ApiClient:
             logger.exception('Unknown error:')
             expired = True
         if expired:
-            if self.renew_token_method():
+            if self._renew_token_single_flight(token=token, t=t):
                 expired = False
         return expired
 
+    def _renew_token_single_flight(self, token=None, t=60):
+        """
+        Renew the token once for all threads that found it expired.
+        Threads waiting for the lock return the token renewed by the first one instead of renewing again
+
+        :param token: the expired token the caller saw
+        :param t: time ahead interval in seconds
+        """
+        if token is None:
+            token = self.token
+        with self._renew_token_lock:
+            current_token = self.token
+            if current_token is not None and current_token != '' and current_token != token:
+                try:
+                    if time.time() < self._token_expiration(current_token) - t:
+                        # renewed by another thread
+                        return True
+                except Exception:
+                    pass
+            return self.renew_token_method()
+
     @staticmethod
     def is_json_serializable(response):
         try:
@@ -1291,10 +1592,13 @@ class ApiClient:
         :return:
         """
         try:
+            if not self.verbose.print_all_responses:
+                # don't decode the response for nothing
+                return
             if resp is None:
                 resp = self.last_response
             is_json_serializable, results = self.is_json_serializable(response=resp)
-            if self.verbose.print_all_responses and is_json_serializable:
+            if is_json_serializable:
                 if isinstance(results, dict):
                     to_print = miscellaneous.List([results])
                 elif isinstance(results, list):
@@ -1598,6 +1902,8 @@ class ApiClient:
         return renewed
 
     def set_api_counter(self, filepath):
+        # write the calls of the previous counter before replacing it
+        self.calls_counter.close()
         self.calls_counter = CallsCounter(filepath=filepath)
 
     def _get_resource_url(self, url):
@@ -1,7 +1,10 @@
 import threading
 import asyncio
+import weakref
+import aiohttp
 import logging
 import io
+from .concurrency import AdaptiveAsyncSemaphore
 
 logger = logging.getLogger(name='dtlpy')
 
@@ -10,12 +13,21 @@ class AsyncThreadEventLoop(threading.Thread):
     """Thread class with a stop() method. The thread itself has to check
     regularly for the stopped() condition."""
 
-    def __init__(self, loop, n, *args, **kwargs):
+    def __init__(self, loop, n, limit_per_host=None, keepalive_timeout=30, ttl_dns_cache=300, *args, **kwargs):
         super(AsyncThreadEventLoop, self).__init__(*args, **kwargs)
         self.loop = loop
         self.n = n
         self._count = 0
         self._semaphores = dict()
+        # shared connection pool settings - unbounded by default (0), the concurrent requests are already
+        # bounded by the semaphores (and the adaptive concurrency limit, up to 4 * n)
+        if limit_per_host is None:
+            limit_per_host = 0
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self._session = None
+        self._adaptive_semaphore = None
 
     def count_up(self):
         self._count += 1
@@ -38,10 +50,120 @@ class AsyncThreadEventLoop(threading.Thread):
             self._semaphores[name] = asyncio.BoundedSemaphore(self.n)
         return self._semaphores[name]
 
+    def adaptive_semaphore(self, controller):
+        """
+        Semaphore for single requests, bounded by the adaptive concurrency controller.
+        Must be called from inside the loop
+        """
+        if self._adaptive_semaphore is None or self._adaptive_semaphore.controller is not controller:
+            self._close_adaptive_semaphore()
+            self._adaptive_semaphore = AdaptiveAsyncSemaphore(controller=controller, loop=self.loop)
+        return self._adaptive_semaphore
+
+    def _close_adaptive_semaphore(self):
+        if self._adaptive_semaphore is not None:
+            self._adaptive_semaphore.close()
+        self._adaptive_semaphore = None
+
+    @property
+    def session(self):
+        """
+        Shared aiohttp session for all requests running on this loop.
+        Must be called from inside the loop (created lazily on first use)
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=0,
+                                             limit_per_host=self.limit_per_host,
+                                             keepalive_timeout=self.keepalive_timeout,
+                                             ttl_dns_cache=self.ttl_dns_cache,
+                                             use_dns_cache=True)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  timeout=aiohttp.ClientTimeout(total=0))
+        return self._session
+
+    async def close_session(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._close_adaptive_semaphore()
+
     def stop(self):
+        if self._session is not None and self.loop.is_running() and threading.current_thread() is not self:
+            try:
+                future = asyncio.run_coroutine_threadsafe(self.close_session(), loop=self.loop)
+                future.result(timeout=5)
+            except Exception:
+                logger.debug('[Async] EventLoop: failed closing shared session')
         self.loop.call_soon_threadsafe(self.loop.stop)  # here
 
 
+class AsyncSessionContext:
+    """
+    Async context to get an aiohttp session.
+    Use the given session or the shared session of the event loop thread when running on it, otherwise open a
+    one-off session (e.g. coroutines running on a user loop) and close it on exit
+    """
+
+    def __init__(self, event_loop=None, session=None, **kwargs):
+        self.event_loop = event_loop
+        self.session = session
+        self.kwargs = kwargs
+        self._session = None
+        self._owned = False
+
+    async def __aenter__(self):
+        if self.session is not None and not self.session.closed:
+            self._session = self.session
+        elif self.event_loop is not None and self.event_loop.loop is asyncio.get_event_loop():
+            self._session = self.event_loop.session
+        else:
+            self._session = aiohttp.ClientSession(**self.kwargs)
+            self._owned = True
+        return self._session
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._owned:
+            await self._session.close()
+
+
+class LoopSessions:
+    """
+    One shared aiohttp session per running event loop (for coroutines running on user loops, e.g. an asyncio
+    web service), so concurrent requests reuse the same connection pool
+    """
+
+    def __init__(self, limit_per_host=100, keepalive_timeout=30, ttl_dns_cache=300):
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self._sessions = weakref.WeakKeyDictionary()
+
+    def get(self):
+        """
+        Session of the running loop. Must be called from inside the loop
+        """
+        loop = asyncio.get_event_loop()
+        session = self._sessions.get(loop, None)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(limit=0,
+                                             limit_per_host=self.limit_per_host,
+                                             keepalive_timeout=self.keepalive_timeout,
+                                             ttl_dns_cache=self.ttl_dns_cache,
+                                             use_dns_cache=True)
+            session = aiohttp.ClientSession(connector=connector,
+                                            timeout=aiohttp.ClientTimeout(total=0))
+            self._sessions[loop] = session
+        return session
+
+    async def close(self):
+        """
+        Close the session of the running loop
+        """
+        session = self._sessions.pop(asyncio.get_event_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+
 class AsyncResponse:
     def __init__(self, text, _json, async_resp):
         self.text = text
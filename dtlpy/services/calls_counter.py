@@ -1,26 +1,119 @@
+import collections
+import threading
+import atexit
+import time
+import re
 from .cookie import CookieIO
 
+# dataloop entity ids (mongo ObjectId)
+_ID_PATTERN = re.compile(r'/[0-9a-fA-F]{24}(?=/|$)')
+
+
+def route_template(path):
+    """
+    Route of a request path without query string and with entity ids replaced,
+    e.g. '/datasets/5f4d.../items?x=1' -> '/datasets/{id}/items'
+
+    :param path: request path or url
+    """
+    path = path.split('?')[0]
+    return _ID_PATTERN.sub('/{id}', path)
+
 
 class CallsCounter:
-    def __init__(self, filepath):
+    """
+    Count API calls in memory and flush to file every `flush_interval` seconds and at exit.
+    The counter file is shared - flushing adds the local calls to the number in the file
+    """
+
+    def __init__(self, filepath, flush_interval=10, by_endpoint=True):
         self.io = CookieIO(filepath)
         self.state = 'off'
-        self.number = 0
+        self.flush_interval = flush_interval
+        self.by_endpoint = by_endpoint
+        self._lock = threading.Lock()
+        # number in file on last sync and calls not yet flushed
+        self._synced_number = 0
+        self._pending = 0
+        self._endpoints = collections.Counter()
+        self._last_flush = time.monotonic()
         self.load()
+        atexit.register(self.on_exit)
+
+    @property
+    def number(self):
+        return self._synced_number + self._pending
+
+    def add(self, path=None, status=None):
+        """
+        Count a single call. No disk access (other than one flush every interval)
 
-    def add(self):
-        if self.state == 'on':
-            self.load()
-            self.number += 1
-            self.save()
+        :param path: request path - for the per endpoint counts
+        :param status: response status code - for the per endpoint counts
+        """
+        if self.state != 'on':
+            return
+        with self._lock:
+            self._pending += 1
+            if self.by_endpoint and path is not None:
+                self._endpoints[(route_template(path), status)] += 1
+            need_flush = time.monotonic() - self._last_flush >= self.flush_interval
+            if need_flush:
+                self._last_flush = time.monotonic()
+        if need_flush:
+            self.flush()
+
+    def counts(self):
+        """
+        Live counts (without reading the file)
+
+        :return: dict with total number and number per endpoint and status
+        """
+        with self._lock:
+            endpoints = collections.defaultdict(dict)
+            for (route, status), number in self._endpoints.items():
+                endpoints[route][status] = number
+            return {'state': self.state,
+                    'number': self.number,
+                    'endpoints': dict(endpoints)}
+
+    def flush(self):
+        """
+        Add the pending calls to the number in the counter file
+        """
+        with self._lock:
+            pending, self._pending = self._pending, 0
+            self._last_flush = time.monotonic()
+        if pending == 0:
+            return
+
+        def add_pending(calls):
+            if calls is None:
+                calls = {'state': self.state,
+                         'number': 0}
+            calls['number'] += pending
+            return calls
+
+        # read and write under one file lock - other processes flush to the same file
+        calls = self.io.update('calls_counter', add_pending)
+        with self._lock:
+            self._synced_number = calls['number']
+            self.state = calls['state']
 
     def reset(self):
-        self.number = 0
+        with self._lock:
+            self._synced_number = 0
+            self._pending = 0
+            self._endpoints.clear()
         self.save()
 
     def save(self):
+        with self._lock:
+            self._synced_number += self._pending
+            self._pending = 0
+            number = self._synced_number
         self.io.put('calls_counter', {'state': self.state,
-                                      'number': self.number})
+                                      'number': number})
 
     def on(self):
         self.state = 'on'
@@ -31,7 +124,14 @@ class CallsCounter:
         self.save()
 
     def on_exit(self):
-        self.save()
+        self.flush()
+
+    def close(self):
+        """
+        Flush the pending calls and stop flushing at exit (for a replaced counter)
+        """
+        atexit.unregister(self.on_exit)
+        self.flush()
 
     def load(self):
         calls = self.io.get('calls_counter')
@@ -40,5 +140,7 @@ class CallsCounter:
             calls = {'state': 'off',
                      'number': 0}
             self.io.put('calls_counter', calls)
-        self.state = calls['state']
-        self.number = calls['number']
+        with self._lock:
+            self.state = calls['state']
+            self._synced_number = calls['number']
+            self._pending = 0
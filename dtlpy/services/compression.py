@@ -0,0 +1,101 @@
+import threading
+import gzip
+import zlib
+
+ACCEPT_ENCODING = 'gzip, deflate'
+
+
+class BodyCompression:
+    """
+    Opt-in compression of large request bodies (gzip/deflate) and counters of bytes saved
+    on requests and on compressed responses
+    """
+    ENCODINGS = ['gzip', 'deflate']
+
+    def __init__(self, enabled=False, threshold=16 * 1024, encoding='gzip', level=6):
+        """
+        :param bool enabled: compress request bodies
+        :param int threshold: min body size in bytes to compress
+        :param str encoding: 'gzip' or 'deflate'
+        :param int level: compression level 1 (fast) - 9 (small)
+        """
+        self.enabled = enabled
+        self.threshold = threshold
+        self.encoding = encoding
+        self.level = level
+        self._lock = threading.Lock()
+        self._stats = dict()
+        self.reset_stats()
+
+    def enable(self, threshold=None, encoding=None, level=None):
+        if threshold is not None:
+            self.threshold = threshold
+        if encoding is not None:
+            if encoding not in self.ENCODINGS:
+                raise ValueError('unknown encoding: {}. known: {}'.format(encoding, self.ENCODINGS))
+            self.encoding = encoding
+        if level is not None:
+            self.level = level
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def compress(self, data, headers):
+        """
+        Compress a request body if enabled and above the threshold. Sets Content-Encoding in headers
+
+        :param bytes data: encoded body
+        :param dict headers: request headers
+        :return: body to send
+        """
+        if not self.enabled or not isinstance(data, bytes) or len(data) < self.threshold:
+            return data
+        if any(key.lower() == 'content-encoding' for key in headers):
+            # already encoded by the caller
+            return data
+        if self.encoding == 'gzip':
+            compressed = gzip.compress(data, compresslevel=self.level)
+        else:
+            compressed = zlib.compress(data, self.level)
+        headers['Content-Encoding'] = self.encoding
+        with self._lock:
+            self._stats['requests_compressed'] += 1
+            self._stats['request_bytes'] += len(data)
+            self._stats['request_bytes_sent'] += len(compressed)
+        return compressed
+
+    def record_response(self, headers, size):
+        """
+        Count the bytes saved by a compressed response
+
+        :param headers: response headers
+        :param int size: decoded body size
+        """
+        encoding = headers.get('Content-Encoding', None)
+        wire_size = headers.get('Content-Length', None)
+        if encoding is None or wire_size is None:
+            return
+        with self._lock:
+            self._stats['responses_compressed'] += 1
+            self._stats['response_bytes'] += size
+            self._stats['response_bytes_received'] += int(wire_size)
+
+    def stats(self):
+        """
+        :return: dict of counters including the bytes saved in each direction
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats['request_bytes_saved'] = stats['request_bytes'] - stats['request_bytes_sent']
+        stats['response_bytes_saved'] = stats['response_bytes'] - stats['response_bytes_received']
+        return stats
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {'requests_compressed': 0,
+                           'request_bytes': 0,
+                           'request_bytes_sent': 0,
+                           'responses_compressed': 0,
+                           'response_bytes': 0,
+                           'response_bytes_received': 0}
@@ -0,0 +1,251 @@
+import contextlib
+import threading
+import asyncio
+import logging
+import weakref
+import time
+from .calls_counter import route_template
+
+logger = logging.getLogger(name='dtlpy')
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD concurrency controller.
+    The limit grows by `increase` after a full window of healthy responses (about `limit` responses) and is
+    multiplied by `decrease_factor` on throttling (429, 503, 504).
+    Opt-in latency signal: also decrease when the smoothed latency of a route rises above `latency_tolerance`
+    times the baseline latency of that route.
+    Thread safe - shared by the sync thread pools and the async event loop semaphores
+    """
+    CONGESTION_STATUSES = (429, 503, 504)
+
+    def __init__(self,
+                 initial_limit,
+                 min_limit=1,
+                 max_limit=None,
+                 increase=1,
+                 decrease_factor=0.7,
+                 latency_tolerance=None):
+        """
+        :param int initial_limit: starting limit
+        :param int min_limit: lowest limit
+        :param int max_limit: highest limit (default twice the initial limit)
+        :param int increase: additive increase per window of healthy responses
+        :param float decrease_factor: multiplicative decrease on congestion
+        :param float latency_tolerance: opt-in latency signal (e.g. 2.0), None to use only the response status
+        """
+        if max_limit is None:
+            max_limit = 2 * initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._in_flight = 0
+        self._successes = 0
+        # smoothed latency of all routes - spaces out the decreases (once per round trip)
+        self._smoothed_latency = None
+        # route template to [smoothed latency, baseline latency], for the latency signal
+        self._route_latencies = dict()
+        self._last_decrease = 0
+        self._num_throttled = 0
+        self._condition = threading.Condition()
+        self._release_callbacks = list()
+
+    @property
+    def limit(self):
+        return int(self._limit)
+
+    def reset(self, initial_limit, max_limit=None):
+        """
+        Restart the controller with new bounds (e.g. when the number of processes changes)
+        """
+        if max_limit is None:
+            max_limit = 2 * initial_limit
+        with self._condition:
+            self.max_limit = max_limit
+            self._limit = float(max(self.min_limit, min(initial_limit, max_limit)))
+            self._successes = 0
+            self._condition.notify_all()
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    def limits(self):
+        """
+        Current state of the controller
+
+        :return: dict
+        """
+        with self._condition:
+            return {'limit': self.limit,
+                    'in_flight': self._in_flight,
+                    'min_limit': self.min_limit,
+                    'max_limit': self.max_limit,
+                    'smoothed_latency': self._smoothed_latency,
+                    'latency_tolerance': self.latency_tolerance,
+                    'route_latencies': {route: {'smoothed': smoothed, 'baseline': baseline}
+                                        for route, (smoothed, baseline) in self._route_latencies.items()},
+                    'num_throttled': self._num_throttled}
+
+    ###########
+    # Acquire #
+    ###########
+    def try_acquire(self):
+        with self._condition:
+            if self._in_flight < self.limit:
+                self._in_flight += 1
+                return True
+            return False
+
+    def acquire(self):
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self):
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+        for callback in self._release_callbacks:
+            callback()
+
+    def add_release_callback(self, callback):
+        with self._condition:
+            self._release_callbacks = self._release_callbacks + [callback]
+
+    def remove_release_callback(self, callback):
+        with self._condition:
+            self._release_callbacks = [c for c in self._release_callbacks if c != callback]
+
+    @contextlib.contextmanager
+    def slot(self):
+        """
+        Blocking context for a single request (or a unit of work) in a thread
+        """
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    ###########
+    # Observe #
+    ###########
+    def observe(self, status, latency=None, route=None):
+        """
+        Update the limit with a response
+
+        :param int status: response status code
+        :param float latency: seconds of the single attempt (without retries and backoff). None to use only the status
+        :param str route: request path or url - baseline of the opt-in latency signal
+        """
+        with self._condition:
+            congested = status in self.CONGESTION_STATUSES
+            if congested:
+                self._num_throttled += 1
+            if latency is not None:
+                if self._smoothed_latency is None:
+                    self._smoothed_latency = latency
+                else:
+                    self._smoothed_latency = 0.9 * self._smoothed_latency + 0.1 * latency
+                if self.latency_tolerance is not None and not congested and route is not None:
+                    congested = self._observe_latency(route=route_template(route), latency=latency)
+            if congested:
+                self._successes = 0
+                # back off once per round trip
+                now = time.monotonic()
+                if now - self._last_decrease > (self._smoothed_latency or 0):
+                    self._last_decrease = now
+                    self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+                    logger.debug('[AdaptiveConcurrency] status: {}, decrease limit to {}'.format(status, self.limit))
+            else:
+                self._successes += 1
+                if self._successes >= self.limit:
+                    self._successes = 0
+                    previous = self.limit
+                    self._limit = min(self.max_limit, self._limit + self.increase)
+                    if self.limit > previous:
+                        self._condition.notify(self.limit - previous)
+
+    def _observe_latency(self, route, latency):
+        # must be called under the lock. True when the route latency is above its baseline tolerance
+        latencies = self._route_latencies.get(route, None)
+        if latencies is None:
+            self._route_latencies[route] = [latency, latency]
+            return False
+        smoothed = 0.9 * latencies[0] + 0.1 * latency
+        # baseline follows the lowest smoothed latency of the route and slowly forgets it
+        baseline = min(latencies[1] * 1.001, smoothed)
+        latencies[0], latencies[1] = smoothed, baseline
+        return smoothed > self.latency_tolerance * baseline
+
+
+class AsyncNullSemaphore:
+    """
+    No-op async context (for coroutines that are not running on the client event loop)
+    """
+
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+
+class AdaptiveAsyncSemaphore:
+    """
+    asyncio semaphore bounded by the current limit of an AdaptiveConcurrency controller.
+    Must be created and used on the same event loop
+    """
+
+    def __init__(self, controller, loop):
+        self.controller = controller
+        self._loop = loop
+        self._released = asyncio.Event()
+        # weak reference - a dropped semaphore unregisters itself on the next release
+        self_ref = weakref.ref(self)
+
+        def on_release():
+            semaphore = self_ref()
+            if semaphore is None:
+                controller.remove_release_callback(on_release)
+            else:
+                semaphore._on_release()
+
+        self._release_callback = on_release
+        controller.add_release_callback(on_release)
+
+    def close(self):
+        """
+        Stop listening to the controller releases
+        """
+        self.controller.remove_release_callback(self._release_callback)
+
+    def _on_release(self):
+        if not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._released.set)
+
+    async def acquire(self):
+        while not self.controller.try_acquire():
+            self._released.clear()
+            try:
+                # timeout covers releases that happened between the try and the clear
+                await asyncio.wait_for(self._released.wait(), timeout=0.1)
+            except asyncio.TimeoutError:
+                pass
+        return True
+
+    def release(self):
+        self.controller.release()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return None
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.release()
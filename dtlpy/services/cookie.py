@@ -2,11 +2,16 @@
 Dataloop cookie state
 """
 
+import contextlib
+import threading
+import tempfile
+import copy
 import os
 import time
 import json
 import logging
 import random
+import stat
 from .service_defaults import DATALOOP_PATH
 from filelock import FileLock
 
@@ -14,6 +19,19 @@ logger = logging.getLogger(name='dtlpy')
 
 NUM_TRIES = 3
 
+# process-local parsed cookies: path -> (file stat key, cfg). cfg objects in the cache are never mutated
+_PARSED_COOKIES = dict()
+_PARSED_COOKIES_LOCK = threading.Lock()
+
+# process umask - the mode of new cookie files (os.umask can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _stat_key(path):
+    file_stat = os.stat(path)
+    return file_stat.st_mtime_ns, file_stat.st_ino, file_stat.st_size
+
 
 class CookieIO:
     """
@@ -23,6 +41,10 @@ class CookieIO:
     def __init__(self, path, create=True, local=False):
         self.COOKIE = path
         self.local = local
+        # coalesced puts - written once when the outer batch() exits
+        self._batch_lock = threading.RLock()
+        self._batch_depth = 0
+        self._batch_values = dict()
         if create:
             self.create()
 
@@ -50,49 +72,117 @@ class CookieIO:
             logger.debug('COOKIE.create: File: {}'.format(self.COOKIE))
             self.reset()
         try:
-            with FileLock(self.COOKIE + ".lock"):
-                with open(self.COOKIE, 'r') as f:
-                    json.load(f)
+            self._read_cached()
         except ValueError:
             print('FATAL ERROR: COOKIE {!r} is corrupted. please fix or delete the file.'.format(self.COOKIE))
             raise SystemExit
 
-    def read_json(self, create=False):
+    def _update_path(self):
         # which cookie
         if self.local:
             self.COOKIE = os.path.join(os.getcwd(), '.dataloop', 'state.json')
 
+    def read_json(self, create=False):
+        self._update_path()
+
         # check if file exists - and create
         if not os.path.isfile(self.COOKIE) and create:
             self.create()
 
-        # check if file exists
-        if not os.path.isfile(self.COOKIE):
+        return copy.deepcopy(self._read_cached())
+
+    def _read_cached(self, lock=True):
+        """
+        Parsed cookie, re-read from disk only if the file changed (mtime, inode or size).
+        The returned dict is shared - do not modify it
+
+        :param lock: take the file lock for reading. False if the caller already holds it
+        """
+        try:
+            stat_key = _stat_key(self.COOKIE)
+        except OSError:
             logger.debug('COOKIE.read: File does not exist: {}. Return None'.format(self.COOKIE))
-            cfg = {}
-        else:
-            # read cookie
-            cfg = {}
-            for i in range(NUM_TRIES):
-                try:
+            return dict()
+        with _PARSED_COOKIES_LOCK:
+            cached = _PARSED_COOKIES.get(self.COOKIE)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+        # read cookie
+        cfg = {}
+        for i in range(NUM_TRIES):
+            try:
+                if lock:
                     with FileLock(self.COOKIE + ".lock"):
-                        with open(self.COOKIE, 'r') as fp:
-                            cfg = json.load(fp)
-                    break
-                except Exception:
-                    if i == (NUM_TRIES - 1):
-                        raise
-                    time.sleep(random.random())
-                    continue
+                        stat_key, cfg = self._read_file()
+                else:
+                    stat_key, cfg = self._read_file()
+                break
+            except Exception:
+                if i == (NUM_TRIES - 1):
+                    raise
+                time.sleep(random.random())
+                continue
+        with _PARSED_COOKIES_LOCK:
+            _PARSED_COOKIES[self.COOKIE] = (stat_key, cfg)
         return cfg
 
+    def _read_file(self):
+        stat_key = _stat_key(self.COOKIE)
+        with open(self.COOKIE, 'r') as fp:
+            cfg = json.load(fp)
+        return stat_key, cfg
+
+    def _write(self, cfg):
+        """
+        Atomic write - dump to a temp file in the same directory and replace the cookie, keeping the cookie mode.
+        A symlinked cookie, or a cookie that can not be replaced (e.g. bind mounted), is written in place.
+        Must be called under the file lock
+        """
+        if os.path.islink(self.COOKIE):
+            self._write_in_place(cfg)
+        else:
+            directory = os.path.dirname(self.COOKIE)
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.cookie-', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as fp:
+                    json.dump(cfg, fp, indent=2)
+                # mkstemp creates 0600 files
+                os.chmod(temp_path, self._file_mode())
+                try:
+                    os.replace(temp_path, self.COOKIE)
+                except OSError:
+                    logger.debug('COOKIE.write: cant replace {}, writing in place'.format(self.COOKIE))
+                    os.remove(temp_path)
+                    self._write_in_place(cfg)
+            except Exception:
+                if os.path.isfile(temp_path):
+                    os.remove(temp_path)
+                raise
+        with _PARSED_COOKIES_LOCK:
+            _PARSED_COOKIES[self.COOKIE] = (_stat_key(self.COOKIE), cfg)
+
+    def _write_in_place(self, cfg):
+        with open(self.COOKIE, 'w') as fp:
+            json.dump(cfg, fp, indent=2)
+
+    def _file_mode(self):
+        try:
+            return stat.S_IMODE(os.stat(self.COOKIE).st_mode)
+        except OSError:
+            # new file - same as open()
+            return 0o666 & ~_UMASK
+
     def get(self, key):
         if key not in ['calls_counter']:
             # ignore logging for some keys
             logger.debug('COOKIE.read: key: {}'.format(key))
-        cfg = self.read_json()
+        with self._batch_lock:
+            if key in self._batch_values:
+                return copy.deepcopy(self._batch_values[key])
+        self._update_path()
+        cfg = self._read_cached()
         if key in cfg.keys():
-            value = cfg[key]
+            value = copy.deepcopy(cfg[key])
         else:
             logger.debug(msg='Key not in platform cookie file: {}. Return None'.format(key))
             value = None
@@ -102,14 +192,78 @@ class CookieIO:
         if key not in ['calls_counter']:
             # ignore logging for some keys
             logger.debug('COOKIE.write: key: {}'.format(key))
-        # read and write
-        cfg = self.read_json(create=True)
-        cfg[key] = value
+        with self._batch_lock:
+            if self._batch_depth > 0:
+                self._batch_values[key] = copy.deepcopy(value)
+                return
+        self._put_values(values={key: value})
+
+    def update(self, key, func):
+        """
+        Read, modify and write a single key under one file lock - safe against other processes
+        updating the same key
+
+        :param key: cookie key
+        :param func: callable getting the current value (None if not set) and returning the new value
+        :return: the new value
+        """
+        with self._batch_lock:
+            if self._batch_depth > 0:
+                if key in self._batch_values:
+                    value = self._batch_values[key]
+                else:
+                    value = self.get(key)
+                value = func(value)
+                self._batch_values[key] = copy.deepcopy(value)
+                return copy.deepcopy(value)
+        self._update_path()
+        if not os.path.isfile(self.COOKIE):
+            self.create()
         with FileLock(self.COOKIE + ".lock"):
-            with open(self.COOKIE, 'w') as fp:
-                json.dump(cfg, fp, indent=2)
+            cfg = dict(self._read_cached(lock=False))
+            value = func(copy.deepcopy(cfg.get(key, None)))
+            cfg[key] = copy.deepcopy(value)
+            self._write(cfg)
+        return value
+
+    def _put_values(self, values):
+        # read and write under the same lock
+        self._update_path()
+        if not os.path.isfile(self.COOKIE):
+            self.create()
+        with FileLock(self.COOKIE + ".lock"):
+            # shallow copy - the cached dict is shared
+            cfg = dict(self._read_cached(lock=False))
+            for key, value in values.items():
+                cfg[key] = copy.deepcopy(value)
+            self._write(cfg)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Coalesce all puts inside the context to a single write
+
+        **Example**:
+
+        .. code-block:: python
+
+            with cookie_io.batch():
+                cookie_io.put('a', 1)
+                cookie_io.put('b', 2)
+        """
+        with self._batch_lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._batch_lock:
+                self._batch_depth -= 1
+                values = dict()
+                if self._batch_depth == 0:
+                    values, self._batch_values = self._batch_values, dict()
+            if len(values) > 0:
+                self._put_values(values=values)
 
     def reset(self):
         with FileLock(self.COOKIE + ".lock"):
-            with open(self.COOKIE, 'w') as fp:
-                json.dump({}, fp, indent=2)
+            self._write(dict())
@@ -1,3 +1,4 @@
+import collections
 import threading
 import time
 import traceback
@@ -7,6 +8,9 @@ import os
 
 logger = logging.getLogger(name='dtlpy')
 
+# caller of a request - replaces the full inspect.FrameInfo (only filename and function are used)
+CallSite = collections.namedtuple('CallSite', ['filename', 'function'])
+
 
 class Events(threading.Thread):
     def __init__(self, client_api, *args, **kwargs):
@@ -0,0 +1,173 @@
+import collections
+import threading
+import bisect
+from .calls_counter import route_template
+
+
+def _default_buckets():
+    # 1ms to ~5min, x1.5 per bucket
+    return tuple(0.001 * 1.5 ** i for i in range(32))
+
+
+class _RouteMetrics:
+    def __init__(self, num_buckets):
+        self.count = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.statuses = collections.Counter()
+        # last bucket is +Inf
+        self.buckets = [0] * (num_buckets + 1)
+
+
+class MetricsRegistry:
+    """
+    In-process requests metrics per (method, route template): latency histogram (p50/p95/p99),
+    status codes, retries and bytes sent/received. Shared by the sync and async request paths
+    """
+    QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(self, enabled=True, buckets=None):
+        """
+        :param bool enabled: record requests
+        :param buckets: latency histogram upper bounds in seconds (sorted)
+        """
+        if buckets is None:
+            buckets = _default_buckets()
+        self.enabled = enabled
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._routes = dict()
+
+    def observe(self, method, path, status, latency, bytes_sent=0, bytes_received=0, retries=0):
+        """
+        Record a request
+
+        :param str method: request method
+        :param str path: request path or url
+        :param int status: response status code
+        :param float latency: seconds from first send to response (including retries)
+        :param int bytes_sent: request body size
+        :param int bytes_received: response body size
+        :param int retries: number of resends
+        """
+        if not self.enabled:
+            return
+        key = (method.upper(), route_template(path))
+        i_bucket = bisect.bisect_left(self.buckets, latency)
+        with self._lock:
+            metrics = self._routes.get(key, None)
+            if metrics is None:
+                metrics = _RouteMetrics(num_buckets=len(self.buckets))
+                self._routes[key] = metrics
+            metrics.count += 1
+            metrics.retries += retries
+            metrics.bytes_sent += bytes_sent
+            metrics.bytes_received += bytes_received
+            metrics.latency_sum += latency
+            if latency > metrics.latency_max:
+                metrics.latency_max = latency
+            metrics.statuses[status] += 1
+            metrics.buckets[i_bucket] += 1
+
+    def reset(self):
+        with self._lock:
+            self._routes = dict()
+
+    def _quantile(self, metrics, q):
+        rank = q * metrics.count
+        cumulative = 0
+        for i_bucket, bucket_count in enumerate(metrics.buckets):
+            if bucket_count == 0:
+                continue
+            if cumulative + bucket_count >= rank:
+                lower = self.buckets[i_bucket - 1] if i_bucket > 0 else 0.0
+                upper = self.buckets[i_bucket] if i_bucket < len(self.buckets) else metrics.latency_max
+                # linear interpolation inside the bucket
+                value = lower + (upper - lower) * (rank - cumulative) / bucket_count
+                return min(value, metrics.latency_max)
+            cumulative += bucket_count
+        return metrics.latency_max
+
+    def to_dict(self):
+        """
+        Snapshot of all routes
+
+        :return: dict of '<METHOD> <route>' to the route metrics
+        """
+        with self._lock:
+            routes = list(self._routes.items())
+            output = dict()
+            for (method, route), metrics in routes:
+                latency = {'p{}'.format(int(q * 100)): self._quantile(metrics, q) for q in self.QUANTILES}
+                latency['mean'] = metrics.latency_sum / metrics.count
+                latency['max'] = metrics.latency_max
+                output['{} {}'.format(method, route)] = {'method': method,
+                                                         'route': route,
+                                                         'count': metrics.count,
+                                                         'statuses': dict(metrics.statuses),
+                                                         'retries': metrics.retries,
+                                                         'bytes_sent': metrics.bytes_sent,
+                                                         'bytes_received': metrics.bytes_received,
+                                                         'latency': latency}
+        return output
+
+    def to_prometheus(self, prefix='dtlpy'):
+        """
+        Export in the Prometheus text exposition format
+
+        :param str prefix: metrics names prefix
+        :return: str
+        """
+        lines = list()
+
+        def header(name, kind, doc):
+            lines.append('# HELP {}_{} {}'.format(prefix, name, doc))
+            lines.append('# TYPE {}_{} {}'.format(prefix, name, kind))
+
+        with self._lock:
+            routes = [(key, metrics) for key, metrics in self._routes.items()]
+            header('request_duration_seconds', 'histogram', 'Requests latency')
+            for (method, route), metrics in routes:
+                labels = 'method="{}",route="{}"'.format(method, route)
+                cumulative = 0
+                for i_bucket, bucket_count in enumerate(metrics.buckets):
+                    cumulative += bucket_count
+                    le = '+Inf' if i_bucket == len(self.buckets) else repr(round(self.buckets[i_bucket], 6))
+                    lines.append('{}_request_duration_seconds_bucket{{{},le="{}"}} {}'.format(prefix, labels, le,
+                                                                                               cumulative))
+                lines.append('{}_request_duration_seconds_sum{{{}}} {}'.format(prefix, labels, metrics.latency_sum))
+                lines.append('{}_request_duration_seconds_count{{{}}} {}'.format(prefix, labels, metrics.count))
+            header('requests_total', 'counter', 'Requests by status code')
+            for (method, route), metrics in routes:
+                for status, count in sorted(metrics.statuses.items()):
+                    lines.append('{}_requests_total{{method="{}",route="{}",status="{}"}} {}'.format(
+                        prefix, method, route, status, count))
+            for name, attribute, doc in [('request_retries_total', 'retries', 'Requests resends'),
+                                         ('request_bytes_sent_total', 'bytes_sent', 'Request body bytes'),
+                                         ('response_bytes_received_total', 'bytes_received', 'Response body bytes')]:
+                header(name, 'counter', doc)
+                for (method, route), metrics in routes:
+                    lines.append('{}_{}{{method="{}",route="{}"}} {}'.format(prefix, name, method, route,
+                                                                            getattr(metrics, attribute)))
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def body_size(body):
+        """
+        Size of a request body. 0 for streams and files
+        """
+        if isinstance(body, (bytes, bytearray)):
+            return len(body)
+        if isinstance(body, str):
+            return len(body.encode('utf-8'))
+        return 0
+
+    @staticmethod
+    def content_length(headers, default=0):
+        try:
+            return int(headers.get('Content-Length', default))
+        except (TypeError, ValueError):
+            return default
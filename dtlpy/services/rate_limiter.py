@@ -0,0 +1,172 @@
+import email.utils
+import threading
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(name='dtlpy')
+
+# statuses that carry a Retry-After for throttling
+THROTTLE_STATUSES = (429, 503)
+
+
+class TokenBucket:
+    """
+    Token bucket with reservations: a caller takes a token now and gets the time to wait for it,
+    so the same bucket serves blocking threads and coroutines
+    """
+
+    def __init__(self, rate, burst=None):
+        """
+        :param float rate: tokens (requests) per second
+        :param float burst: bucket size. default - one second of tokens
+        """
+        if burst is None:
+            burst = max(1.0, rate)
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Take a token
+
+        :return: seconds to wait before using it
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0
+            return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Process wide requests rate limiter for the sync and async request paths.
+    Optional global and per route prefix rates (requests per second), and a global pause when the gate
+    answers with Retry-After
+    """
+
+    def __init__(self, rate=None, routes=None, max_pause=300, default_pause=1):
+        """
+        :param float rate: global requests per second. None - unlimited
+        :param dict routes: route prefix to requests per second, e.g. {'/items': 50, '/query': 10}
+        :param float max_pause: max seconds to pause on a single Retry-After
+        :param float default_pause: seconds to pause on 429 without Retry-After
+        """
+        self.max_pause = max_pause
+        self.default_pause = default_pause
+        self._pause_until = 0
+        self._lock = threading.Lock()
+        self._bucket = None
+        self._route_buckets = dict()
+        self.set_rate(rate=rate, routes=routes)
+
+    def set_rate(self, rate=None, routes=None):
+        """
+        Set the requests per second limits
+
+        :param float rate: global requests per second. None - unlimited
+        :param dict routes: route prefix to requests per second, e.g. {'/items': 50, '/query': 10}
+        """
+        if routes is None:
+            routes = dict()
+        with self._lock:
+            self._bucket = TokenBucket(rate=rate) if rate is not None else None
+            # longest prefix first
+            self._route_buckets = {prefix: TokenBucket(rate=route_rate)
+                                   for prefix, route_rate in sorted(routes.items(), key=lambda r: -len(r[0]))}
+
+    @property
+    def rate(self):
+        return None if self._bucket is None else self._bucket.rate
+
+    @property
+    def routes(self):
+        return {prefix: bucket.rate for prefix, bucket in self._route_buckets.items()}
+
+    @property
+    def paused_for(self):
+        return max(0, self._pause_until - time.monotonic())
+
+    def reserve(self, path=None):
+        """
+        Reserve a request slot
+
+        :param str path: request path (without the environment url)
+        :return: seconds to wait before sending
+        """
+        wait = self.paused_for
+        if self._bucket is not None:
+            wait = max(wait, self._bucket.reserve())
+        if path is not None and len(self._route_buckets) > 0:
+            for prefix, bucket in self._route_buckets.items():
+                if path.startswith(prefix):
+                    wait = max(wait, bucket.reserve())
+                    break
+        return wait
+
+    def wait(self, path=None):
+        wait = self.reserve(path=path)
+        while wait > 0:
+            time.sleep(wait)
+            # a throttled response while sleeping extends the pause
+            wait = self.paused_for
+
+    async def async_wait(self, path=None):
+        wait = self.reserve(path=path)
+        while wait > 0:
+            await asyncio.sleep(wait)
+            # a throttled response while sleeping extends the pause
+            wait = self.paused_for
+
+    def pause(self, seconds):
+        """
+        Pause all requests (all threads and coroutines)
+
+        :param float seconds: seconds from now
+        """
+        seconds = min(seconds, self.max_pause)
+        with self._lock:
+            self._pause_until = max(self._pause_until, time.monotonic() + seconds)
+        logger.debug('[RateLimiter] requests paused for {:.2f}[s]'.format(seconds))
+
+    def on_response(self, status, headers):
+        """
+        Pause on throttling responses
+
+        :param int status: response status code
+        :param headers: response headers
+        :return: True if the response was throttled (worth retrying after the pause)
+        """
+        if status not in THROTTLE_STATUSES:
+            return False
+        retry_after = self.parse_retry_after(headers.get('Retry-After', None) if headers else None)
+        if retry_after is None and status == 429:
+            retry_after = self.default_pause
+        if retry_after is None:
+            return False
+        self.pause(retry_after)
+        return True
+
+    @staticmethod
+    def parse_retry_after(value):
+        """
+        Retry-After header in seconds (delta seconds or http date)
+        """
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_date = email.utils.parsedate_to_datetime(value)
+            return max(0.0, retry_date.timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,104 @@
+import threading
+import time
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent calls: the first caller of a key runs the request and all callers that
+    arrive while it is in flight get the same result.
+    Optionally memoize successful results for `ttl` seconds (hot entity lookups).
+    Disabled by default
+    """
+
+    def __init__(self, enabled=False, ttl=0, max_memo_size=1000):
+        """
+        :param bool enabled: coalesce identical in-flight calls
+        :param float ttl: seconds to keep a successful result. 0 - no memo
+        :param int max_memo_size: max memoized results
+        """
+        self.enabled = enabled
+        self.ttl = ttl
+        self.max_memo_size = max_memo_size
+        self._lock = threading.Lock()
+        self._calls = dict()
+        self._memo = dict()
+        self.num_shared = 0
+
+    def enable(self, ttl=0):
+        self.enabled = True
+        self.ttl = ttl
+
+    def disable(self):
+        self.enabled = False
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._memo.clear()
+
+    def invalidate(self, path):
+        """
+        Drop memoized results of a path, its sub paths and its parents (after an update or delete)
+
+        :param str path: request path
+        """
+        if len(self._memo) == 0:
+            return
+        path = path.split('?')[0]
+        with self._lock:
+            for key in list(self._memo.keys()):
+                key_path = key[0].split('?')[0]
+                if key_path.startswith(path) or path.startswith(key_path):
+                    self._memo.pop(key, None)
+
+    def do(self, key, func):
+        """
+        Run func once for all concurrent callers of key
+
+        :param tuple key: call key - first element is the request path
+        :param func: callable returning (success, response)
+        :return: func result
+        """
+        with self._lock:
+            if key in self._memo:
+                expire, result = self._memo[key]
+                if time.monotonic() < expire:
+                    self.num_shared += 1
+                    return result
+                self._memo.pop(key, None)
+            call = self._calls.get(key, None)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                self.num_shared += 1
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func()
+        except BaseException as e:
+            # followers get the error too (also KeyboardInterrupt and such) - never a None result
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+                success = call.error is None and call.result[0]
+                if self.ttl > 0 and success:
+                    if len(self._memo) >= self.max_memo_size:
+                        # drop the oldest
+                        self._memo.pop(next(iter(self._memo)))
+                    self._memo[key] = (time.monotonic() + self.ttl, call.result)
+            call.event.set()
+        return call.result
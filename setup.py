@@ -47,6 +47,10 @@ setup(name='dtlpy',
       packages=find_packages(exclude=('tests', 'docs', 'samples')),
       setup_requires=['wheel'],
       install_requires=requirements,
+      extras_require={
+          # PagedEntities.to_arrow / to_parquet (RecordBatch.from_pydict)
+          'arrow': ['pyarrow>=7.0'],
+      },
       test_suite='tests',
       python_requires='>=3.6',
       scripts=['dtlpy/dlp/dlp.py', 'dtlpy/dlp/dlp.bat', 'dtlpy/dlp/dlp'],
@@ -0,0 +1,123 @@
+"""
+Adaptive concurrency against a stub gate with limited capacity:
+latency grows with the number of concurrent requests and requests above the capacity get 429.
+Prints the controller limit over time for the sync (thread pool) and async paths.
+Then a healthy gate (no throttling, some slow requests) - the limit must not shrink
+
+    python -m tests.benchmarks.bench_adaptive_concurrency
+"""
+import threading
+import asyncio
+import random
+import time
+try:
+    from .stub_server import StubServer
+    from .utils import make_client
+except ImportError:
+    from stub_server import StubServer
+    from utils import make_client
+
+CAPACITY = 8
+BASE_LATENCY = 0.01
+NUM_REQUESTS = 2000
+NUM_WORKERS = 64
+
+
+class CapacityRoute:
+    def __init__(self, capacity=CAPACITY, base_latency=BASE_LATENCY):
+        self.capacity = capacity
+        self.base_latency = base_latency
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.num_429 = 0
+
+    def __call__(self, path, headers, body):
+        with self.lock:
+            self.in_flight += 1
+            in_flight = self.in_flight
+        try:
+            if in_flight > self.capacity:
+                with self.lock:
+                    self.num_429 += 1
+                return 429, {'Retry-After': '1'}, {'message': 'too many requests'}
+            # latency grows with load
+            time.sleep(self.base_latency * (1 + in_flight / self.capacity))
+            return 200, dict(), {'id': 'stub'}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class SlowRequestsRoute:
+    def __init__(self, slow_rate=0.2, base_latency=BASE_LATENCY, slow_latency=0.2, seed=0):
+        self.slow_rate = slow_rate
+        self.base_latency = base_latency
+        self.slow_latency = slow_latency
+        self._random = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def __call__(self, path, headers, body):
+        with self.lock:
+            slow = self._random.random() < self.slow_rate
+        time.sleep(self.slow_latency if slow else self.base_latency)
+        return 200, dict(), {'id': 'stub'}
+
+
+def sample_limits(client_api, stop, samples, interval=0.2):
+    while not stop.is_set():
+        samples.append(client_api.concurrency.limits()['limit'])
+        time.sleep(interval)
+
+
+def run_sync(client_api):
+    pool = client_api.thread_pools(pool_name='annotation.upload')
+    jobs = [pool.submit(client_api.gen_request, req_type='post', path='/items/stub/annotations', json_req=[])
+            for _ in range(NUM_REQUESTS)]
+    return [j.result()[0] for j in jobs]
+
+
+def run_async(client_api):
+    async def single():
+        async with client_api.event_loop.semaphore('annotations.upload'):
+            success, _ = await client_api.gen_async_request(req_type='post',
+                                                            path='/items/stub/annotations',
+                                                            json_req=[])
+            return success
+
+    async def run_all():
+        return await asyncio.gather(*[single() for _ in range(NUM_REQUESTS)])
+
+    return asyncio.run_coroutine_threadsafe(run_all(), loop=client_api.event_loop.loop).result()
+
+
+def run(name, runner, route):
+    with StubServer(routes=[('POST', '/items', route)]) as server:
+        client_api = make_client(url=server.url, num_processes=NUM_WORKERS)
+        stop = threading.Event()
+        samples = list()
+        sampler = threading.Thread(target=sample_limits, args=(client_api, stop, samples), daemon=True)
+        sampler.start()
+        tic = time.time()
+        results = runner(client_api)
+        duration = time.time() - tic
+        stop.set()
+        sampler.join()
+        print('[{}] requests/sec: {:.1f}, success: {}, 429s: {}, limits: {}'.format(
+            name, NUM_REQUESTS / duration, sum(results), getattr(route, 'num_429', 0), samples))
+        limits = client_api.concurrency.limits()
+        print('[{}] final: {}'.format(name, {key: value for key, value in limits.items()
+                                              if key != 'route_latencies'}))
+        return limits
+
+
+def main():
+    for name, runner in [('sync', run_sync), ('async', run_async)]:
+        run(name=name, runner=runner, route=CapacityRoute())
+    # no throttling - slow requests alone must not shrink the limit
+    for name, runner in [('sync healthy', run_sync), ('async healthy', run_async)]:
+        limits = run(name=name, runner=runner, route=SlowRequestsRoute())
+        assert limits['limit'] >= NUM_WORKERS, limits
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Concurrent item lookups: blocking repositories on a thread pool vs the asyncio repositories on one thread
+
+    python -m tests.benchmarks.bench_aio
+"""
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from dtlpy import repositories, entities
+try:
+    from .stub_server import StubServer
+    from .utils import make_client
+    from . import payloads
+except ImportError:
+    from stub_server import StubServer
+    from utils import make_client
+    import payloads
+
+NUM_LOOKUPS = 2000
+LATENCY = 0.02
+NUM_ITEMS = 5000
+PAGE_SIZE = 500
+
+
+def get_item(path, headers, body):
+    return 200, dict(), payloads.item_json(int(path.split('/')[-1][-8:], 16))
+
+
+def query(path, headers, body):
+    filters = json.loads(body)
+    offset, size = filters['page'], filters['pageSize']
+    items = [payloads.item_json(i) for i in range(offset * size, min(NUM_ITEMS, (offset + 1) * size))]
+    result = payloads.page(items, total=NUM_ITEMS)
+    result['totalPagesCount'] = -(-NUM_ITEMS // size)
+    result['hasNextPage'] = (offset + 1) * size < NUM_ITEMS
+    return 200, dict(), result
+
+
+def run_threads(client_api, num_workers):
+    items = repositories.Items(client_api=client_api)
+    tic = time.time()
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+        results = list(pool.map(lambda i: items.get(item_id=payloads._id(i)), range(NUM_LOOKUPS)))
+    assert len(results) == NUM_LOOKUPS
+    return time.time() - tic
+
+
+async def run_aio(aio):
+    tic = time.time()
+    results = await asyncio.gather(*[aio.items.get(item_id=payloads._id(i)) for i in range(NUM_LOOKUPS)])
+    assert len(results) == NUM_LOOKUPS
+    return time.time() - tic
+
+
+async def list_aio(aio):
+    tic = time.time()
+    dataset = entities.Dataset.from_json(_json={'id': payloads.DATASET_ID},
+                                         client_api=aio.client_api,
+                                         project=None)
+    count = 0
+    async for _ in aio.items.list(filters=entities.Filters(page_size=PAGE_SIZE), dataset=dataset):
+        count += 1
+    assert count == NUM_ITEMS, count
+    return time.time() - tic
+
+
+def main():
+    routes = [('GET', '/items/', get_item),
+              ('POST', '/datasets/{}/query'.format(payloads.DATASET_ID), query)]
+    with StubServer(routes=routes, latency=LATENCY) as server:
+        client_api = make_client(url=server.url, num_processes=32)
+        client_api.verbose.print_all_responses = False
+        print('{} lookups, {}[s] latency'.format(NUM_LOOKUPS, LATENCY))
+        for num_workers in [32, 128]:
+            print('threads x{}: {:.2f}[s]'.format(num_workers, run_threads(client_api, num_workers)))
+
+        async def bench():
+            async with repositories.aio.AsyncApiClient(client_api=client_api, limit_per_host=128) as aio:
+                print('aio (1 thread, 128 connections): {:.2f}[s]'.format(await run_aio(aio)))
+                print('aio list {} items: {:.2f}[s]'.format(NUM_ITEMS, await list_aio(aio)))
+
+        asyncio.run(bench())
+
+
+if __name__ == '__main__':
+    main()
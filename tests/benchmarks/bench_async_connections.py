@@ -0,0 +1,77 @@
+"""
+Handshakes per item for async requests.
+Before: one-off aiohttp session per request (coroutines running on a private loop).
+After: the shared session of the client event loop - must not be slower than a session per request.
+
+    python -m tests.benchmarks.bench_async_connections
+"""
+import asyncio
+import time
+try:
+    from .stub_server import StubServer
+    from .utils import make_client
+except ImportError:
+    from stub_server import StubServer
+    from utils import make_client
+
+NUM_ITEMS = 500
+CONCURRENCY = 32
+# per response - the throughput depends on the concurrent connections, not on the (shared) cpu
+LATENCY = 0.02
+REPEAT = 3
+
+
+async def _run_requests(client_api, n, concurrency=CONCURRENCY):
+    semaphore = asyncio.BoundedSemaphore(concurrency)
+
+    async def single(i):
+        async with semaphore:
+            return await client_api.gen_async_request(req_type='post',
+                                                      path='/items/{}/annotations'.format(i),
+                                                      json_req=[{'label': 'a'}])
+
+    return await asyncio.gather(*[single(i) for i in range(n)])
+
+
+def run(server, client_api, shared):
+    if shared:
+        # start every repeat from a cold pool - the handshakes count the reuse within the run
+        asyncio.run_coroutine_threadsafe(client_api.event_loop.close_session(),
+                                         loop=client_api.event_loop.loop).result()
+    server.reset_counters()
+    tic = time.time()
+    if shared:
+        future = asyncio.run_coroutine_threadsafe(_run_requests(client_api=client_api, n=NUM_ITEMS),
+                                                  loop=client_api.event_loop.loop)
+        future.result()
+    else:
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(_run_requests(client_api=client_api, n=NUM_ITEMS))
+        finally:
+            loop.close()
+    duration = time.time() - tic
+    return {'items': NUM_ITEMS,
+            'connections': server.counters['connections'],
+            'handshakes_per_item': server.counters['connections'] / NUM_ITEMS,
+            'items_per_sec': NUM_ITEMS / duration}
+
+
+def main():
+    with StubServer(latency=LATENCY) as server:
+        # the shared session requests are bounded by the adaptive limit - grows up to 4 * num_processes
+        client_api = make_client(url=server.url, num_processes=CONCURRENCY // 4)
+        runs = {'before': list(), 'after': list()}
+        for _ in range(REPEAT):
+            runs['before'].append(run(server=server, client_api=client_api, shared=False))
+            runs['after'].append(run(server=server, client_api=client_api, shared=True))
+    before, after = [max(runs[name], key=lambda result: result['items_per_sec']) for name in ['before', 'after']]
+    print('before (session per request): {}'.format(before))
+    print('after (shared session):       {}'.format(after))
+    # the shared connector must not cap the concurrency below the one-off sessions
+    assert after['items_per_sec'] >= 0.9 * before['items_per_sec'], (before, after)
+    assert after['handshakes_per_item'] < before['handshakes_per_item'], (before, after)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Items and annotations to a DataFrame: entities + List.to_df vs the columnar page by page export.
+Parquet streaming runs when pyarrow is installed
+
+    python -m tests.benchmarks.bench_columnar
+"""
+import tracemalloc
+import tempfile
+import time
+import os
+
+from dtlpy import entities, repositories, miscellaneous
+try:
+    from .fake_gate import FakeGate
+    from .utils import make_client
+except ImportError:
+    from fake_gate import FakeGate
+    from utils import make_client
+
+NUM_ITEMS = 10000
+ANNOTATIONS_PER_ITEM = 2
+
+
+def measure(name, func):
+    tracemalloc.start()
+    tic = time.time()
+    output = func()
+    seconds = time.time() - tic
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print('{:<36} {:>6.2f}[s] peak {:>7.1f}MB'.format(name, seconds, peak / 1e6))
+    return output
+
+
+def main():
+    with FakeGate(num_items=NUM_ITEMS, annotations_per_item=ANNOTATIONS_PER_ITEM) as gate:
+        client_api = make_client(url=gate.url)
+        client_api.verbose.disable_progress_bar = True
+        dataset = repositories.Datasets(client_api=client_api).get(dataset_id=gate.dataset_id)
+        items = dataset.items.list(filters=entities.Filters(page_size=1000))
+        annotations = dataset.annotations.list(
+            filters=entities.Filters(resource=entities.FiltersResource.ANNOTATION, page_size=1000))
+
+        measure('items: all() + List.to_df', lambda: miscellaneous.List(list(items.all())).to_df())
+        df = measure('items: to_pandas', lambda: items.to_pandas())
+        assert len(df) == NUM_ITEMS
+        print(df.dtypes.to_dict())
+        df = measure('annotations: to_pandas', lambda: annotations.to_pandas())
+        assert len(df) == NUM_ITEMS * ANNOTATIONS_PER_ITEM
+        measure('items: to_pandas(fields)', lambda: items.to_pandas(fields=['id', 'filename']))
+
+        try:
+            import pyarrow
+        except ImportError:
+            print('pyarrow is not installed - skipping arrow and parquet')
+            return
+        measure('items: to_arrow', lambda: items.to_arrow())
+        filepath = os.path.join(tempfile.mkdtemp(), 'items.parquet')
+        rows = measure('items: to_parquet', lambda: items.to_parquet(filepath=filepath))
+        assert rows == NUM_ITEMS
+        print('parquet {:.1f}MB'.format(os.path.getsize(filepath) / 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Peak RSS of holding annotations in memory: full Annotation entities vs CompactAnnotation.
+Each mode runs in its own process. Full entities are measured on 100k (1M does not fit in a
+laptop's memory) and extrapolated, compact ones on 1M
+
+    python -m tests.benchmarks.bench_compact
+"""
+import subprocess
+import argparse
+import resource
+import sys
+import time
+
+from dtlpy import entities, miscellaneous
+try:
+    from .utils import make_client
+    from . import payloads
+except ImportError:
+    from utils import make_client
+    import payloads
+
+PAGE_SIZE = 1000
+NUM_POINTS = 20
+
+
+def rss_mb():
+    # linux reports KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run(mode, num_annotations):
+    client_api = make_client(url='http://localhost')
+    item = entities.Item.from_json(_json=payloads.item_json(0), client_api=client_api)
+    # one encoded page, decoded for every page to get fresh objects like a listing
+    page = miscellaneous.JsonCodec.dumps_bytes([payloads.annotation_json(i, item_id=item.id, num_points=NUM_POINTS)
+                                                for i in range(PAGE_SIZE)])
+    baseline = rss_mb()
+    held = list()
+    tic = time.time()
+    for _ in range(num_annotations // PAGE_SIZE):
+        for _json in miscellaneous.JsonCodec.loads(page):
+            if mode == 'full':
+                held.append(entities.Annotation.from_json(_json=_json, item=item, client_api=client_api))
+            else:
+                held.append(entities.CompactAnnotation.from_json(_json=_json, client_api=client_api))
+    seconds = time.time() - tic
+    peak = rss_mb() - baseline
+    print('{:<8} {:>8} annotations: {:>7.1f}[s] peak RSS +{:>7.0f}MB ({:.2f}KB/annotation)'.format(
+        mode, len(held), seconds, peak, peak * 1024 / len(held)))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--mode', default=None, choices=['full', 'compact'])
+    parser.add_argument('--num', type=int, default=None)
+    args = parser.parse_args()
+    if args.mode is not None:
+        run(mode=args.mode, num_annotations=args.num)
+        return
+    for mode, num in [('full', 100000), ('compact', 100000), ('compact', 1000000)]:
+        subprocess.run([sys.executable, '-m', 'tests.benchmarks.bench_compact', '--mode', mode, '--num', str(num)],
+                       check=True)
+
+
+if __name__ == '__main__':
+    main()
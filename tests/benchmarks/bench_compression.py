@@ -0,0 +1,63 @@
+"""
+Request body compression of polygon-heavy annotation batches against a stub gate
+
+    python -m tests.benchmarks.bench_compression
+"""
+import gzip
+import json
+import zlib
+import time
+try:
+    from .stub_server import StubServer
+    from .utils import make_client
+    from .payloads import annotation_json
+except ImportError:
+    from stub_server import StubServer
+    from utils import make_client
+    from payloads import annotation_json
+
+NUM_BATCHES = 20
+BATCH_SIZE = 100
+
+
+class AnnotationsRoute:
+    def __init__(self):
+        self.wire_bytes = 0
+
+    def __call__(self, path, headers, body):
+        self.wire_bytes += len(body)
+        encoding = headers.get('Content-Encoding', None)
+        if encoding == 'gzip':
+            body = gzip.decompress(body)
+        elif encoding == 'deflate':
+            body = zlib.decompress(body)
+        annotations = json.loads(body)
+        return 200, dict(), [{'id': str(i)} for i in range(len(annotations))]
+
+
+def run(client_api, route, batches):
+    route.wire_bytes = 0
+    tic = time.time()
+    for batch in batches:
+        success, _ = client_api.gen_request(req_type='post', path='/items/stub/annotations', json_req=batch)
+        assert success
+    return {'wire_mb': round(route.wire_bytes / 1e6, 2), 'duration': round(time.time() - tic, 2)}
+
+
+def main():
+    batches = [[annotation_json(i, num_points=500) for i in range(BATCH_SIZE)] for _ in range(NUM_BATCHES)]
+    route = AnnotationsRoute()
+    with StubServer(routes=[('POST', '/items', route)]) as server:
+        client_api = make_client(url=server.url)
+        print('uncompressed: {}'.format(run(client_api=client_api, route=route, batches=batches)))
+        for encoding in ['gzip', 'deflate']:
+            for level in [1, 6]:
+                client_api.compression.enable(encoding=encoding, level=level)
+                client_api.compression.reset_stats()
+                result = run(client_api=client_api, route=route, batches=batches)
+                print('{} level {}: {}, request bytes saved: {}'.format(
+                    encoding, level, result, client_api.compression.stats()['request_bytes_saved']))
+
+
+if __name__ == '__main__':
+    main()
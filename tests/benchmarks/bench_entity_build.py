@@ -0,0 +1,85 @@
+"""
+Building the entities of a listed page: a 1000 annotations page and a 1000 items page,
+inline in one pass against the entity.create thread pool (client_api.entity_build_mode).
+Also a process pool building picklable CompactAnnotation, for the cost of shipping the page to workers and back
+(full entities hold the client and repositories and can not be returned from a process)
+
+    python -m tests.benchmarks.bench_entity_build
+    python -m tests.benchmarks.bench_entity_build --page-size 5000 --repeat 3
+"""
+import concurrent.futures
+import argparse
+import time
+
+from dtlpy import entities, repositories
+try:
+    from .fake_gate import FakeGate
+    from .utils import make_client
+    from . import payloads
+except ImportError:
+    from fake_gate import FakeGate
+    from utils import make_client
+    import payloads
+
+MODES = ['threads', 'inline']
+
+
+def compact_page(jsons):
+    return [entities.CompactAnnotation.from_json(_json=_json) for _json in jsons]
+
+
+def best_of(func, repeat):
+    seconds = list()
+    for _ in range(repeat):
+        tic = time.time()
+        output = func()
+        seconds.append(time.time() - tic)
+    return output, min(seconds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--page-size', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--workers', type=int, default=4, help='process pool workers')
+    args = parser.parse_args()
+
+    with FakeGate() as gate:
+        client_api = make_client(url=gate.url)
+        dataset = repositories.Datasets(client_api=client_api).get(dataset_id=gate.dataset_id)
+        item = entities.Item.from_json(_json=payloads.item_json(0), client_api=client_api, dataset=dataset)
+        annotation_jsons = [payloads.annotation_json(i_annotation, item_id=item.id, num_points=20)
+                            for i_annotation in range(args.page_size)]
+        item_jsons = [payloads.item_json(i_item) for i_item in range(args.page_size)]
+        for _json in item_jsons:
+            _json['datasetId'] = dataset.id
+
+        pages = [('annotations', item.annotations, annotation_jsons),
+                 ('items', dataset.items, item_jsons)]
+        for resource, repository, jsons in pages:
+            results = dict()
+            for mode in MODES:
+                client_api.entity_build_mode = mode
+                built, seconds = best_of(lambda: repository._build_entities_from_response(response_items=jsons),
+                                         repeat=args.repeat)
+                assert [entity.id for entity in built] == [_json['id'] for _json in jsons]
+                results[mode] = seconds
+                print('{:<12} {:<8} {} entities {:>8.1f}ms {:>8.1f}us/entity'.format(
+                    resource, mode, len(built), seconds * 1e3, seconds / len(built) * 1e6))
+            print('{:<12} inline speedup x{:.2f}'.format(resource, results['threads'] / results['inline']))
+
+    chunk_size = -(-len(annotation_jsons) // args.workers)
+    chunks = [annotation_jsons[i:i + chunk_size] for i in range(0, len(annotation_jsons), chunk_size)]
+    _, seconds = best_of(lambda: compact_page(annotation_jsons), repeat=args.repeat)
+    print('{:<12} {:<8} {} entities {:>8.1f}ms'.format('compact', 'inline', len(annotation_jsons), seconds * 1e3))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.workers) as pool:
+        # warm up the workers (imports)
+        list(pool.map(compact_page, chunks))
+        _, seconds = best_of(lambda: [a for page in pool.map(compact_page, chunks) for a in page],
+                             repeat=args.repeat)
+    print('{:<12} {:<8} {} entities {:>8.1f}ms ({} workers)'.format('compact', 'process', len(annotation_jsons),
+                                                                   seconds * 1e3, args.workers))
+
+
+if __name__ == '__main__':
+    main()
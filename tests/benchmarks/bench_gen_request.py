@@ -0,0 +1,55 @@
+"""
+Micro-benchmark of small sync GETs through ApiClient.gen_request against a local stub.
+Also reports the cost of the call-site capture done by the token decorator vs. the legacy inspect.stack()
+
+    python -m tests.benchmarks.bench_gen_request
+"""
+import inspect
+import time
+try:
+    from .stub_server import StubServer
+    from .utils import make_client
+except ImportError:
+    from stub_server import StubServer
+    from utils import make_client
+from dtlpy.services.api_client import Decorators
+
+NUM_CALLS = 10000
+
+
+def time_call_site_capture(n=NUM_CALLS):
+    def legacy():
+        return inspect.stack()[1]
+
+    def current():
+        return Decorators.call_site(depth=1)
+
+    results = dict()
+    for name, func in [('inspect.stack', legacy), ('call_site', current)]:
+        tic = time.perf_counter()
+        for _ in range(n):
+            func()
+        results[name] = (time.perf_counter() - tic) / n * 1e6
+    return results
+
+
+def time_gen_request(client_api, n=NUM_CALLS):
+    tic = time.perf_counter()
+    for _ in range(n):
+        success, _ = client_api.gen_request(req_type='get', path='/datasets/stub')
+        assert success
+    duration = time.perf_counter() - tic
+    return {'calls': n,
+            'total_sec': duration,
+            'usec_per_call': duration / n * 1e6}
+
+
+def main():
+    print('call-site capture [usec/call]: {}'.format(time_call_site_capture()))
+    with StubServer() as server:
+        client_api = make_client(url=server.url)
+        print('gen_request: {}'.format(time_gen_request(client_api=client_api)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""
+JSON codec on realistic 1000-entity item and annotation pages: stdlib json vs dtlpy JsonCodec
+(orjson when installed) for response decode and request/cache encode
+
+    python -m tests.benchmarks.bench_json_codec
+"""
+import json
+import timeit
+from requests.models import Response
+from dtlpy.services.api_client import JsonResponse
+from dtlpy.miscellaneous import JsonCodec
+try:
+    from .payloads import items_page, annotations_page
+except ImportError:
+    from payloads import items_page, annotations_page
+
+NUMBER = 10
+
+
+def bench(name, payload):
+    body = json.dumps(payload).encode('utf-8')
+    std_resp = Response()
+    std_resp._content = body
+    std_resp.encoding = 'utf-8'
+    codec_resp = JsonResponse()
+    codec_resp._content = body
+    results = {
+        'decode requests': timeit.timeit(std_resp.json, number=NUMBER) / NUMBER * 1e3,
+        'decode codec': timeit.timeit(codec_resp.json, number=NUMBER) / NUMBER * 1e3,
+        'encode json': timeit.timeit(lambda: json.dumps(payload).encode('utf-8'), number=NUMBER) / NUMBER * 1e3,
+        'encode codec': timeit.timeit(lambda: JsonCodec.dumps_bytes(payload), number=NUMBER) / NUMBER * 1e3,
+    }
+    print('[{}] {:.1f}MB, backend: {}, [msec/page]: {}'.format(
+        name, len(body) / 1e6, JsonCodec.BACKEND, {k: round(v, 2) for k, v in results.items()}))
+
+
+def main():
+    bench(name='items page', payload=items_page(size=1000))
+    bench(name='annotations page', payload=annotations_page(size=1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Overhead of the requests metrics registry: cost of a single observe() and requests per second against the
+local stub with metrics on and off
+
+    python -m tests.benchmarks.bench_metrics
+"""
+import random
+import timeit
+import time
+from dtlpy.services.metrics import MetricsRegistry
+try:
+    from .stub_server import StubServer
+    from .utils import make_client
+except ImportError:
+    from stub_server import StubServer
+    from utils import make_client
+
+NUMBER = 100000
+NUM_REQUESTS = 2000
+
+
+def bench_observe():
+    metrics = MetricsRegistry()
+    paths = ['/items/6130c2e2d3b8f8c6a1e5a{:03d}'.format(i) for i in range(100)] + \
+            ['/datasets/6130c2e2d3b8f8c6a1e5a000/query', '/annotations/6130c2e2d3b8f8c6a1e5a000']
+    latencies = [random.expovariate(10) for _ in range(1000)]
+
+    def observe():
+        metrics.observe(method='GET',
+                        path=random.choice(paths),
+                        status=200,
+                        latency=random.choice(latencies),
+                        bytes_sent=100,
+                        bytes_received=1000)
+
+    per_call = timeit.timeit(observe, number=NUMBER) / NUMBER * 1e6
+    baseline = timeit.timeit(lambda: (random.choice(paths), random.choice(latencies)), number=NUMBER) / NUMBER * 1e6
+    print('observe: {:.2f}[us] per request ({} routes)'.format(per_call - baseline, len(metrics.to_dict())))
+    print('to_dict: {:.2f}[ms], to_prometheus: {:.2f}[ms]'.format(
+        timeit.timeit(metrics.to_dict, number=100) / 100 * 1e3,
+        timeit.timeit(metrics.to_prometheus, number=100) / 100 * 1e3))
+
+
+def run(client_api):
+    tic = time.time()
+    for i in range(NUM_REQUESTS):
+        success, _ = client_api.gen_request(req_type='get', path='/items/6130c2e2d3b8f8c6a1e5a{:03d}'.format(i % 100))
+        assert success
+    return NUM_REQUESTS / (time.time() - tic)
+
+
+def main():
+    bench_observe()
+    with StubServer() as server:
+        client_api = make_client(url=server.url)
+        client_api.metrics.enabled = False
+        off = run(client_api)
+        client_api.metrics.enabled = True
+        on = run(client_api)
+        print('requests/sec - metrics off: {:.0f}, on: {:.0f}'.format(off, on))
+        print(client_api.metrics.to_dict())
+        print(client_api.metrics.to_prometheus().splitlines()[-6:])
+
+
+if __name__ == '__main__':
+    main()
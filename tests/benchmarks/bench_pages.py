@@ -0,0 +1,62 @@
+"""
+Page iteration with read-ahead: pages fetched in the background while the current page is consumed.
+Checks the order is kept and that an abandoned iteration stops requesting pages
+
+    python -m tests.benchmarks.bench_pages
+"""
+import time
+
+from dtlpy import entities, repositories
+try:
+    from .fake_gate import FakeGate
+    from .utils import make_client
+except ImportError:
+    from fake_gate import FakeGate
+    from utils import make_client
+
+NUM_ITEMS = 3000
+PAGE_SIZE = 100
+LATENCY = 0.05
+# consumer work per page
+PAGE_WORK = 0.03
+
+
+def queries(client_api):
+    return sum(route['count'] for route in client_api.metrics.to_dict().values() if route['route'].endswith('/query'))
+
+
+def iterate(dataset, read_ahead, max_pages=None):
+    pages = dataset.items.list(filters=entities.Filters(page_size=PAGE_SIZE))
+    pages.read_ahead = read_ahead
+    ids = list()
+    tic = time.time()
+    for i_page, page in enumerate(pages):
+        if max_pages is not None and i_page == max_pages:
+            break
+        ids.extend(item.id for item in page)
+        time.sleep(PAGE_WORK)
+    return ids, time.time() - tic
+
+
+def main():
+    with FakeGate(num_items=NUM_ITEMS, latency=LATENCY) as gate:
+        client_api = make_client(url=gate.url)
+        client_api.verbose.disable_progress_bar = True
+        dataset = repositories.Datasets(client_api=client_api).get(dataset_id=gate.dataset_id)
+        expected = list(gate.items.keys())
+        print('{} items, {} per page, {}[s] latency, {}[s] work per page'.format(NUM_ITEMS, PAGE_SIZE,
+                                                                              LATENCY, PAGE_WORK))
+        for read_ahead in [0, 1, 2, 4]:
+            ids, seconds = iterate(dataset=dataset, read_ahead=read_ahead)
+            assert ids == expected, 'pages out of order'
+            print('read_ahead={}: {:.2f}[s] {:.0f} items/s'.format(read_ahead, seconds, len(ids) / seconds))
+
+        # stop after 3 pages - only the pages already in flight may still be requested
+        client_api.metrics.reset()
+        iterate(dataset=dataset, read_ahead=4, max_pages=3)
+        time.sleep(2 * LATENCY)
+        print('abandoned after 3 pages: {} page requests'.format(queries(client_api)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+PagedEntities.all() on a large fake dataset (no server): CPU time while waiting for pages, peak memory
+and order. The pages are produced lazily by a fake repository with a fixed latency
+
+    python -m tests.benchmarks.bench_pages_all
+"""
+import tracemalloc
+import time
+
+from dtlpy import entities, miscellaneous
+try:
+    from .utils import make_client
+except ImportError:
+    from utils import make_client
+
+NUM_ITEMS = 200000
+LATENCY = 0.005
+
+
+class FakeRepository:
+    def __init__(self, num_items, latency):
+        self.num_items = num_items
+        self.latency = latency
+
+    def _list(self, filters):
+        time.sleep(self.latency)
+        start = filters.page * filters.page_size
+        end = min(self.num_items, start + filters.page_size)
+        return {'items': [{'id': i_item, 'name': 'item_{}'.format(i_item), 'payload': 'x' * 200}
+                          for i_item in range(start, end)],
+                'totalItemsCount': self.num_items,
+                'totalPagesCount': -(-self.num_items // filters.page_size),
+                'hasNextPage': end < self.num_items}
+
+    def _build_entities_from_response(self, response_items):
+        return miscellaneous.List(response_items)
+
+
+def main():
+    client_api = make_client(url='http://localhost')
+    client_api.verbose.disable_progress_bar = True
+    repository = FakeRepository(num_items=NUM_ITEMS, latency=LATENCY)
+    pages = entities.PagedEntities(items_repository=repository,
+                                   filters=entities.Filters(),
+                                   page_offset=0,
+                                   page_size=100,
+                                   client_api=client_api)
+    pages.get_page()
+
+    tracemalloc.start()
+    wall_tic, cpu_tic = time.time(), time.process_time()
+    expected_id = 0
+    for item in pages.all():
+        assert item['id'] == expected_id, 'out of order'
+        expected_id += 1
+    wall, cpu = time.time() - wall_tic, time.process_time() - cpu_tic
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert expected_id == NUM_ITEMS, expected_id
+    print('{} items in {:.2f}[s], cpu {:.2f}[s] ({:.0%} of wall), peak memory {:.1f}MB'.format(
+        NUM_ITEMS, wall, cpu, cpu / wall, peak / 1e6))
+    # waiting for pages blocks - the busy loop used a full core (~95% of wall)
+    assert cpu < 0.6 * wall, 'consumer is spinning while waiting for pages'
+    # a page of these entities is ~50KB - peak memory is bounded by the pages in flight, not the dataset
+    in_flight = client_api._thread_pools_names['item.page']
+    assert peak < 4 * in_flight * 100 * 500 + 5e6, 'peak memory grows with the dataset'
+
+    # errors in a page are raised to the consumer
+    repository.num_items = 1000
+    pages.items_count = 1000
+
+    def failing_list(filters):
+        if filters.page == 5:
+            raise ValueError('page failed')
+        return FakeRepository._list(repository, filters)
+
+    repository._list = failing_list
+    try:
+        list(pages.all())
+        raise AssertionError('page error was not raised')
+    except ValueError:
+        print('page error raised to the consumer')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Partitioned listing: disjoint id ranges listed concurrently vs a single keyset cursor.
+Items are added while listing - every item must be returned exactly once
+
+    python -m tests.benchmarks.bench_partitioned
+"""
+import threading
+import time
+
+from dtlpy import entities, repositories
+try:
+    from .fake_gate import FakeGate
+    from .utils import make_client
+except ImportError:
+    from fake_gate import FakeGate
+    from utils import make_client
+
+NUM_ITEMS = 2000
+PAGE_SIZE = 100
+LATENCY = 0.3
+
+
+def main():
+    with FakeGate(num_items=NUM_ITEMS, latency=LATENCY) as gate:
+        client_api = make_client(url=gate.url)
+        client_api.verbose.disable_progress_bar = True
+        dataset = repositories.Datasets(client_api=client_api).get(dataset_id=gate.dataset_id)
+        filters = entities.Filters(page_size=PAGE_SIZE)
+        print('{} items, {} per page, {}[s] latency'.format(NUM_ITEMS, PAGE_SIZE, LATENCY))
+
+        tic = time.time()
+        ids = [item.id for page, _ in dataset.items.list(filters=filters).resumable_pages() for item in page]
+        print('single cursor: {:.2f}[s]'.format(time.time() - tic))
+        assert len(ids) == NUM_ITEMS
+
+        for partitions in [4, 8]:
+            # add items concurrently - they may or may not be listed but never twice
+            adder = threading.Thread(target=lambda: [gate.add_item(dataset_id=gate.dataset_id) for _ in range(50)])
+            before = set(gate.items.keys())
+            tic = time.time()
+            adder.start()
+            ids = [item.id for item in dataset.items.list(filters=filters).partitioned(partitions=partitions)]
+            seconds = time.time() - tic
+            adder.join()
+            assert len(ids) == len(set(ids)), 'items listed twice'
+            assert before.issubset(ids), 'items missing'
+            print('{} partitions: {:.2f}[s], {} items'.format(partitions, seconds, len(ids)))
+
+        # custom filter - the id ranges are added to the custom query (its and_filter_list is ignored)
+        directories = ['/dir_1', '/dir_2', '/dir_3']
+        expected = {item_id for item_id, item in gate.items.items() if item['dir'] in directories}
+        for custom_filter in [{'dir': {'$in': directories}},
+                              {'filter': {'dir': {'$in': directories}}}]:
+            custom = entities.Filters(custom_filter=custom_filter, page_size=PAGE_SIZE)
+            ids = [item.id for item in dataset.items.list(filters=custom).partitioned(partitions=4)]
+            assert len(ids) == len(set(ids)), 'items listed twice with a custom filter'
+            assert set(ids) == expected, 'custom filter partitions do not match the query'
+        print('custom filter: {} items, 4 partitions ok'.format(len(expected)))
+
+        # abandoning the stream stops the partitions
+        num_threads = threading.active_count()
+        stream = dataset.items.list(filters=filters).partitioned(partitions=4)
+        next(stream)
+        stream.close()
+        time.sleep(1)
+        print('threads before: {}, after close: {}'.format(num_threads, threading.active_count()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Entity construction with the platform json snapshot (used for the update diff):
+100k annotations from json, time and traced peak memory, and the diff after a change
+
+    python -m tests.benchmarks.bench_platform_dict
+"""
+import tracemalloc
+import time
+
+from dtlpy import entities, miscellaneous
+try:
+    from .utils import make_client
+    from . import payloads
+except ImportError:
+    from utils import make_client
+    import payloads
+
+NUM_ANNOTATIONS = 100000
+NUM_POINTS = 50
+
+
+def main():
+    client_api = make_client(url='http://localhost')
+    item = entities.Item.from_json(_json=payloads.item_json(0), client_api=client_api)
+    jsons = [payloads.annotation_json(i_annotation, item_id=item.id, num_points=NUM_POINTS)
+             for i_annotation in range(NUM_ANNOTATIONS)]
+
+    tracemalloc.start()
+    tic = time.time()
+    annotations = [entities.Annotation.from_json(_json=_json, item=item, client_api=client_api) for _json in jsons]
+    seconds = time.time() - tic
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print('{} annotations ({} points): {:.2f}[s] {:.1f}us/annotation, held {:.0f}MB, peak {:.0f}MB'.format(
+        NUM_ANNOTATIONS, NUM_POINTS, seconds, seconds / NUM_ANNOTATIONS * 1e6, current / 1e6, peak / 1e6))
+
+    # the snapshot is not affected by changes to the entity
+    annotation = annotations[0]
+    annotation.metadata['user'] = {'changed': True}
+    annotation.label = 'changed'
+    diff = miscellaneous.DictDiffer.diff(origin=annotation._platform_dict, modified=annotation.to_json())
+    assert diff['label'] == 'changed' and diff['metadata']['user'] == {'changed': True}, diff
+    item.metadata['user'] = {'changed': True}
+    diff = miscellaneous.DictDiffer.diff(origin=item._platform_dict, modified=item.to_json())
+    assert diff['metadata']['user']['changed'] is True, diff
+    print('update diff ok')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Client-wide rate limit and Retry-After handling against a stub gate.
+The stub answers 429 with Retry-After to a burst of requests and counts how many requests arrive
+while the client should be paused
+
+    python -m tests.benchmarks.bench_rate_limiter
+"""
+import threading
+import time
+try:
+    from .stub_server import StubServer
+    from .utils import make_client
+except ImportError:
+    from stub_server import StubServer
+    from utils import make_client
+
+NUM_REQUESTS = 300
+RATE = 100
+RETRY_AFTER = 1
+
+
+class ThrottleRoute:
+    """
+    Throttle once after `throttle_after` requests, for RETRY_AFTER seconds
+    """
+
+    def __init__(self, throttle_after=50):
+        self.throttle_after = throttle_after
+        self.lock = threading.Lock()
+        self.count = 0
+        self.throttled_until = None
+        self.during_pause = 0
+
+    def __call__(self, path, headers, body):
+        with self.lock:
+            self.count += 1
+            now = time.time()
+            if self.throttled_until is None and self.count >= self.throttle_after:
+                self.throttled_until = now + RETRY_AFTER
+            if self.throttled_until is not None and now < self.throttled_until:
+                self.during_pause += 1
+                return 429, {'Retry-After': str(RETRY_AFTER)}, {'message': 'slow down'}
+        return 200, dict(), {'id': 'stub'}
+
+
+def main():
+    route = ThrottleRoute()
+    with StubServer(routes=[('GET', '/items', route)]) as server:
+        client_api = make_client(url=server.url, num_processes=32)
+        client_api.rate_limiter.set_rate(rate=RATE, routes={'/items': RATE})
+        pool = client_api.thread_pools(pool_name='item.page')
+        tic = time.time()
+        jobs = [pool.submit(client_api.gen_request, req_type='get', path='/items/stub') for _ in range(NUM_REQUESTS)]
+        results = [j.result()[0] for j in jobs]
+        duration = time.time() - tic
+    print('success: {}/{}, requests/sec: {:.1f} (limit {}), requests hitting the 429 window: {}'.format(
+        sum(results), NUM_REQUESTS, NUM_REQUESTS / duration, RATE, route.during_pause))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Enumerating items: full entities (all()) vs raw json vs projected dicts/namedtuples (raw())
+
+    python -m tests.benchmarks.bench_raw
+"""
+import time
+
+from dtlpy import entities, repositories
+try:
+    from .fake_gate import FakeGate
+    from .utils import make_client
+except ImportError:
+    from fake_gate import FakeGate
+    from utils import make_client
+
+NUM_ITEMS = 20000
+FIELDS = ['id', 'filename', 'metadata.system.mimetype']
+
+
+def main():
+    with FakeGate(num_items=NUM_ITEMS) as gate:
+        client_api = make_client(url=gate.url)
+        client_api.verbose.disable_progress_bar = True
+        dataset = repositories.Datasets(client_api=client_api).get(dataset_id=gate.dataset_id)
+        pages = dataset.items.list(filters=entities.Filters(page_size=1000))
+        expected = list(gate.items.keys())
+
+        runs = [('all() entities', lambda: [item.id for item in pages.all()]),
+                ('raw() json', lambda: [item['id'] for item in pages.raw()]),
+                ('raw(fields)', lambda: [item['id'] for item in pages.raw(fields=FIELDS)]),
+                ('raw(fields, as_tuples)', lambda: [item.id for item in pages.raw(fields=FIELDS, as_tuples=True)])]
+        for name, run in runs:
+            tic = time.time()
+            ids = run()
+            seconds = time.time() - tic
+            assert ids == expected
+            print('{:<24} {:.2f}[s] {:>8.0f} items/s'.format(name, seconds, len(ids) / seconds))
+
+        record = next(pages.raw(fields=FIELDS, as_tuples=True))
+        print(record)
+
+
+if __name__ == '__main__':
+    main()
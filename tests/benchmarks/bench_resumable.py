@@ -0,0 +1,66 @@
+"""
+Resumable (keyset) pagination: restart from a saved checkpoint instead of page 0.
+Stops midway, adds items, resumes from the json checkpoint and checks every item is listed exactly once
+
+    python -m tests.benchmarks.bench_resumable
+"""
+import json
+import time
+
+from dtlpy import entities, repositories
+try:
+    from .fake_gate import FakeGate
+    from .utils import make_client
+except ImportError:
+    from fake_gate import FakeGate
+    from utils import make_client
+
+NUM_ITEMS = 5000
+PAGE_SIZE = 500
+CRASH_AFTER = 6
+
+
+def main():
+    with FakeGate(num_items=NUM_ITEMS, latency=0.01) as gate:
+        client_api = make_client(url=gate.url)
+        client_api.verbose.disable_progress_bar = True
+        dataset = repositories.Datasets(client_api=client_api).get(dataset_id=gate.dataset_id)
+        filters = entities.Filters(page_size=PAGE_SIZE)
+
+        # first run - "crash" after some pages, the checkpoint is persisted as json
+        seen = list()
+        saved = None
+        for i_page, (page, checkpoint) in enumerate(dataset.items.list(filters=filters).resumable_pages()):
+            seen.extend(item.id for item in page)
+            saved = json.dumps(checkpoint)
+            if i_page + 1 == CRASH_AFTER:
+                break
+        print('stopped after {} items, checkpoint: {}'.format(len(seen), saved))
+
+        # items added while the job is down are listed after the resume
+        added = [gate.add_item(dataset_id=gate.dataset_id)['id'] for _ in range(100)]
+
+        client_api.metrics.reset()
+        tic = time.time()
+        pages = dataset.items.list(filters=filters)
+        for page, checkpoint in pages.resumable_pages(checkpoint=json.loads(saved)):
+            seen.extend(item.id for item in page)
+        requests = sum(route['count'] for route in client_api.metrics.to_dict().values()
+                       if route['route'].endswith('/query'))
+        print('resumed in {:.2f}[s], {} query requests, {} items total'.format(time.time() - tic, requests,
+                                                                             checkpoint['count']))
+        assert len(seen) == len(set(seen)), 'items listed twice'
+        assert set(seen) == set(gate.items.keys()), 'items missing'
+        assert set(added).issubset(seen)
+        print('exactly once: {} items'.format(len(seen)))
+
+        try:
+            filters.add(field='dir', values='/other')
+            next(dataset.items.list(filters=filters).resumable_pages(checkpoint=json.loads(saved)))
+            raise AssertionError('checkpoint accepted with different filters')
+        except ValueError as e:
+            print('different filters rejected: {}'.format(e))
+
+
+if __name__ == '__main__':
+    main()
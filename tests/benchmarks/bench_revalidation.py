@@ -0,0 +1,91 @@
+"""
+Conditional GET revalidation of cached entities and binaries against the fake gate with ETags:
+repeated items.get and item stream downloads without a cache, with the cache only (trusting the ttl)
+and with the opt-in revalidation - time, bytes received and correctness after a change
+
+    python -m tests.benchmarks.bench_revalidation
+"""
+import tempfile
+import json
+import time
+import os
+from dtlpy import repositories
+from dtlpy.caches.cache import CacheConfig, CacheType
+try:
+    from .fake_gate import FakeGate
+    from .utils import make_client
+except ImportError:
+    from fake_gate import FakeGate
+    from utils import make_client
+
+NUM_ITEMS = 200
+NUM_ROUNDS = 5
+
+
+def received(client_api):
+    return sum(route['bytes_received'] for route in client_api.metrics.to_dict().values())
+
+
+def run(client_api, gate, item_ids):
+    items = repositories.Items(client_api=client_api)
+    client_api.metrics.reset()
+    tic = time.time()
+    for _ in range(NUM_ROUNDS):
+        for item_id in item_ids:
+            items.get(item_id=item_id)
+            success, response = client_api.gen_request(req_type='get',
+                                                path='/items/{}/stream'.format(item_id),
+                                                stream=True,
+                                                dataset_id=gate.dataset_id)
+            assert success
+            # consume the stream (served from the cache file when cached)
+            _ = response.content
+    return {'seconds': round(time.time() - tic, 2), 'received_mb': round(received(client_api) / 1e6, 2)}
+
+
+def fresh_cache(client_api, revalidate):
+    # empty cache directories for every run
+    tmp_dir = tempfile.mkdtemp()
+    os.environ['DATALOOP_PATH'] = tmp_dir
+    os.environ['DEFAULT_CACHE_PATH'] = os.path.join(tmp_dir, 'bin')
+    client_api.build_cache(cache_config=CacheConfig(cache_type=CacheType.DISKCACHE, ttl=3600),
+                           revalidate=revalidate)
+
+
+def main():
+    tmp_dir = tempfile.mkdtemp()
+    os.environ['DATALOOP_PATH'] = tmp_dir
+    os.environ['DEFAULT_CACHE_PATH'] = os.path.join(tmp_dir, 'bin')
+    with FakeGate(num_items=NUM_ITEMS, binary_size=100 * 1024, etags=True) as gate:
+        item_ids = list(gate.items.keys())
+        client_api = make_client(url=gate.url)
+        print('no cache:             {}'.format(run(client_api=client_api, gate=gate, item_ids=item_ids)))
+
+        fresh_cache(client_api=client_api, revalidate=False)
+        assert client_api.cache.revalidate is False, 'revalidation must be opt-in'
+        print('cache only:           {}'.format(run(client_api=client_api, gate=gate, item_ids=item_ids)))
+
+        fresh_cache(client_api=client_api, revalidate=True)
+        print('cache + revalidation: {}, 304s: {}'.format(run(client_api=client_api, gate=gate, item_ids=item_ids),
+                                                          gate.counters['not_modified']))
+        # validators are kept for entities and binaries only
+        assert client_api.cache.read_validators(request_path='/items/{}'.format(item_ids[0]))
+        assert client_api.cache.read_validators(request_path='/items/{}/stream'.format(item_ids[0]), binary=True)
+        assert client_api.cache._validators_key(request_path='/datasets') is None
+
+        # change an item on the gate - the revalidated cache must serve the new version
+        gate.items[item_ids[0]]['metadata']['user'] = {'changed': True}
+        item = repositories.Items(client_api=client_api).get(item_id=item_ids[0])
+        print('changed item served from the gate: {}'.format(item.metadata['user'] == {'changed': True}))
+        gate.items[item_ids[1]]['metadata']['system']['size'] = 1024
+        _, response = client_api.gen_request(req_type='get',
+                                             path='/items/{}/stream'.format(item_ids[1]),
+                                             stream=True,
+                                             dataset_id=gate.dataset_id)
+        # cached streams are returned as the path of the cached file
+        filepath = json.loads(response.content)
+        print('changed binary replaced in the cache: {}'.format(os.path.getsize(filepath) == 1024))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Binary (segmentation) annotations from json: full HD masks, lazy decoding.
+Building the annotations and reading labels, decoding every mask, and serializing untouched masks back
+
+    python -m tests.benchmarks.bench_segmentation
+    python -m tests.benchmarks.bench_segmentation --annotations 300  # eager decoding holds ~17MB per mask
+"""
+import tracemalloc
+import argparse
+import time
+
+import numpy as np
+
+from dtlpy import entities
+try:
+    from .utils import make_client
+    from . import payloads
+except ImportError:
+    from utils import make_client
+    import payloads
+
+WIDTH = 1920
+HEIGHT = 1080
+
+
+def mask_coordinates(i_mask, width=WIDTH, height=HEIGHT):
+    # filled ellipse, platform encoded (rgba png data url)
+    rows, cols = np.ogrid[:height, :width]
+    center_x, center_y = (i_mask * 97) % width, (i_mask * 53) % height
+    geo = ((cols - center_x) / (width / 6)) ** 2 + ((rows - center_y) / (height / 5)) ** 2 <= 1
+    color = (i_mask % 255, 100, 200)
+    return entities.Segmentation(geo=geo.astype(np.uint8), label=None, color=color).to_coordinates()
+
+
+def binary_json(i_annotation, item_id, coordinates):
+    _json = payloads.annotation_json(i_annotation, item_id=item_id, num_points=0)
+    _json['type'] = 'binary'
+    _json['coordinates'] = coordinates
+    return _json
+
+
+def measure(func):
+    tracemalloc.start()
+    tic = time.time()
+    output = func()
+    seconds = time.time() - tic
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return output, seconds, current / 1e6, peak / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--annotations', type=int, default=100)
+    args = parser.parse_args()
+
+    client_api = make_client(url='http://localhost')
+    item = entities.Item.from_json(_json=payloads.item_json(0), client_api=client_api)
+    masks = [mask_coordinates(i_mask) for i_mask in range(20)]
+    jsons = [binary_json(i_annotation, item_id=item.id, coordinates=masks[i_annotation % len(masks)])
+             for i_annotation in range(args.annotations)]
+
+    def build():
+        return [entities.Annotation.from_json(_json=_json, item=item, client_api=client_api) for _json in jsons]
+
+    annotations, seconds, held, peak = measure(build)
+    labels = {annotation.label for annotation in annotations}
+    print('build + labels:   {} masks {:.2f}[s] held {:.0f}MB peak {:.0f}MB ({} labels)'.format(
+        args.annotations, seconds, held, peak, len(labels)))
+
+    _, seconds, _, _ = measure(lambda: [annotation.to_json() for annotation in annotations])
+    assert all(annotation.coordinates == _json['coordinates'] for annotation, _json in zip(annotations, jsons))
+    print('to_json (untouched):  {:.2f}[s] passthrough'.format(seconds))
+
+    # decoding everything - the previous from_json behavior
+    def decode():
+        decoded = build()
+        for decoded_annotation in decoded:
+            _ = decoded_annotation.annotation_definition.geo
+        return decoded
+
+    decoded, seconds, held, peak = measure(decode)
+    del decoded
+    print('build + decode:   {} masks {:.2f}[s] held {:.0f}MB peak {:.0f}MB'.format(
+        args.annotations, seconds, held, peak))
+
+    # decoded once and cached
+    annotation = annotations[0]
+    assert annotation.annotation_definition.geo is annotation.annotation_definition.geo
+    assert annotation.annotation_definition.encoded is False
+    assert tuple(annotation.color[:3]) == (0, 100, 200), annotation.color
+    assert annotation.coordinates.startswith('data:image/png;base64,')
+    assert annotation.right > annotation.left
+    print('decode once ok')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Binary (segmentation) mask encoding with 4K masks: the float RGBA encoding against the palette encoding,
+png compression levels, and repeated serialization of an unchanged mask (cached)
+
+    python -m tests.benchmarks.bench_segmentation_encoding
+    python -m tests.benchmarks.bench_segmentation_encoding --masks 20
+"""
+import argparse
+import base64
+import time
+import io
+
+import numpy as np
+from PIL import Image
+
+from dtlpy import entities
+
+WIDTH = 3840
+HEIGHT = 2160
+COLOR = (10, 120, 230)
+
+
+def make_mask(i_mask, width=WIDTH, height=HEIGHT):
+    # filled ellipse with a ragged border
+    rng = np.random.RandomState(i_mask)
+    rows, cols = np.ogrid[:height, :width]
+    center_x, center_y = (i_mask * 397) % width, (i_mask * 211) % height
+    distance = ((cols - center_x) / (width / 5)) ** 2 + ((rows - center_y) / (height / 4)) ** 2
+    return (distance + rng.uniform(-0.05, 0.05, size=(height, width)) <= 1).astype(float)
+
+
+def legacy_to_coordinates(geo, color):
+    # the float RGBA stack encoding
+    png_ann = np.stack((color[0] * geo,
+                        color[1] * geo,
+                        color[2] * geo,
+                        255 * geo),
+                       axis=2).astype(np.uint8)
+    buff = io.BytesIO()
+    Image.fromarray(png_ann).save(buff, format="PNG")
+    return "data:image/png;base64,%s" % base64.b64encode(buff.getvalue()).decode("utf-8")
+
+
+def timed(func, masks):
+    tic = time.time()
+    outputs = [func(geo) for geo in masks]
+    return outputs, (time.time() - tic) / len(masks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--masks', type=int, default=10)
+    args = parser.parse_args()
+    masks = [make_mask(i_mask) for i_mask in range(args.masks)]
+
+    legacy, seconds = timed(lambda geo: legacy_to_coordinates(geo, COLOR), masks)
+    print('float rgba:          {:>8.1f}ms/mask {:>8.1f}KB'.format(
+        seconds * 1e3, np.mean([len(c) for c in legacy]) / 1e3))
+
+    default_level = entities.Segmentation.png_compress_level
+    for level in [1, 6, 9]:
+        entities.Segmentation.png_compress_level = level
+        encoded, seconds = timed(lambda geo: entities.Segmentation(geo=geo, label=None).to_coordinates(COLOR),
+                                 masks)
+        print('palette level {}:     {:>8.1f}ms/mask {:>8.1f}KB'.format(
+            level, seconds * 1e3, np.mean([len(c) for c in encoded]) / 1e3))
+    entities.Segmentation.png_compress_level = default_level
+
+    # same pixels as the float RGBA encoding
+    for geo, coordinates, legacy_coordinates in zip(masks, encoded, legacy):
+        assert np.array_equal(entities.Segmentation.from_coordinates(coordinates),
+                              entities.Segmentation.from_coordinates(legacy_coordinates))
+
+    # unchanged masks are encoded once
+    segmentations = [entities.Segmentation(geo=geo, label=None) for geo in masks]
+    _, first = timed(lambda segmentation: segmentation.to_coordinates(COLOR), segmentations)
+    _, cached = timed(lambda segmentation: segmentation.to_coordinates(COLOR), segmentations)
+    print('first / cached:      {:>8.1f}ms / {:.1f}ms per mask'.format(first * 1e3, cached * 1e3))
+
+    # in place changes and a new color are encoded again
+    segmentation = segmentations[0]
+    before = segmentation.to_coordinates(COLOR)
+    segmentation.geo[-100:, -100:] = 1
+    assert segmentation.to_coordinates(COLOR) != before
+    assert segmentation.to_coordinates((1, 2, 3)) != segmentation.to_coordinates(COLOR)
+    print('invalidation ok')
+
+
+if __name__ == '__main__':
+    main()
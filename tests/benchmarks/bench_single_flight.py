@@ -0,0 +1,40 @@
+"""
+Round trips for many threads resolving the same parent entity, with and without single flight
+
+    python -m tests.benchmarks.bench_single_flight
+"""
+import time
+try:
+    from .stub_server import StubServer
+    from .utils import make_client
+except ImportError:
+    from stub_server import StubServer
+    from utils import make_client
+
+NUM_LOOKUPS = 1000
+LATENCY = 0.05
+
+
+def run(server, client_api):
+    server.reset_counters()
+    pool = client_api.thread_pools(pool_name='item.page')
+    tic = time.time()
+    jobs = [pool.submit(client_api.gen_request, req_type='get', path='/datasets/stub') for _ in range(NUM_LOOKUPS)]
+    assert all(j.result()[0] for j in jobs)
+    return {'lookups': NUM_LOOKUPS,
+            'round_trips': server.counters['requests'],
+            'duration': time.time() - tic}
+
+
+def main():
+    with StubServer(latency=LATENCY) as server:
+        client_api = make_client(url=server.url, num_processes=32)
+        print('single flight off: {}'.format(run(server=server, client_api=client_api)))
+        client_api.single_flight.enable()
+        print('single flight on:  {}'.format(run(server=server, client_api=client_api)))
+        client_api.single_flight.enable(ttl=2)
+        print('single flight on, memo 2[s]: {}'.format(run(server=server, client_api=client_api)))
+
+
+if __name__ == '__main__':
+    main()
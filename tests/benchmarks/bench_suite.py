@@ -0,0 +1,150 @@
+"""
+End-to-end SDK throughput against the in-process fake gate (offline, CI friendly).
+Measures entities/sec for list, download, upload, annotation upload and updates.
+
+    python -m tests.benchmarks.bench_suite
+    python -m tests.benchmarks.bench_suite --items 5000 --latency 0.01 --error-rate 0.01 --json results.json
+"""
+import concurrent.futures
+import argparse
+import tempfile
+import shutil
+import json
+import time
+import os
+
+from dtlpy import entities, repositories
+try:
+    from .fake_gate import FakeGate
+    from .utils import make_client
+except ImportError:
+    from fake_gate import FakeGate
+    from utils import make_client
+
+SCENARIOS = ['list', 'download', 'upload', 'annotations_upload', 'items_update', 'annotations_update']
+
+
+class Suite:
+    def __init__(self, gate, client_api, num_items, annotations_per_item):
+        self.gate = gate
+        self.client_api = client_api
+        self.num_items = num_items
+        self.annotations_per_item = annotations_per_item
+        self.dataset = repositories.Datasets(client_api=client_api).get(dataset_id=gate.dataset_id)
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def close(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _items(self):
+        filters = entities.Filters(page_size=1000)
+        return list(self.dataset.items.list(filters=filters).all())
+
+    def list(self):
+        return len(self._items())
+
+    def download(self):
+        local_path = os.path.join(self.tmp_dir, 'download')
+        self.dataset.items.download(local_path=local_path, overwrite=True)
+        return sum(len(files) for _, _, files in os.walk(local_path))
+
+    def upload(self):
+        local_path = os.path.join(self.tmp_dir, 'upload')
+        os.makedirs(local_path, exist_ok=True)
+        for i_file in range(self.num_items):
+            with open(os.path.join(local_path, 'upload_{:07d}.jpg'.format(i_file)), 'wb') as f:
+                f.write(os.urandom(self.gate.binary_size))
+        self.dataset.items.upload(local_path=local_path, remote_path='/uploaded')
+        return self.num_items
+
+    def annotations_upload(self):
+        items = self._items()[:max(1, self.num_items // 10)]
+
+        def upload(item):
+            builder = item.annotations.builder()
+            for i_annotation in range(self.annotations_per_item):
+                builder.add(annotation_definition=entities.Box(top=10, left=10, bottom=100 + i_annotation, right=100,
+                                                               label='label_{}'.format(i_annotation % 5)))
+            return len(item.annotations.upload(annotations=builder))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.client_api.num_processes) as pool:
+            return sum(pool.map(upload, items))
+
+    def items_update(self):
+        items = self._items()
+
+        def update(item):
+            item.metadata['user'] = {'benchmark': True}
+            return self.dataset.items.update(item=item)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.client_api.num_processes) as pool:
+            return len(list(pool.map(update, items)))
+
+    def annotations_update(self):
+        annotations = list(self.dataset.annotations.list().all())
+        for annotation in annotations:
+            annotation.label = 'updated'
+        self.dataset.annotations.update(annotations=annotations)
+        return len(annotations)
+
+
+def run(num_items=1000, annotations_per_item=10, latency=0.0, error_rate=0.0, num_processes=None, scenarios=None):
+    """
+    :return: dict of scenario to {'entities', 'seconds', 'per_sec'}
+    """
+    if scenarios is None:
+        scenarios = SCENARIOS
+    results = dict()
+    with FakeGate(num_items=num_items,
+                  annotations_per_item=annotations_per_item,
+                  latency=latency,
+                  error_rate=error_rate,
+                  error_status=503) as gate:
+        kwargs = dict() if num_processes is None else {'num_processes': num_processes}
+        client_api = make_client(url=gate.url, **kwargs)
+        client_api.verbose.disable_progress_bar = True
+        suite = Suite(gate=gate, client_api=client_api, num_items=num_items,
+                      annotations_per_item=annotations_per_item)
+        try:
+            for scenario in scenarios:
+                tic = time.time()
+                count = getattr(suite, scenario)()
+                seconds = time.time() - tic
+                results[scenario] = {'entities': count,
+                                     'seconds': round(seconds, 3),
+                                     'per_sec': round(count / seconds, 1)}
+        finally:
+            suite.close()
+        results['_requests'] = {key: {'count': value['count'], 'p50': value['latency']['p50']}
+                                for key, value in client_api.metrics.to_dict().items()}
+        results['_injected_errors'] = gate.counters['errors']
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=1000)
+    parser.add_argument('--annotations', type=int, default=10, help='annotations per item')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds per response')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of 503 responses')
+    parser.add_argument('--num-processes', type=int, default=None)
+    parser.add_argument('--scenarios', nargs='+', default=SCENARIOS, choices=SCENARIOS)
+    parser.add_argument('--json', default=None, help='write the results to a json file')
+    args = parser.parse_args()
+    results = run(num_items=args.items,
+                  annotations_per_item=args.annotations,
+                  latency=args.latency,
+                  error_rate=args.error_rate,
+                  num_processes=args.num_processes,
+                  scenarios=args.scenarios)
+    for scenario in args.scenarios:
+        result = results[scenario]
+        print('{:<20} {:>8} entities {:>8.2f}[s] {:>10.1f}/s'.format(scenario, result['entities'],
+                                                                    result['seconds'], result['per_sec']))
+    if args.json is not None:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
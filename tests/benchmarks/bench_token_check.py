@@ -0,0 +1,60 @@
+"""
+Per-request token check cost, and single-flight renewal when many threads hit expiry at once
+
+    python -m tests.benchmarks.bench_token_check
+"""
+import threading
+import time
+try:
+    from .stub_server import StubServer
+    from .utils import make_client, fake_token
+except ImportError:
+    from stub_server import StubServer
+    from utils import make_client, fake_token
+
+NUM_CHECKS = 100000
+NUM_THREADS = 100
+
+
+def time_token_expired(client_api, n=NUM_CHECKS):
+    tic = time.perf_counter()
+    for _ in range(n):
+        client_api.token_expired()
+    return (time.perf_counter() - tic) / n * 1e6
+
+
+def count_renewals(client_api, n_threads=NUM_THREADS):
+    renewals = list()
+
+    def renew():
+        renewals.append(1)
+        time.sleep(0.2)
+        client_api.token = fake_token()
+        return True
+
+    client_api.renew_token_method = renew
+    client_api.token = fake_token(ttl=-10)
+    barrier = threading.Barrier(n_threads)
+
+    def worker():
+        barrier.wait()
+        client_api.gen_request(req_type='get', path='/datasets/stub')
+
+    threads = [threading.Thread(target=worker) for _ in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return len(renewals)
+
+
+def main():
+    with StubServer() as server:
+        client_api = make_client(url=server.url)
+        print('token_expired: {:.2f} usec/call'.format(time_token_expired(client_api=client_api)))
+        print('renew_token calls for {} expired threads: {}'.format(NUM_THREADS,
+                                                                  count_renewals(client_api=client_api)))
+
+
+if __name__ == '__main__':
+    main()
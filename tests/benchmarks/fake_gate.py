@@ -0,0 +1,323 @@
+"""
+In-process fake of the Dataloop gate for offline benchmarks.
+Keeps datasets, items, binaries and annotations in memory and serves the routes used by the SDK hot paths:
+dataset get/list, query (items and annotations, paginated), item get/update/delete/stream/upload,
+annotation upload/get/update/delete. Latency and error injection are configurable
+"""
+import email.parser
+import email.policy
+import functools
+import hashlib
+import threading
+import random
+import json
+import re
+try:
+    from .stub_server import StubServer
+    from . import payloads
+except ImportError:
+    from stub_server import StubServer
+    import payloads
+
+_ID = r'([0-9a-fA-F]{24})'
+
+
+class FakeGate:
+    def __init__(self,
+                 num_items=0,
+                 annotations_per_item=0,
+                 binary_size=10 * 1024,
+                 latency=0,
+                 error_rate=0,
+                 error_status=502,
+                 max_page_size=1000,
+                 seed=0,
+                 etags=False,
+                 port=0):
+        """
+        :param int num_items: items to create in the default dataset
+        :param int annotations_per_item: annotations to create for every item
+        :param int binary_size: bytes returned by item streams
+        :param float latency: seconds to wait before every response
+        :param float error_rate: fraction of requests answered with error_status
+        :param int error_status: injected error status (429 and 503 are sent with Retry-After: 0)
+        :param int max_page_size: max query page size
+        :param int seed: random seed for the error injection
+        :param bool etags: send ETags on GET responses and answer 304 to a matching If-None-Match
+        :param int port: local port, 0 for a free one
+        """
+        self.binary_size = binary_size
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.max_page_size = max_page_size
+        self.etags = etags
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._next_id = 0
+        self.datasets = dict()
+        self.items = dict()
+        self.annotations = dict()
+        self.counters = {'errors': 0, 'not_modified': 0}
+        self.dataset_id = self.add_dataset(name='fake-dataset', dataset_id=payloads.DATASET_ID)['id']
+        for _ in range(num_items):
+            item = self.add_item(dataset_id=self.dataset_id)
+            for _ in range(annotations_per_item):
+                self.add_annotation(item_id=item['id'])
+        self.routes = [
+            ('GET', re.compile(r'^/datasets/{}$'.format(_ID)), self.get_dataset),
+            ('GET', re.compile(r'^/datasets$'), self.list_datasets),
+            ('POST', re.compile(r'^/datasets/{}/query$'.format(_ID)), self.query),
+            ('POST', re.compile(r'^/datasets/{}/items$'.format(_ID)), self.upload_item),
+            ('GET', re.compile(r'^/items/{}/stream$'.format(_ID)), self.stream_item),
+            ('GET', re.compile(r'^/items/{}$'.format(_ID)), self.get_item),
+            ('PATCH', re.compile(r'^/items/{}$'.format(_ID)), self.update_item),
+            ('DELETE', re.compile(r'^/items/{}$'.format(_ID)), self.delete_item),
+            ('POST', re.compile(r'^/items/{}/annotations$'.format(_ID)), self.upload_annotations),
+            ('GET', re.compile(r'^/annotations/{}$'.format(_ID)), self.get_annotation),
+            ('PUT', re.compile(r'^/annotations/{}$'.format(_ID)), self.update_annotation),
+            ('DELETE', re.compile(r'^/annotations/{}$'.format(_ID)), self.delete_annotation),
+        ]
+        self.server = StubServer(routes=[(method, '/', functools.partial(self.dispatch, method))
+                                         for method in ['GET', 'POST', 'PUT', 'PATCH', 'DELETE']],
+                                 latency=latency,
+                                 port=port)
+
+    ##########
+    # server #
+    ##########
+    @property
+    def url(self):
+        return self.server.url
+
+    def start(self):
+        self.server.start()
+        return self
+
+    def stop(self):
+        self.server.stop()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def dispatch(self, method, path, headers, body):
+        if self.error_rate > 0 and self._random.random() < self.error_rate:
+            with self._lock:
+                self.counters['errors'] += 1
+            error_headers = dict()
+            if self.error_status in [429, 503]:
+                error_headers['Retry-After'] = '0'
+            return self.error_status, error_headers, {'message': 'injected error'}
+        route_path, _, query = path.partition('?')
+        for r_method, pattern, func in self.routes:
+            if r_method != method:
+                continue
+            match = pattern.match(route_path)
+            if match is not None:
+                # handlers are fast - serialize them instead of locking every collection
+                with self._lock:
+                    status, response_headers, payload = func(*match.groups(), query=query, headers=headers, body=body)
+                if self.etags and method == 'GET' and status == 200:
+                    return self._conditional(request_headers=headers,
+                                             status=status,
+                                             headers=response_headers,
+                                             payload=payload)
+                return status, response_headers, payload
+        return 404, dict(), {'message': 'not found: {} {}'.format(method, path)}
+
+    def _conditional(self, request_headers, status, headers, payload):
+        if isinstance(payload, bytes):
+            body = payload
+        else:
+            body = json.dumps(payload, sort_keys=True).encode('utf-8')
+        etag = '"{}"'.format(hashlib.md5(body).hexdigest())
+        headers = dict(headers)
+        headers['ETag'] = etag
+        if request_headers.get('If-None-Match', None) == etag:
+            with self._lock:
+                self.counters['not_modified'] += 1
+            return 304, headers, b''
+        return status, headers, payload
+
+    ############
+    # entities #
+    ############
+    def _new_id(self, prefix):
+        with self._lock:
+            self._next_id += 1
+            return '{}{:016x}'.format(prefix, self._next_id)
+
+    def add_dataset(self, name, dataset_id=None):
+        if dataset_id is None:
+            dataset_id = self._new_id(prefix='6030c2e2')
+        dataset = {'id': dataset_id,
+                   'name': name,
+                   'projects': [payloads.PROJECT_ID],
+                   'createdAt': '2023-01-01T00:00:00.000Z',
+                   'creator': 'user@dataloop.ai',
+                   'itemsCount': 0,
+                   'annotated': 0,
+                   'readonly': False,
+                   'metadata': {},
+                   'directoryTree': {},
+                   'url': 'https://gate.dataloop.ai/api/v1/datasets/{}'.format(dataset_id)}
+        self.datasets[dataset_id] = dataset
+        return dataset
+
+    def add_item(self, dataset_id, filename=None, size=None):
+        i_item = len(self.items)
+        item = payloads.item_json(i_item)
+        item['id'] = self._new_id(prefix='6130c2e2')
+        item['datasetId'] = dataset_id
+        if filename is not None:
+            item['filename'] = filename
+            item['name'] = filename.split('/')[-1]
+            item['dir'] = filename.rsplit('/', 1)[0] or '/'
+        item['metadata']['system']['size'] = self.binary_size if size is None else size
+        item['annotationsCount'] = 0
+        self.items[item['id']] = item
+        self.datasets[dataset_id]['itemsCount'] += 1
+        return item
+
+    def add_annotation(self, item_id, annotation=None):
+        item = self.items[item_id]
+        _json = payloads.annotation_json(len(self.annotations), item_id=item_id, num_points=20)
+        if annotation is not None:
+            _json.update(annotation)
+        _json['id'] = self._new_id(prefix='6230c2e2')
+        _json['itemId'] = item_id
+        _json['datasetId'] = item['datasetId']
+        self.annotations[_json['id']] = _json
+        item['annotationsCount'] += 1
+        return _json
+
+    ##########
+    # routes #
+    ##########
+    def get_dataset(self, dataset_id, **kwargs):
+        if dataset_id not in self.datasets:
+            return 404, dict(), {'message': 'dataset not found'}
+        return 200, dict(), self.datasets[dataset_id]
+
+    def list_datasets(self, **kwargs):
+        return 200, dict(), list(self.datasets.values())
+
+    @staticmethod
+    def _matches(entity, query):
+        # minimal mongo-like matching on the fields used by the benchmarks, other fields are ignored
+        for operator, conditions in query.items():
+            if operator == '$and':
+                if not all(FakeGate._matches(entity, condition) for condition in conditions):
+                    return False
+            elif operator == '$or':
+                if not any(FakeGate._matches(entity, condition) for condition in conditions):
+                    return False
+            elif operator in ['id', 'itemId', 'filename', 'dir', 'type', 'label']:
+                value = conditions
+                if isinstance(value, dict):
+                    if '$in' in value:
+                        if entity.get(operator) not in value['$in']:
+                            return False
+                    elif '$eq' in value and entity.get(operator) != value['$eq']:
+                        return False
+                    elif '$gt' in value and not entity.get(operator) > value['$gt']:
+                        return False
+                    elif '$lt' in value and not entity.get(operator) < value['$lt']:
+                        return False
+                elif isinstance(value, str) and '*' in value:
+                    if not re.match('^' + re.escape(value).replace('\\*', '.*') + '$', str(entity.get(operator))):
+                        return False
+                elif entity.get(operator) != value:
+                    return False
+        return True
+
+    def query(self, dataset_id, body, **kwargs):
+        request = json.loads(body)
+        page_offset = request.get('page', 0)
+        page_size = min(request.get('pageSize', 1000), self.max_page_size)
+        if request.get('resource', 'items') == 'annotations':
+            entities = self.annotations.values()
+        else:
+            entities = self.items.values()
+        entities = [entity for entity in entities
+                    if entity['datasetId'] == dataset_id and self._matches(entity, request.get('filter', dict()))]
+        for field, direction in reversed(list(request.get('sort', dict()).items())):
+            entities.sort(key=lambda entity: entity.get(field), reverse=direction == 'descending')
+        total = len(entities)
+        page_entities = entities[page_offset * page_size:(page_offset + 1) * page_size]
+        return 200, dict(), {'items': page_entities,
+                             'totalItemsCount': total,
+                             'totalPagesCount': -(-total // page_size),
+                             'hasNextPage': (page_offset + 1) * page_size < total}
+
+    def get_item(self, item_id, **kwargs):
+        if item_id not in self.items:
+            return 404, dict(), {'message': 'item not found'}
+        return 200, dict(), self.items[item_id]
+
+    def update_item(self, item_id, body, **kwargs):
+        if item_id not in self.items:
+            return 404, dict(), {'message': 'item not found'}
+        item = self.items[item_id]
+        for key, value in json.loads(body).items():
+            if key == 'metadata':
+                item['metadata'].update(value)
+            else:
+                item[key] = value
+        return 200, dict(), item
+
+    def delete_item(self, item_id, **kwargs):
+        item = self.items.pop(item_id, None)
+        if item is None:
+            return 404, dict(), {'message': 'item not found'}
+        return 200, dict(), b''
+
+    def stream_item(self, item_id, **kwargs):
+        if item_id not in self.items:
+            return 404, dict(), {'message': 'item not found'}
+        item = self.items[item_id]
+        size = item['metadata']['system'].get('size', self.binary_size)
+        return 200, {'content-type': 'application/octet-stream',
+                     'Content-Disposition': 'attachment; filename="{}"'.format(item['name'])}, bytes(size)
+
+    def upload_item(self, dataset_id, headers, body, **kwargs):
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+            b'Content-Type: ' + headers['content-type'].encode('utf-8') + b'\r\n\r\n' + body)
+        fields = dict()
+        for part in message.iter_parts():
+            fields[part.get_param('name', header='content-disposition')] = part.get_payload(decode=True)
+        filename = fields['path'].decode('utf-8')
+        if not filename.startswith('/'):
+            filename = '/' + filename
+        item = self.add_item(dataset_id=dataset_id, filename=filename, size=len(fields['file']))
+        if 'metadata' in fields:
+            item['metadata'].update(json.loads(fields['metadata']))
+        return 200, {'x-item-op': 'created'}, item
+
+    def upload_annotations(self, item_id, body, **kwargs):
+        if item_id not in self.items:
+            return 404, dict(), {'message': 'item not found'}
+        annotations = json.loads(body)
+        if not isinstance(annotations, list):
+            annotations = [annotations]
+        return 200, dict(), [self.add_annotation(item_id=item_id, annotation=annotation)
+                             for annotation in annotations]
+
+    def get_annotation(self, annotation_id, **kwargs):
+        if annotation_id not in self.annotations:
+            return 404, dict(), {'message': 'annotation not found'}
+        return 200, dict(), self.annotations[annotation_id]
+
+    def update_annotation(self, annotation_id, body, **kwargs):
+        if annotation_id not in self.annotations:
+            return 404, dict(), {'message': 'annotation not found'}
+        annotation = self.annotations[annotation_id]
+        annotation.update(json.loads(body))
+        return 200, dict(), annotation
+
+    def delete_annotation(self, annotation_id, **kwargs):
+        if self.annotations.pop(annotation_id, None) is None:
+            return 404, dict(), {'message': 'annotation not found'}
+        return 200, dict(), b''
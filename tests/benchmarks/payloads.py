@@ -0,0 +1,105 @@
+"""
+Synthetic gate payloads shaped like real item and annotation pages
+"""
+import random
+import string
+
+DATASET_ID = '6130c2e2d3b8f8c6a1e5a000'
+PROJECT_ID = '6130c2e2d3b8f8c6a1e5b000'
+
+
+def _id(i, prefix='6130c2e2'):
+    return '{}{:016x}'.format(prefix, i)
+
+
+def _word(n=8):
+    return ''.join(random.choice(string.ascii_lowercase) for _ in range(n))
+
+
+def item_json(i, with_metadata=True):
+    filename = '/dir_{}/image_{:07d}.jpg'.format(i % 50, i)
+    _json = {'id': _id(i),
+             'datasetId': DATASET_ID,
+             'createdAt': '2023-01-01T00:00:00.000Z',
+             'updatedAt': '2023-01-01T00:00:00.000Z',
+             'dir': '/dir_{}'.format(i % 50),
+             'filename': filename,
+             'type': 'file',
+             'hidden': False,
+             'name': filename.split('/')[-1],
+             'url': 'https://gate.dataloop.ai/api/v1/items/{}'.format(_id(i)),
+             'stream': 'https://gate.dataloop.ai/api/v1/items/{}/stream'.format(_id(i)),
+             'thumbnail': 'https://gate.dataloop.ai/api/v1/items/{}/thumbnail'.format(_id(i)),
+             'annotated': True,
+             'annotationsCount': 10,
+             'creator': 'user@dataloop.ai',
+             'dataset': 'https://gate.dataloop.ai/api/v1/datasets/{}'.format(DATASET_ID),
+             'metadata': {'system': {'originalname': filename.split('/')[-1],
+                                     'size': 100000 + i,
+                                     'encoding': '7bit',
+                                     'mimetype': 'image/jpeg',
+                                     'refs': [],
+                                     'width': 1920,
+                                     'height': 1080,
+                                     'channels': 3,
+                                     'isBinary': True}}}
+    if with_metadata:
+        _json['metadata']['user'] = {'tags': [_word() for _ in range(5)],
+                                     'scores': [random.random() for _ in range(20)],
+                                     'source': {'camera': _word(), 'gps': [random.random(), random.random()]}}
+    return _json
+
+
+def annotation_json(i, item_id=None, num_points=100):
+    if item_id is None:
+        item_id = _id(0)
+    return {'id': _id(i, prefix='6230c2e2'),
+            'itemId': item_id,
+            'datasetId': DATASET_ID,
+            'creator': 'user@dataloop.ai',
+            'createdAt': '2023-01-01T00:00:00.000Z',
+            'updatedAt': '2023-01-01T00:00:00.000Z',
+            'updatedBy': 'user@dataloop.ai',
+            'type': 'segment',
+            'label': 'label_{}'.format(i % 20),
+            'attributes': [],
+            'coordinates': [[{'x': random.random() * 1920, 'y': random.random() * 1080, 'z': 0}
+                             for _ in range(num_points)]],
+            'metadata': {'system': {'status': None,
+                                    'startTime': 0,
+                                    'endTime': 0,
+                                    'frame': 0,
+                                    'endFrame': 0,
+                                    'snapshots_': [],
+                                    'clientId': _word(12),
+                                    'automated': False,
+                                    'objectId': None,
+                                    'attributes': {},
+                                    'isOpen': False,
+                                    'system': False,
+                                    'itemLinks': [],
+                                    'openAnnotationVersion': '1.56.0-prod.31',
+                                    'recipeId': _id(1, prefix='6330c2e2')},
+                         'user': {}},
+            'url': 'https://gate.dataloop.ai/api/v1/annotations/{}'.format(_id(i, prefix='6230c2e2')),
+            'item': 'https://gate.dataloop.ai/api/v1/items/{}'.format(item_id),
+            'dataset': 'https://gate.dataloop.ai/api/v1/datasets/{}'.format(DATASET_ID),
+            'hash': _word(40),
+            'source': 'ui'}
+
+
+def page(entities, page_offset=0, total=None):
+    if total is None:
+        total = len(entities)
+    return {'items': entities,
+            'totalItemsCount': total,
+            'totalPagesCount': 1,
+            'hasNextPage': False}
+
+
+def items_page(size=1000, offset=0, with_metadata=True):
+    return page([item_json(offset + i, with_metadata=with_metadata) for i in range(size)])
+
+
+def annotations_page(size=1000, num_points=100):
+    return page([annotation_json(i, num_points=num_points) for i in range(size)])
@@ -0,0 +1,113 @@
+"""
+Local stub of the Dataloop gate for offline benchmarks.
+Runs a keep-alive HTTP/1.1 server in a background thread and counts connections and requests
+"""
+import http.server
+import socketserver
+import threading
+import json
+import time
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # headers and body are written separately - avoid delayed ACK stalls on keep-alive connections
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super(StubHandler, self).setup()
+        # every new connection is a new TCP (+TLS) handshake for the client
+        with self.server.counters_lock:
+            self.server.counters['connections'] += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _read_body(self):
+        if self.headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = list()
+            while True:
+                size = int(self.rfile.readline().split(b';')[0], 16)
+                if size == 0:
+                    # trailer end
+                    self.rfile.readline()
+                    break
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            return b''.join(chunks)
+        length = int(self.headers.get('content-length', 0))
+        return self.rfile.read(length) if length > 0 else b''
+
+    def _handle(self):
+        body = self._read_body()
+        with self.server.counters_lock:
+            self.server.counters['requests'] += 1
+        if self.server.latency > 0:
+            time.sleep(self.server.latency)
+        status, headers, payload = self.server.route(method=self.command,
+                                                     path=self.path,
+                                                     headers=self.headers,
+                                                     body=body)
+        if not isinstance(payload, bytes):
+            payload = json.dumps(payload).encode('utf-8')
+            headers.setdefault('content-type', 'application/json')
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('content-length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _handle
+    do_POST = _handle
+    do_PUT = _handle
+    do_PATCH = _handle
+    do_DELETE = _handle
+
+
+class StubServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, routes=None, latency=0, port=0):
+        """
+        :param routes: list of (method, path prefix, callable(path, headers, body) -> (status, headers, payload))
+        :param latency: seconds to wait before every response
+        :param port: local port, 0 for a free one
+        """
+        super(StubServer, self).__init__(('127.0.0.1', port), StubHandler)
+        if routes is None:
+            routes = list()
+        self.routes = routes
+        self.latency = latency
+        self.counters_lock = threading.Lock()
+        self.counters = {'connections': 0, 'requests': 0}
+        self._thread = None
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}'.format(self.server_address[1])
+
+    def route(self, method, path, headers, body):
+        for r_method, r_prefix, func in self.routes:
+            if r_method == method and path.startswith(r_prefix):
+                return func(path, headers, body)
+        return 200, dict(), {'id': 'stub'}
+
+    def reset_counters(self):
+        with self.counters_lock:
+            self.counters = {key: 0 for key in self.counters}
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,27 @@
+import tempfile
+import time
+import jwt
+import os
+from dtlpy.services.api_client import ApiClient
+
+
+def fake_token(ttl=3600):
+    return jwt.encode({'exp': int(time.time()) + ttl,
+                       'email': 'bench@dataloop.ai'},
+                      key='secret',
+                      algorithm='HS256')
+
+
+def make_client(url, **kwargs):
+    """
+    ApiClient logged in to a stub gate, with a temporary cookie file
+    """
+    cookie_filepath = os.path.join(tempfile.mkdtemp(), 'cookie.json')
+    client_api = ApiClient(cookie_filepath=cookie_filepath, **kwargs)
+    client_api.add_environment(environment=url,
+                               alias='bench',
+                               verify_ssl=False,
+                               gate_url=url)
+    client_api.environment = url
+    client_api.token = fake_token()
+    return client_api
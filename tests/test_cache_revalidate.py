@@ -0,0 +1,51 @@
+"""
+Opt-in cache revalidation through the sdk_cache setting, against the fake gate with ETags
+
+    python -m pytest tests/test_cache_revalidate.py
+"""
+import os
+
+import pytest
+
+from dtlpy import repositories
+from dtlpy.caches.cache import CacheConfig, CacheType
+from tests.benchmarks.fake_gate import FakeGate
+from tests.benchmarks.utils import make_client
+
+
+@pytest.fixture()
+def gate(tmp_path, monkeypatch):
+    monkeypatch.setenv('DATALOOP_PATH', str(tmp_path))
+    monkeypatch.setenv('DEFAULT_CACHE_PATH', os.path.join(str(tmp_path), 'bin'))
+    with FakeGate(num_items=2, etags=True) as fake_gate:
+        yield fake_gate
+
+
+def cached_client(gate):
+    client_api = make_client(url=gate.url)
+    client_api.build_cache(cache_config=CacheConfig(cache_type=CacheType.DISKCACHE, ttl=3600))
+    return client_api
+
+
+def test_revalidate_is_off_by_default(gate):
+    client_api = cached_client(gate)
+    assert client_api.sdk_cache.revalidate is False
+    assert client_api.cache.revalidate is False
+
+
+def test_revalidate_setting(gate):
+    client_api = make_client(url=gate.url)
+    client_api.sdk_cache.revalidate = True
+    client_api.build_cache(cache_config=CacheConfig(cache_type=CacheType.DISKCACHE, ttl=3600))
+    assert client_api.cache.revalidate is True
+    # persisted with the cache settings
+    assert client_api.cookie_io.get('cache_configs')['revalidate'] is True
+
+    item_id = list(gate.items.keys())[0]
+    items = repositories.Items(client_api=client_api)
+    items.get(item_id=item_id)
+    items.get(item_id=item_id)
+    assert gate.counters['not_modified'] == 1
+    # changed within the ttl - served from the gate
+    gate.items[item_id]['metadata']['user'] = {'changed': True}
+    assert items.get(item_id=item_id).metadata['user'] == {'changed': True}
@@ -0,0 +1,47 @@
+"""
+CallsCounter: processes flushing to the same counter file do not lose calls
+
+    python -m pytest tests/test_calls_counter.py
+"""
+import multiprocessing
+import atexit
+import os
+
+from dtlpy.services.calls_counter import CallsCounter
+
+NUM_PROCESSES = 4
+NUM_FLUSHES = 25
+CALLS_PER_FLUSH = 3
+
+
+def count_calls(filepath):
+    counter = CallsCounter(filepath=filepath, flush_interval=3600)
+    for _ in range(NUM_FLUSHES):
+        for _ in range(CALLS_PER_FLUSH):
+            counter.add(path='/items')
+        counter.flush()
+
+
+def test_concurrent_flushes_add_up(tmp_path):
+    filepath = os.path.join(str(tmp_path), 'calls_counter.json')
+    CallsCounter(filepath=filepath).on()
+    processes = [multiprocessing.Process(target=count_calls, args=(filepath,)) for _ in range(NUM_PROCESSES)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+    counter = CallsCounter(filepath=filepath)
+    assert counter.number == NUM_PROCESSES * NUM_FLUSHES * CALLS_PER_FLUSH
+
+
+def test_close_unregisters_the_exit_flush(tmp_path, monkeypatch):
+    unregistered = list()
+    monkeypatch.setattr(atexit, 'unregister', unregistered.append)
+    filepath = os.path.join(str(tmp_path), 'calls_counter.json')
+    counter = CallsCounter(filepath=filepath)
+    counter.on()
+    counter.add(path='/items')
+    counter.close()
+    assert unregistered == [counter.on_exit]
+    assert CallsCounter(filepath=filepath).number == 1
@@ -0,0 +1,63 @@
+"""
+Columnar export of listed entities (to_pandas / to_arrow / to_parquet) against the in-process fake gate.
+The arrow and parquet export run only when pyarrow is installed (pip install dtlpy[arrow])
+
+    python -m pytest tests/test_columnar.py
+"""
+import os
+
+import pytest
+
+from dtlpy import entities, repositories
+from tests.benchmarks.fake_gate import FakeGate
+from tests.benchmarks.utils import make_client
+
+NUM_ITEMS = 250
+ANNOTATIONS_PER_ITEM = 2
+PAGE_SIZE = 100
+
+
+@pytest.fixture(scope='module')
+def dataset():
+    with FakeGate(num_items=NUM_ITEMS, annotations_per_item=ANNOTATIONS_PER_ITEM) as gate:
+        client_api = make_client(url=gate.url)
+        client_api.verbose.disable_progress_bar = True
+        yield repositories.Datasets(client_api=client_api).get(dataset_id=gate.dataset_id)
+
+
+def paged(dataset, resource):
+    if resource == entities.FiltersResource.ANNOTATION:
+        return dataset.annotations.list(filters=entities.Filters(resource=resource, page_size=PAGE_SIZE))
+    return dataset.items.list(filters=entities.Filters(page_size=PAGE_SIZE))
+
+
+@pytest.mark.parametrize('resource', [entities.FiltersResource.ITEM, entities.FiltersResource.ANNOTATION])
+def test_to_arrow_matches_pandas(dataset, resource):
+    pyarrow = pytest.importorskip('pyarrow', minversion='7.0')
+    df = paged(dataset, resource).to_pandas()
+    table = paged(dataset, resource).to_arrow()
+    assert isinstance(table, pyarrow.Table)
+    assert table.num_rows == len(df)
+    assert table.schema.names == list(df.columns)
+    types = {field.name: str(field.type) for field in table.schema}
+    assert types['id'] == 'string'
+    if resource == entities.FiltersResource.ITEM:
+        assert types['metadata.system.size'] == 'int64'
+        assert types['annotated'] == 'bool'
+    assert table.column('id').to_pylist() == df['id'].tolist()
+
+
+def test_to_parquet_matches_pandas(dataset, tmp_path):
+    pytest.importorskip('pyarrow', minversion='7.0')
+    import pyarrow.parquet
+    df = paged(dataset, entities.FiltersResource.ITEM).to_pandas()
+    filepath = os.path.join(str(tmp_path), 'items.parquet')
+    num_rows = paged(dataset, entities.FiltersResource.ITEM).to_parquet(filepath=filepath)
+    assert num_rows == len(df) == NUM_ITEMS
+    table = pyarrow.parquet.read_table(filepath)
+    assert table.num_rows == len(df)
+    assert table.schema.names == list(df.columns)
+    assert table.schema == paged(dataset, entities.FiltersResource.ITEM).to_arrow().schema
+    assert table.column('id').to_pylist() == df['id'].tolist()
+    # one row group per page
+    assert pyarrow.parquet.ParquetFile(filepath).num_row_groups == -(-NUM_ITEMS // PAGE_SIZE)
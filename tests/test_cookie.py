@@ -0,0 +1,61 @@
+"""
+CookieIO writes: the atomic replace keeps the cookie mode, symlinked cookies are written in place
+
+    python -m pytest tests/test_cookie.py
+"""
+import json
+import stat
+import os
+
+from dtlpy.services.cookie import CookieIO
+
+
+def mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_put_keeps_mode(tmp_path):
+    path = os.path.join(str(tmp_path), 'cookie.json')
+    cookie = CookieIO(path=path)
+    os.chmod(path, 0o644)
+    cookie.put('key', 'value')
+    assert mode(path) == 0o644
+    assert cookie.get('key') == 'value'
+    os.chmod(path, 0o640)
+    cookie.put('key', 'other')
+    assert mode(path) == 0o640
+
+
+def test_new_cookie_uses_umask(tmp_path):
+    path = os.path.join(str(tmp_path), 'cookie.json')
+    CookieIO(path=path)
+    umask = os.umask(0)
+    os.umask(umask)
+    assert mode(path) == 0o666 & ~umask
+
+
+def test_symlink_written_in_place(tmp_path):
+    target = os.path.join(str(tmp_path), 'target.json')
+    link = os.path.join(str(tmp_path), 'cookie.json')
+    with open(target, 'w') as f:
+        json.dump({}, f)
+    os.symlink(target, link)
+    cookie = CookieIO(path=link)
+    cookie.put('key', 'value')
+    assert os.path.islink(link)
+    with open(target) as f:
+        assert json.load(f) == {'key': 'value'}
+
+
+def test_replace_failure_writes_in_place(tmp_path, monkeypatch):
+    path = os.path.join(str(tmp_path), 'cookie.json')
+    cookie = CookieIO(path=path)
+
+    def busy(*args, **kwargs):
+        raise OSError(16, 'Device or resource busy')
+
+    monkeypatch.setattr(os, 'replace', busy)
+    cookie.put('key', 'value')
+    with open(path) as f:
+        assert json.load(f) == {'key': 'value'}
+    assert [name for name in os.listdir(str(tmp_path)) if name.endswith('.tmp')] == []
@@ -0,0 +1,56 @@
+"""
+JSON request bodies with the fast codec: non finite floats are rejected, the caller headers are not changed,
+and responses decode with the codec
+
+    python -m pytest tests/test_json_codec.py
+"""
+import numpy as np
+import pytest
+import requests
+
+from dtlpy.miscellaneous.json_codec import JsonCodec
+from dtlpy.services.api_client import JsonResponse
+from tests.benchmarks.stub_server import StubServer
+from tests.benchmarks.utils import make_client
+
+
+@pytest.mark.parametrize('obj', [{'a': float('nan')},
+                                 [1, float('inf')],
+                                 {'a': {'b': [-float('inf')]}},
+                                 {'a': np.array([1.0, np.nan])}])
+def test_non_finite_rejected(obj):
+    with pytest.raises(ValueError):
+        JsonCodec.dumps_bytes(obj, allow_nan=False)
+
+
+def test_null_is_not_non_finite():
+    assert JsonCodec.loads(JsonCodec.dumps_bytes({'a': None, 'b': 1.5}, allow_nan=False)) == {'a': None, 'b': 1.5}
+
+
+@pytest.fixture(scope='module')
+def stub():
+    with StubServer() as server:
+        yield server, make_client(url=server.url)
+
+
+def test_request_body_with_nan(stub):
+    _, client_api = stub
+    with pytest.raises(requests.exceptions.InvalidJSONError):
+        client_api.gen_request(req_type='post', path='/items', json_req={'score': float('nan')})
+
+
+def test_caller_headers_not_changed(stub):
+    _, client_api = stub
+    _, _, headers = client_api._encode_json_body(data=None, json_req={'a': 1}, files=None, headers={'x-a': '1'})
+    assert headers['Content-Type'] == 'application/json'
+    caller_headers = {'x-a': '1'}
+    client_api._encode_json_body(data=None, json_req={'a': 1}, files=None, headers=caller_headers)
+    assert caller_headers == {'x-a': '1'}
+
+
+def test_response_decodes_with_the_codec(stub):
+    _, client_api = stub
+    success, response = client_api.gen_request(req_type='get', path='/datasets/stub')
+    assert success
+    assert type(response) is JsonResponse
+    assert response.json() == {'id': 'stub'}
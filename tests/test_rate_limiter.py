@@ -0,0 +1,59 @@
+"""
+RateLimiter: a pause that starts while callers wait for a token holds them until the pause ends
+
+    python -m pytest tests/test_rate_limiter.py
+"""
+import threading
+import asyncio
+import time
+
+from dtlpy.services.rate_limiter import RateLimiter
+
+RATE = 20
+PAUSE = 0.5
+NUM_CALLERS = 5
+
+
+def drain(limiter):
+    # empty bucket - every caller waits for a token
+    while limiter.reserve() == 0:
+        pass
+
+
+def test_wait_honors_a_pause_started_while_waiting():
+    limiter = RateLimiter(rate=RATE)
+    drain(limiter)
+    sent = list()
+
+    def caller():
+        limiter.wait()
+        sent.append(time.monotonic())
+
+    threads = [threading.Thread(target=caller) for _ in range(NUM_CALLERS)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.01)
+    limiter.pause(PAUSE)
+    pause_until = limiter._pause_until
+    for thread in threads:
+        thread.join()
+    assert len(sent) == NUM_CALLERS
+    assert min(sent) >= pause_until
+
+
+def test_async_wait_honors_a_pause_started_while_waiting():
+    limiter = RateLimiter(rate=RATE)
+    drain(limiter)
+
+    async def caller():
+        await limiter.async_wait()
+        return time.monotonic()
+
+    async def run():
+        tasks = [asyncio.ensure_future(caller()) for _ in range(NUM_CALLERS)]
+        await asyncio.sleep(0.01)
+        limiter.pause(PAUSE)
+        return limiter._pause_until, await asyncio.gather(*tasks)
+
+    pause_until, sent = asyncio.run(run())
+    assert min(sent) >= pause_until
@@ -0,0 +1,43 @@
+"""
+Resumable (keyset) pages against the in-process fake gate: the checkpoint follows the raw page,
+also when some entities of a page fail to build
+
+    python -m pytest tests/test_resumable_pages.py
+"""
+import pytest
+
+from dtlpy import entities, repositories
+from tests.benchmarks.fake_gate import FakeGate
+from tests.benchmarks.utils import make_client
+
+NUM_ITEMS = 250
+PAGE_SIZE = 100
+
+
+@pytest.fixture(scope='module')
+def dataset():
+    with FakeGate(num_items=NUM_ITEMS) as gate:
+        client_api = make_client(url=gate.url)
+        client_api.verbose.disable_progress_bar = True
+        yield repositories.Datasets(client_api=client_api).get(dataset_id=gate.dataset_id)
+
+
+def test_checkpoint_counts_the_raw_page(dataset, monkeypatch):
+    pages = dataset.items.list(filters=entities.Filters(page_size=PAGE_SIZE))
+    build = pages._page_items
+
+    def build_all_but_first(result):
+        # the first entity of every page fails to build
+        return build(result=dict(result, items=result['items'][1:]))
+
+    monkeypatch.setattr(pages, '_page_items', build_all_but_first)
+    checkpoints = [checkpoint for _, checkpoint in pages.resumable_pages()]
+    assert [checkpoint['count'] for checkpoint in checkpoints] == [100, 200, 250]
+
+
+def test_unbuilt_page_does_not_stop(dataset, monkeypatch):
+    pages = dataset.items.list(filters=entities.Filters(page_size=PAGE_SIZE))
+    # a page where no entity builds is not the end of the listing
+    monkeypatch.setattr(pages, '_page_items', lambda result: list())
+    checkpoints = [checkpoint for _, checkpoint in pages.resumable_pages()]
+    assert checkpoints[-1]['count'] == NUM_ITEMS
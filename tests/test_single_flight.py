@@ -0,0 +1,78 @@
+"""
+SingleFlight: followers get the leader error, async mutations drop memoized GETs
+
+    python -m pytest tests/test_single_flight.py
+"""
+import threading
+import asyncio
+
+import pytest
+
+from dtlpy.services.single_flight import SingleFlight
+from tests.benchmarks.stub_server import StubServer
+from tests.benchmarks.utils import make_client
+
+
+class Interrupted(BaseException):
+    pass
+
+
+def test_followers_get_a_base_exception():
+    single_flight = SingleFlight(enabled=True)
+    in_flight = threading.Event()
+    release = threading.Event()
+    errors = list()
+
+    def leader_func():
+        in_flight.set()
+        release.wait()
+        raise Interrupted()
+
+    def leader():
+        try:
+            single_flight.do(key=('/datasets/stub',), func=leader_func)
+        except Interrupted as e:
+            errors.append(e)
+
+    def follower():
+        try:
+            errors.append(single_flight.do(key=('/datasets/stub',), func=lambda: (True, 'not the leader')))
+        except Interrupted as e:
+            errors.append(e)
+
+    leader_thread = threading.Thread(target=leader, daemon=True)
+    leader_thread.start()
+    in_flight.wait()
+    follower_thread = threading.Thread(target=follower, daemon=True)
+    follower_thread.start()
+    while single_flight.num_shared == 0:
+        pass
+    release.set()
+    leader_thread.join(timeout=5)
+    # a follower that is never released hangs here
+    follower_thread.join(timeout=5)
+    assert not follower_thread.is_alive()
+    assert len(errors) == 2
+    assert all(isinstance(error, Interrupted) for error in errors)
+
+
+@pytest.fixture()
+def stub():
+    with StubServer() as server:
+        client_api = make_client(url=server.url)
+        client_api.single_flight.enable(ttl=60)
+        yield server, client_api
+
+
+def test_async_mutation_invalidates_memo(stub):
+    server, client_api = stub
+    for _ in range(2):
+        assert client_api.gen_request(req_type='get', path='/datasets/stub')[0]
+    assert server.counters['requests'] == 1
+    future = asyncio.run_coroutine_threadsafe(client_api.gen_async_request(req_type='patch',
+                                                                           path='/datasets/stub',
+                                                                           json_req={'name': 'new'}),
+                                              loop=client_api.event_loop.loop)
+    assert future.result()[0]
+    assert client_api.gen_request(req_type='get', path='/datasets/stub')[0]
+    assert server.counters['requests'] == 3